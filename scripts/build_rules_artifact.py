@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Build step that validates the rules and templates and writes the precompiled
+rules artifact.
+
+Validates config/rules.yaml against src/config/rules.schema.json and the
+engine's rule parser, checks the SMS/Telegram/Slack template YAMLs, and writes
+config/rules.compiled.json. The Lambda loads the artifact instead of parsing
+rules.yaml while the rules file's hash still matches.
+
+Usage:
+    python scripts/build_rules_artifact.py
+    python scripts/build_rules_artifact.py --root /var/task
+
+Exit code is 1 if any file fails validation (the build should stop).
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build the precompiled rules artifact")
+    parser.add_argument(
+        "--root", type=Path, default=PROJECT_ROOT, help="Project root containing src/ and config/"
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(args.root))
+    from src.rules.artifact import ARTIFACT_NAME, build_rules_artifact, write_rules_artifact
+
+    config_root = args.root / "config"
+    schema_path = args.root / "src" / "config" / "rules.schema.json"
+    output = args.output or config_root / ARTIFACT_NAME
+
+    try:
+        artifact = build_rules_artifact(config_root, schema_path)
+    except FileNotFoundError as e:
+        logger.error(f"File not found: {e}")
+        return 1
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        return 1
+
+    write_rules_artifact(artifact, output)
+    logger.info(
+        f"Wrote {output}: {len(artifact['rules'].get('rules', []))} rules, "
+        f"rules.yaml sha256 {artifact['rules_hash'][:12]}, "
+        f"templates checked: {', '.join(artifact['templates']) or 'none'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
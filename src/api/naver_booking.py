@@ -8,7 +8,7 @@ Reference: docs/brownfield-architecture.md - Naver Booking API Details
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import Callable, List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 import time
 
 import requests
@@ -48,6 +48,49 @@ class NaverAuthenticationError(RuntimeError):
         self.response_snippet = response_snippet
 
 
+class FetchCheckpoint:
+    """
+    Completed fetch units kept across a mid-run re-authentication.
+
+    A unit is one bookings page of one (store, status, date range) query.
+    Clients sharing a checkpoint skip units that already succeeded, so the
+    retry after NaverAuthenticationError only downloads what is left. Counts
+    and the RC08 unnotified-options scan are kept too, so resumed queries
+    paginate exactly like the first attempt.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[Tuple[Any, ...], int] = {}
+        self._pages: Dict[Tuple[Any, ...], List[Booking]] = {}
+        self.unnotified_options: Optional[Dict[str, Dict[str, Any]]] = None
+        self.resumed_units = 0
+
+    @staticmethod
+    def query_key(
+        store_id: str, status: str, start_date: Optional[str], end_date: Optional[str]
+    ) -> Tuple[Any, ...]:
+        return (store_id, status, start_date, end_date)
+
+    def get_count(self, query: Tuple[Any, ...]) -> Optional[int]:
+        return self._counts.get(query)
+
+    def record_count(self, query: Tuple[Any, ...], count: int) -> None:
+        self._counts[query] = count
+
+    def get_page(self, query: Tuple[Any, ...], page_idx: int) -> Optional[List[Booking]]:
+        bookings = self._pages.get((*query, page_idx))
+        if bookings is not None:
+            self.resumed_units += 1
+        return bookings
+
+    def record_page(self, query: Tuple[Any, ...], page_idx: int, bookings: List[Booking]) -> None:
+        self._pages[(*query, page_idx)] = list(bookings)
+
+    @property
+    def completed_units(self) -> int:
+        return len(self._pages)
+
+
 class NaverBookingAPIClient:
     """
     Client for fetching booking data from Naver Partner Booking API.
@@ -68,6 +111,8 @@ class NaverBookingAPIClient:
         session: requests.Session,
         option_keywords: Optional[List[str]] = None,
         booking_repo: Optional["BookingRepository"] = None,
+        checkpoint: Optional[FetchCheckpoint] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
     ):
         """
         Initialize Naver Booking API client.
@@ -76,10 +121,26 @@ class NaverBookingAPIClient:
             session: Authenticated requests.Session with Naver cookies
             option_keywords: List of keywords for option detection (default: ['네이버', '인스타', '원본'])
             booking_repo: Optional BookingRepository for fetching unnotified options (RC08 filtering)
+            checkpoint: Optional FetchCheckpoint shared with the client used after re-authentication
+            should_stop: Optional check run before each store's fetch; returning True
+                ends the fetch early (e.g. the run's shard lease was lost)
         """
         self.session = session
         self.option_keywords = option_keywords or ["네이버", "인스타", "원본"]
         self.booking_repo = booking_repo
+        self.checkpoint = checkpoint
+        self.should_stop = should_stop
+
+    def _stop_requested(self, store_id: str) -> bool:
+        """True (and logged) when should_stop asks to end the fetch before store_id."""
+        if self.should_stop is None or not self.should_stop():
+            return False
+        logger.warning(
+            f"Stopping booking fetch before store {store_id}",
+            operation="booking_fetch_stopped",
+            context={"store_id": store_id},
+        )
+        return True
 
     def _get_default_date_range(self) -> tuple[str, str]:
         """
@@ -259,6 +320,81 @@ class NaverBookingAPIClient:
 
         return f"{normalized}+09:00"
 
+    def _count_headers(self, store_id: str) -> Dict[str, str]:
+        """Browser-like headers expected by the bookings count endpoint."""
+        return {
+            "authority": "partner.booking.naver.com",
+            "accept": "*/*",
+            "accept-language": "en-US,en;q=0.9",
+            "referer": f"https://partner.booking.naver.com/bizes/{store_id}/booking-list-view",
+            "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+            "sec-ch-ua-mobile": "?0",
+            "sec-ch-ua-platform": '"Windows"',
+            "sec-fetch-dest": "empty",
+            "sec-fetch-mode": "cors",
+            "sec-fetch-site": "same-origin",
+            "user-agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            ),
+            "x-booking-naver-role": "OWNER",
+        }
+
+    def probe_session(self, store_id: str, timeout: float = 5) -> Optional[bool]:
+        """
+        Check whether the session cookies are accepted, without a browser.
+
+        Issues a single bookings count request (one page of size 1) for
+        store_id.
+
+        Args:
+            store_id: Business ID to probe
+            timeout: Request timeout in seconds
+
+        Returns:
+            True if Naver accepted the cookies, False on 401/403 or a redirect
+            to the login page, None if the probe was inconclusive (network
+            error or unexpected status)
+        """
+        params = self._build_query_params(
+            status=self.STATUS_CONFIRMED, start_date=None, end_date=None, page=0, size=1
+        )
+        params["noCache"] = round(datetime.now().timestamp() * 1000)
+        url = f"{self.BASE_URL}/v3.1/businesses/{store_id}/bookings/count"
+
+        try:
+            response = self.session.get(
+                url,
+                headers=self._count_headers(store_id),
+                params=params,
+                timeout=timeout,
+                allow_redirects=False,
+            )
+        except requests.RequestException as e:
+            logger.warning(
+                "Session probe failed; result inconclusive",
+                operation="probe_session",
+                context={"store_id": store_id},
+                error=str(e),
+            )
+            return None
+
+        status_code = response.status_code
+        location = response.headers.get("Location", "") if response.is_redirect else ""
+        if status_code in (401, 403) or "login" in location:
+            accepted: Optional[bool] = False
+        elif status_code == 200:
+            accepted = True
+        else:
+            accepted = None
+
+        logger.info(
+            "Session probe completed",
+            operation="probe_session",
+            context={"store_id": store_id, "status": status_code, "accepted": accepted},
+        )
+        return accepted
+
     def _count_bookings(
         self,
         store_id: str,
@@ -280,23 +416,7 @@ class NaverBookingAPIClient:
         Returns:
             Total count of bookings, or 0 if error
         """
-        headers = {
-            "authority": "partner.booking.naver.com",
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "referer": f"https://partner.booking.naver.com/bizes/{store_id}/booking-list-view",
-            "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": '"Windows"',
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "user-agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "x-booking-naver-role": "OWNER",
-        }
+        headers = self._count_headers(store_id)
 
         # Build base params for counting (legacy count_items)
         params = self._build_query_params(
@@ -491,8 +611,15 @@ class NaverBookingAPIClient:
         """
         logger.info(f"Fetching all bookings for store {store_id} with status {status}")
 
+        checkpoint = self.checkpoint
+        query = FetchCheckpoint.query_key(store_id, status, start_date, end_date)
+
         # Count total bookings first (lambda_function.py:349)
-        total_count = self._count_bookings(store_id, status, start_date, end_date)
+        total_count = checkpoint.get_count(query) if checkpoint else None
+        if total_count is None:
+            total_count = self._count_bookings(store_id, status, start_date, end_date)
+            if checkpoint:
+                checkpoint.record_count(query, total_count)
 
         if total_count == 0:
             logger.info(f"No bookings found for store {store_id}")
@@ -514,10 +641,21 @@ class NaverBookingAPIClient:
         url = f"{self.BASE_URL}/api/businesses/{store_id}/bookings"
         page_size = self.PAGE_SIZE
         all_bookings = []
+        seen_booking_nums = set()
 
         # Paginate through results (lambda_function.py:352-387)
         num_pages = (total_count + page_size - 1) // page_size
         for page_idx in range(num_pages):
+            cached_page = checkpoint.get_page(query, page_idx) if checkpoint else None
+            if cached_page is not None:
+                # Fetched before re-authentication; pages can shift between
+                # attempts, so merge by booking_num
+                for booking in cached_page:
+                    if booking.booking_num not in seen_booking_nums:
+                        seen_booking_nums.add(booking.booking_num)
+                        all_bookings.append(booking)
+                continue
+
             try:
                 # Build params with noCache for each request (lambda_function.py:354)
                 params = self._build_query_params(
@@ -540,15 +678,26 @@ class NaverBookingAPIClient:
                 logger.debug(f"Retrieved {len(bookings_data)} bookings on page {page_idx}")
 
                 # Transform to Booking domain objects (lambda_function.py:358-383)
+                page_bookings = []
                 for booking_data in bookings_data:
                     try:
                         booking = self._transform_booking(booking_data, store_id)
-                        all_bookings.append(booking)
+                        page_bookings.append(booking)
                     except Exception as e:
                         logger.warning(
                             f"Failed to transform booking {booking_data.get('bookingId')}: {e}"
                         )
 
+                if checkpoint:
+                    checkpoint.record_page(query, page_idx, page_bookings)
+                    page_bookings = [
+                        booking
+                        for booking in page_bookings
+                        if booking.booking_num not in seen_booking_nums
+                    ]
+                    seen_booking_nums.update(booking.booking_num for booking in page_bookings)
+                all_bookings.extend(page_bookings)
+
                 # Sleep 1 second between pages (lambda_function.py:384)
                 if page_idx < num_pages - 1:
                     time.sleep(1)
@@ -613,6 +762,8 @@ class NaverBookingAPIClient:
         logger.info(f"Fetching confirmed bookings with date range: {start_date} to {end_date}")
 
         for store_id in store_ids:
+            if self._stop_requested(store_id):
+                break
             try:
                 bookings = self.get_bookings(
                     store_id,
@@ -638,7 +789,7 @@ class NaverBookingAPIClient:
         Implements legacy behavior from lambda_function.py:102, 391:
         1. Scans DynamoDB for bookings with option_sms=False (via scan_unnotified_options)
         2. Extracts date ranges from first and last booking times per store
-        3. Fetches RC08 bookings within those date ranges
+        3. Fetches RC08 bookings within those date ranges, for stores in `store_ids` only
 
         This ensures RC08 data matches original Lambda behavior exactly.
 
@@ -653,7 +804,20 @@ class NaverBookingAPIClient:
         # AC-6: Fetch unnotified options with date ranges (lambda_function.py:102)
         if self.booking_repo:
             try:
-                unnotified_options = self.booking_repo.scan_unnotified_options()
+                checkpoint = self.checkpoint
+                if checkpoint is not None and checkpoint.unnotified_options is not None:
+                    unnotified_options = checkpoint.unnotified_options
+                else:
+                    unnotified_options = self.booking_repo.scan_unnotified_options()
+                    if checkpoint is not None:
+                        checkpoint.unnotified_options = unnotified_options
+                # The scan covers the whole table; a run shard only handles its own stores
+                requested = {str(store_id) for store_id in store_ids}
+                unnotified_options = {
+                    store_id: date_range
+                    for store_id, date_range in unnotified_options.items()
+                    if str(store_id) in requested
+                }
                 logger.info(
                     f"Found unnotified options for {len(unnotified_options)} stores",
                     context={"stores_with_unnotified_options": len(unnotified_options)},
@@ -661,6 +825,8 @@ class NaverBookingAPIClient:
 
                 # Fetch RC08 bookings within each store's date range (lambda_function.py:391)
                 for store_id, date_range in unnotified_options.items():
+                    if self._stop_requested(store_id):
+                        break
                     try:
                         start_date = date_range.get("start_time")
                         end_date = date_range.get("end_time")
@@ -701,6 +867,8 @@ class NaverBookingAPIClient:
                 start_date, end_date = self._get_default_date_range()
                 logger.info(f"Using fallback date range for RC08: {start_date} to {end_date}")
                 for store_id in store_ids:
+                    if self._stop_requested(store_id):
+                        break
                     try:
                         bookings = self.get_bookings(
                             store_id,
@@ -723,6 +891,8 @@ class NaverBookingAPIClient:
                 f"{start_date} to {end_date}"
             )
             for store_id in store_ids:
+                if self._stop_requested(store_id):
+                    break
                 try:
                     bookings = self.get_bookings(
                         store_id,
@@ -2,5 +2,14 @@
 
 from .naver_login import NaverAuthenticator
 from .session_manager import SessionManager
+from .cookie_store import CookieStore
+from .partner_warmup import PartnerWarmupPlanner
+from .auth_profiler import AuthProfiler
 
-__all__ = ["NaverAuthenticator", "SessionManager"]
+__all__ = [
+    "NaverAuthenticator",
+    "SessionManager",
+    "CookieStore",
+    "PartnerWarmupPlanner",
+    "AuthProfiler",
+]
@@ -0,0 +1,104 @@
+"""
+Auth Profiler - One structured timing record per authentication phase
+
+The authentication block in lambda_handler (cookie load, Chrome launch,
+cookie injection, validation navigation, partner warmup, get_session) used to
+be a black box. AuthProfiler times the handler-level steps, merges in the
+sub-steps NaverAuthenticator measured itself, samples the browser's resident
+memory and logs everything as a single `auth_profile` record, so auth
+regressions show up as one comparable line per run.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from ..utils.logger import get_logger
+from ..utils.timing import PhaseTimer
+from .browser_keeper import browser_rss_mb
+
+logger = get_logger(__name__)
+
+# startup_summary() keys copied verbatim into the record
+SUMMARY_FIELDS = ("auth_path", "cookie_check", "browser_started", "browser_reused", "avoided_ms")
+
+
+class AuthProfiler:
+    """
+    Collect per-step auth timings, browser RSS and the path taken.
+
+    Usage:
+        profiler = AuthProfiler()
+        with profiler.step("cookie_load"):
+            cookies = session_mgr.get_cookies()
+        ...
+        profiler.sample_browser(authenticator.driver)
+        profiler.emit(authenticator.startup_summary())
+    """
+
+    def __init__(self, rss_probe: Callable[[Any], Optional[float]] = browser_rss_mb):
+        self.timer = PhaseTimer()
+        self.rss_probe = rss_probe
+        self.browser_rss_mb: Optional[float] = None
+        self.reauthenticated = False
+        self.refresh_reason: Optional[str] = None
+        self.emitted = False
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Time a handler-level auth step."""
+        with self.timer.phase(name):
+            yield
+
+    def sample_browser(self, driver: Any) -> Optional[float]:
+        """Record the browser's RSS (keeps the peak across samples)."""
+        if driver is None:
+            return None
+        rss = self.rss_probe(driver)
+        if rss is not None and (self.browser_rss_mb is None or rss > self.browser_rss_mb):
+            self.browser_rss_mb = rss
+        return rss
+
+    def as_record(self, startup_summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build the structured record.
+
+        Args:
+            startup_summary: NaverAuthenticator.startup_summary() output; its
+                `<phase>_ms` entries become browser sub-steps
+
+        Returns:
+            Dict with path, auth_ms, steps, browser_rss_mb and reauth flags
+        """
+        summary = dict(startup_summary or {})
+        steps: Dict[str, float] = dict(self.timer.as_context())
+        for key, value in summary.items():
+            if key.endswith("_ms") and key != "avoided_ms" and isinstance(value, (int, float)):
+                steps.setdefault(key, value)
+
+        record: Dict[str, Any] = {key: summary.get(key) for key in SUMMARY_FIELDS}
+        record.update(
+            {
+                # Handler-level steps only; browser sub-steps overlap with "login"
+                "auth_ms": round(self.timer.total_ms(), 2),
+                "steps": steps,
+                "browser_rss_mb": (
+                    round(self.browser_rss_mb, 1) if self.browser_rss_mb is not None else None
+                ),
+                "reauthenticated": self.reauthenticated,
+                "refresh_reason": self.refresh_reason,
+            }
+        )
+        return record
+
+    def emit(self, startup_summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Log the record once per run and return it."""
+        record = self.as_record(startup_summary)
+        if not self.emitted:
+            self.emitted = True
+            logger.info(
+                "Auth profile",
+                operation="auth_profile",
+                context=record,
+                duration_ms=record["auth_ms"],
+            )
+        return record
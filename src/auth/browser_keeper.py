@@ -0,0 +1,168 @@
+"""
+Browser Keeper - Reuse a healthy Chrome instance across warm invocations
+
+NaverAuthenticator normally quits Chrome at the end of every run, so each
+warm invocation that needs a browser pays the full launch cost again. When
+NAVER_BROWSER_KEEPALIVE=true, the driver is parked at module scope instead
+and handed to the next invocation after a liveness check.
+
+The driver is recycled (quit) when:
+- it fails the liveness check (e.g. DevTools disconnected)
+- it has served NAVER_BROWSER_MAX_USES runs
+- Chrome's resident memory exceeds NAVER_BROWSER_MAX_RSS_MB
+"""
+
+import os
+from typing import Any, Callable, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def browser_rss_mb(driver: Any) -> Optional[float]:
+    """
+    Resident memory of the ChromeDriver process tree in MB.
+
+    Returns:
+        RSS in MB, or None if the process cannot be inspected
+    """
+    try:
+        import psutil
+
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total / 1024 / 1024
+    except Exception:
+        return None
+
+
+class BrowserKeeper:
+    """
+    Holds one Chrome driver between invocations.
+
+    Usage:
+        keeper = get_browser_keeper()
+        driver = keeper.acquire()      # healthy parked driver or None
+        ...                            # launch a new one if None
+        keeper.release(driver)         # park it (or recycle) at end of run
+    """
+
+    def __init__(
+        self,
+        max_uses: int = 20,
+        max_rss_mb: float = 350.0,
+        rss_probe: Callable[[Any], Optional[float]] = browser_rss_mb,
+    ):
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self.rss_probe = rss_probe
+        self.driver: Optional[Any] = None
+        self.uses = 0
+
+    def acquire(self) -> Optional[Any]:
+        """
+        Return the parked driver if it is alive, otherwise recycle it.
+
+        Returns:
+            Reusable driver, or None if the caller must launch Chrome
+        """
+        if self.driver is None:
+            return None
+
+        if not self.is_alive(self.driver):
+            logger.warning("Parked browser failed liveness check; recycling", operation="browser_keeper")
+            self.discard()
+            return None
+
+        self.uses += 1
+        logger.info(
+            "Reusing parked browser",
+            operation="browser_keeper",
+            context={"uses": self.uses, "max_uses": self.max_uses},
+        )
+        return self.driver
+
+    def adopt(self, driver: Any) -> None:
+        """Track a freshly launched driver."""
+        if self.driver is not None and self.driver is not driver:
+            self.discard()
+        self.driver = driver
+        self.uses = 1
+
+    def release(self, driver: Any) -> bool:
+        """
+        Park driver for the next invocation unless it should be recycled.
+
+        Returns:
+            True if parked, False if the driver was quit
+        """
+        if driver is None:
+            return False
+        if self.driver is not driver:
+            self.adopt(driver)
+
+        reason = self._recycle_reason(driver)
+        if reason:
+            logger.info(
+                "Recycling browser",
+                operation="browser_keeper",
+                context={"reason": reason, "uses": self.uses},
+            )
+            self.discard()
+            return False
+
+        logger.info("Browser parked for next invocation", operation="browser_keeper")
+        return True
+
+    def discard(self) -> None:
+        """Quit the tracked driver (if any)."""
+        driver, self.driver = self.driver, None
+        self.uses = 0
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def is_alive(driver: Any) -> bool:
+        """Cheap round-trip to the renderer; False on DevTools/renderer failures."""
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _recycle_reason(self, driver: Any) -> Optional[str]:
+        if self.uses >= self.max_uses:
+            return "max_uses"
+        rss = self.rss_probe(driver)
+        if rss is not None and rss > self.max_rss_mb:
+            return "memory_pressure"
+        if not self.is_alive(driver):
+            return "not_alive"
+        return None
+
+
+# Module scope so the driver survives warm invocations of the same container
+_KEEPER: Optional[BrowserKeeper] = None
+
+
+def get_browser_keeper() -> Optional[BrowserKeeper]:
+    """Shared BrowserKeeper when NAVER_BROWSER_KEEPALIVE=true, else None."""
+    global _KEEPER
+    if os.getenv("NAVER_BROWSER_KEEPALIVE", "false").lower() != "true":
+        return None
+    if _KEEPER is None:
+        _KEEPER = BrowserKeeper(
+            max_uses=int(os.getenv("NAVER_BROWSER_MAX_USES", "20")),
+            max_rss_mb=float(os.getenv("NAVER_BROWSER_MAX_RSS_MB", "350")),
+        )
+    return _KEEPER
@@ -0,0 +1,250 @@
+"""
+Chrome Profile Snapshot - Pre-initialized Chrome profile for faster launches
+
+Chrome spends a measurable part of its startup creating a fresh profile in
+/tmp/user-data and /tmp/data-path. When NAVER_CHROME_PROFILE_SNAPSHOT points
+to a tarball (baked into the image at build time, or written to /tmp after
+the first successful run), the profile is extracted from it on cold start
+and kept across warm invocations instead of being wiped before every launch.
+
+Corruption handling:
+- The tarball is verified against its `<snapshot>.sha256` sidecar before use
+- The extracted/kept profile must contain a parseable `Local State` file
+- Any failure falls back to the legacy clean profile
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_ROOT = Path("/tmp")
+# Directories captured in the snapshot (disk cache is never snapshotted)
+SNAPSHOT_DIRS = ("user-data", "data-path")
+# Files Chrome leaves behind that must not survive into the next launch
+LOCK_FILE_PREFIXES = ("Singleton", "lockfile")
+# Session state that must never be captured (cookies are injected per run)
+EXCLUDED_FILE_PREFIXES = LOCK_FILE_PREFIXES + ("Cookies", "Login Data", "Web Data")
+LOCAL_STATE = "user-data/Local State"
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ChromeProfileSnapshot:
+    """
+    Restore and capture the Chrome profile used by NaverAuthenticator.
+
+    Usage:
+        snapshot = ChromeProfileSnapshot(Path(os.environ["NAVER_CHROME_PROFILE_SNAPSHOT"]))
+        if not snapshot.prepare():
+            ...  # fall back to a clean profile
+        ...
+        snapshot.save_if_missing()  # after a successful run, browser closed
+    """
+
+    def __init__(self, snapshot_path: Path, profile_root: Path = PROFILE_ROOT):
+        self.snapshot_path = Path(snapshot_path)
+        self.checksum_path = self.snapshot_path.with_name(self.snapshot_path.name + ".sha256")
+        self.profile_root = Path(profile_root)
+
+    # ------------------------------------------------------------------
+    # Restore
+    # ------------------------------------------------------------------
+    def prepare(self) -> bool:
+        """
+        Make a usable profile available before Chrome launches.
+
+        Keeps the profile from a previous warm invocation when it is intact,
+        otherwise extracts the snapshot.
+
+        Returns:
+            True if a snapshot-based profile is ready, False if the caller
+            should fall back to a clean profile
+        """
+        if self.profile_is_valid():
+            self._remove_volatile_files()
+            logger.info("Reusing Chrome profile from previous invocation", operation="chrome_profile")
+            return True
+
+        if not self.snapshot_path.is_file():
+            return False
+
+        if not self._snapshot_checksum_ok():
+            logger.warning(
+                "Chrome profile snapshot failed checksum; using clean profile",
+                operation="chrome_profile",
+                context={"snapshot": str(self.snapshot_path)},
+            )
+            return False
+
+        try:
+            self._clear_profile()
+            with tarfile.open(self.snapshot_path, "r:gz") as tar:
+                tar.extractall(self.profile_root, members=self._safe_members(tar))
+        except (tarfile.TarError, OSError) as e:
+            logger.warning(
+                "Chrome profile snapshot could not be extracted; using clean profile",
+                operation="chrome_profile",
+                error=str(e),
+            )
+            return False
+
+        if not self.profile_is_valid():
+            logger.warning(
+                "Extracted Chrome profile is incomplete; using clean profile",
+                operation="chrome_profile",
+            )
+            return False
+
+        self._remove_volatile_files()
+        logger.info(
+            "Chrome profile restored from snapshot",
+            operation="chrome_profile",
+            context={"snapshot": str(self.snapshot_path)},
+        )
+        return True
+
+    def profile_is_valid(self) -> bool:
+        """True if the on-disk profile has a parseable Local State file."""
+        local_state = self.profile_root / LOCAL_STATE
+        try:
+            with local_state.open("r", encoding="utf-8") as f:
+                json.load(f)
+            return True
+        except (OSError, ValueError):
+            return False
+
+    # ------------------------------------------------------------------
+    # Capture
+    # ------------------------------------------------------------------
+    def save_if_missing(self) -> bool:
+        """Capture the current profile if no snapshot exists yet."""
+        if self.snapshot_path.is_file():
+            return False
+        return self.save()
+
+    def save(self) -> bool:
+        """
+        Write the current profile to the snapshot tarball and checksum sidecar.
+
+        Must run after Chrome has exited so the profile is consistent.
+        """
+        if not self.profile_is_valid():
+            return False
+
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.snapshot_path.parent, suffix=".tmp")
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            with tarfile.open(tmp_path, "w:gz") as tar:
+                for name in SNAPSHOT_DIRS:
+                    source = self.profile_root / name
+                    if source.exists():
+                        tar.add(source, arcname=name, filter=self._exclude_volatile)
+            checksum = _sha256(tmp_path)
+            os.replace(tmp_path, self.snapshot_path)
+            self.checksum_path.write_text(checksum, encoding="utf-8")
+        except (tarfile.TarError, OSError) as e:
+            logger.warning(
+                "Failed to write Chrome profile snapshot",
+                operation="chrome_profile",
+                error=str(e),
+            )
+            return False
+
+        logger.info(
+            "Chrome profile snapshot saved",
+            operation="chrome_profile",
+            context={"snapshot": str(self.snapshot_path)},
+        )
+        return True
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _snapshot_checksum_ok(self) -> bool:
+        try:
+            expected = self.checksum_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return False
+        return expected == _sha256(self.snapshot_path)
+
+    def _safe_members(self, tar: tarfile.TarFile) -> Iterable[tarfile.TarInfo]:
+        """Only regular files/dirs under the snapshot directories."""
+        for member in tar.getmembers():
+            parts = Path(member.name).parts
+            if (
+                not parts
+                or parts[0] not in SNAPSHOT_DIRS
+                or ".." in parts
+                or Path(member.name).is_absolute()
+                or not (member.isfile() or member.isdir())
+            ):
+                continue
+            yield member
+
+    @staticmethod
+    def _exclude_volatile(info: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+        if Path(info.name).name.startswith(EXCLUDED_FILE_PREFIXES):
+            return None
+        return info
+
+    def _remove_volatile_files(self) -> None:
+        """Drop lock files and previous session state from a kept profile."""
+        for name in SNAPSHOT_DIRS:
+            root = self.profile_root / name
+            if not root.exists():
+                continue
+            for path in root.rglob("*"):
+                if path.name.startswith(EXCLUDED_FILE_PREFIXES) and not path.is_dir():
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+    def _clear_profile(self) -> None:
+        for name in SNAPSHOT_DIRS:
+            shutil.rmtree(self.profile_root / name, ignore_errors=True)
+
+
+def snapshot_from_env() -> Optional[ChromeProfileSnapshot]:
+    """ChromeProfileSnapshot for NAVER_CHROME_PROFILE_SNAPSHOT, or None if unset."""
+    path = os.getenv("NAVER_CHROME_PROFILE_SNAPSHOT", "").strip()
+    return ChromeProfileSnapshot(Path(path)) if path else None
+
+
+def build_snapshot(output: Path) -> bool:
+    """
+    Launch Chrome once with the Lambda profile flags and snapshot the result.
+
+    Intended for image builds:
+        python -m src.auth.chrome_profile /opt/chrome-profile.tar.gz
+    """
+    from .naver_login import NaverAuthenticator
+
+    authenticator = NaverAuthenticator("", "", session_manager=None)
+    authenticator.setup_driver(skip_warmup=True)
+    authenticator.cleanup()
+    return ChromeProfileSnapshot(output).save()
+
+
+if __name__ == "__main__":
+    import sys
+
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("/opt/chrome-profile.tar.gz")
+    raise SystemExit(0 if build_snapshot(target) else 1)
@@ -0,0 +1,396 @@
+"""
+Cookie Store - Versioned Naver session cookies with a warm-start cache
+
+Wraps SessionRepository with a module-level cache so warm Lambda invocations
+reuse the decoded cookies without reading the `session` table. DynamoDB is
+only consulted when the cached cookies are stale (past their expiry or the
+cache max age) or were invalidated after a 401/403. Writes are conditional on
+the version last read, so concurrent refreshes never overwrite newer cookies.
+
+Each stored cookie set also records when it was issued and a short history of
+how long previous cookie sets lived before the booking API returned 401/403.
+refresh_reason() combines that history with the cookie `expiry` fields so a
+run can re-authenticate up front, before fetching anything, instead of
+failing mid-fetch.
+"""
+
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..database.dynamodb_client import SessionRepository
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bound on how long warm invocations trust cached cookies without
+# re-reading DynamoDB (picks up refreshes made by other containers)
+COOKIE_CACHE_MAX_AGE_SECONDS = int(os.getenv("COOKIE_CACHE_MAX_AGE_SECONDS", "21600"))
+
+# Cookies whose expiry bounds the lifetime of the whole session
+AUTH_COOKIE_NAMES = ("NID_AUT", "NID_SES")
+
+# Refresh at the start of a run when the cookies are predicted to expire
+# within this many seconds
+COOKIE_REFRESH_MARGIN_SECONDS = int(os.getenv("COOKIE_REFRESH_MARGIN_SECONDS", "1800"))
+
+# Off-peak window (KST hours, "start-end", empty to disable) in which cookies
+# are refreshed earlier, while a browser login costs nothing to bookings
+COOKIE_REFRESH_OFFPEAK_HOURS = os.getenv("COOKIE_REFRESH_OFFPEAK_HOURS", "3-5")
+COOKIE_REFRESH_OFFPEAK_MARGIN_SECONDS = int(
+    os.getenv("COOKIE_REFRESH_OFFPEAK_MARGIN_SECONDS", "10800")
+)
+
+# Number of observed issue-to-401 lifetimes kept in the session item
+COOKIE_LIFETIME_SAMPLES = 10
+
+KST_OFFSET_SECONDS = 9 * 3600
+
+
+@dataclass
+class CachedCookies:
+    """Decoded cookies held in process memory between invocations."""
+
+    cookies: List[Dict[str, Any]]
+    version: int
+    expires_at: Optional[float]
+    loaded_at: float
+    issued_at: Optional[float] = None
+    observed_lifetimes: List[int] = field(default_factory=list)
+
+    def is_stale(self, now: float, max_age_seconds: int) -> bool:
+        if self.expires_at is not None and now >= self.expires_at:
+            return True
+        return now - self.loaded_at >= max_age_seconds
+
+
+# Survives across warm invocations of the same container
+_WARM_CACHE: Dict[str, CachedCookies] = {}
+
+
+def reset_warm_cache() -> None:
+    """Drop all cached cookies (tests and forced cold paths)."""
+    _WARM_CACHE.clear()
+
+
+def cookie_expiry(
+    cookies: List[Dict[str, Any]], default_ttl_seconds: int, now: Optional[float] = None
+) -> int:
+    """
+    Estimate when a cookie set stops being usable.
+
+    Uses the earliest `expiry` among the Naver auth cookies, falling back to
+    now + default_ttl_seconds when they are session cookies without expiry.
+    """
+    now = time.time() if now is None else now
+    expiries = [
+        int(cookie["expiry"])
+        for cookie in cookies
+        if cookie.get("name") in AUTH_COOKIE_NAMES and cookie.get("expiry")
+    ]
+    return min(expiries) if expiries else int(now + default_ttl_seconds)
+
+
+def _auth_values(cookies: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        cookie.get("name"): cookie.get("value")
+        for cookie in cookies
+        if cookie.get("name") in AUTH_COOKIE_NAMES
+    }
+
+
+def _parse_hours(window: str) -> Optional[Tuple[int, int]]:
+    """Parse "start-end" hours; None when empty or malformed."""
+    try:
+        start, end = (int(part) for part in window.split("-", 1))
+    except ValueError:
+        return None
+    if not (0 <= start <= 23 and 0 <= end <= 24):
+        return None
+    return start, end
+
+
+def in_offpeak_window(window: str, now: Optional[float] = None) -> bool:
+    """True if now falls in the KST hour window (end exclusive, may wrap midnight)."""
+    hours = _parse_hours(window)
+    if hours is None:
+        return False
+    now = time.time() if now is None else now
+    hour = time.gmtime(now + KST_OFFSET_SECONDS).tm_hour
+    start, end = hours
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+class CookieStore:
+    """
+    Single source of truth for cached Naver cookies.
+
+    Usage:
+        store = CookieStore(dynamodb_resource)
+        cookies = store.get_cookies()      # warm cache or one DynamoDB read
+        store.invalidate()                 # after a 401/403
+        store.save_cookies(new_cookies)    # conditional on the version read
+        store.refresh_reason()             # re-login up front if expiry is near
+        store.record_auth_failure()        # after a 401/403, before clear()
+    """
+
+    def __init__(
+        self,
+        dynamodb_resource: Optional[Any] = None,
+        table_name: str = "session",
+        max_age_seconds: int = COOKIE_CACHE_MAX_AGE_SECONDS,
+        repository: Optional[SessionRepository] = None,
+        refresh_margin_seconds: int = COOKIE_REFRESH_MARGIN_SECONDS,
+        offpeak_hours: str = COOKIE_REFRESH_OFFPEAK_HOURS,
+        offpeak_margin_seconds: int = COOKIE_REFRESH_OFFPEAK_MARGIN_SECONDS,
+    ):
+        self.repository = repository or SessionRepository(
+            table_name=table_name, dynamodb_resource=dynamodb_resource
+        )
+        self.max_age_seconds = max_age_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        # 401s before this age are not expiry (blocked request, bad store) and
+        # would drag the median down into a refresh on every run
+        self.min_lifetime_seconds = 2 * refresh_margin_seconds
+        self.offpeak_hours = offpeak_hours
+        self.offpeak_margin_seconds = offpeak_margin_seconds
+        self._cache_key = f"{self.repository.table_name}:{self.repository.session_id}"
+        self._version: Optional[int] = None
+        # Lifetime history outlives invalidate()/clear() so the next save
+        # carries it forward
+        self._observed_lifetimes: List[int] = []
+
+    @property
+    def version(self) -> Optional[int]:
+        """Version of the cookies last read or written by this process."""
+        cached = _WARM_CACHE.get(self._cache_key)
+        return cached.version if cached else self._version
+
+    def get_cookies(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return cached cookies, reading DynamoDB only when stale or invalidated.
+
+        Returns:
+            List of cookie dicts, or None if no usable cookies are stored
+        """
+        now = time.time()
+        cached = _WARM_CACHE.get(self._cache_key)
+        if cached is not None and not cached.is_stale(now, self.max_age_seconds):
+            self._observed_lifetimes = list(cached.observed_lifetimes)
+            logger.info(
+                f"Using {len(cached.cookies)} warm-cached cookies",
+                operation="cookie_store_get",
+                context={"source": "memory", "version": cached.version},
+            )
+            return [dict(cookie) for cookie in cached.cookies]
+
+        session = self.repository.get_session()
+        if session is None:
+            self._version = 0
+            _WARM_CACHE.pop(self._cache_key, None)
+            logger.info("No cached cookies found", operation="cookie_store_get")
+            return None
+
+        self._observed_lifetimes = list(session.observed_lifetimes or [])
+
+        try:
+            cookies = session.get_cookies_list()
+        except ValueError as e:
+            logger.warning(
+                "Stored cookies are malformed; ignoring them",
+                operation="cookie_store_get",
+                error=str(e),
+            )
+            self._version = session.version or 0
+            return None
+
+        version = session.version or 0
+        expires_at = session.expires_at or cookie_expiry(cookies, self.max_age_seconds, now)
+        if expires_at <= now:
+            logger.info(
+                "Stored cookies have expired",
+                operation="cookie_store_get",
+                context={"version": version},
+            )
+            self._version = version
+            return None
+
+        _WARM_CACHE[self._cache_key] = CachedCookies(
+            cookies=cookies,
+            version=version,
+            expires_at=expires_at,
+            loaded_at=now,
+            # Legacy items predate issued_at; their last write is the best guess
+            issued_at=session.issued_at or session.updated_at,
+            observed_lifetimes=list(self._observed_lifetimes),
+        )
+        self._version = version
+        logger.info(
+            f"Loaded {len(cookies)} cookies from DynamoDB",
+            operation="cookie_store_get",
+            context={"source": "dynamodb", "version": version},
+        )
+        return [dict(cookie) for cookie in cookies]
+
+    def save_cookies(self, cookies: List[Dict[str, Any]]) -> bool:
+        """
+        Persist refreshed cookies with a conditional, versioned write.
+
+        Returns:
+            True if written, False if another run stored newer cookies first
+            (the warm cache is dropped so the next read picks those up)
+        """
+        expected_version = self.version
+        if expected_version is None:
+            # Never read in this process - learn the current version first
+            session = self.repository.get_session()
+            expected_version = (session.version or 0) if session else 0
+            if session is not None and not self._observed_lifetimes:
+                self._observed_lifetimes = list(session.observed_lifetimes or [])
+
+        now = time.time()
+        expires_at = cookie_expiry(cookies, self.max_age_seconds, now)
+        # Re-saving the same auth cookies (e.g. after validation) keeps their
+        # original issue time; new auth values mean a fresh login
+        cached = _WARM_CACHE.get(self._cache_key)
+        if (
+            cached is not None
+            and cached.issued_at
+            and _auth_values(cached.cookies) == _auth_values(cookies)
+        ):
+            issued_at = cached.issued_at
+        else:
+            issued_at = int(now)
+        saved = self.repository.save_session(
+            json.dumps(cookies),
+            expected_version=expected_version,
+            expires_at=expires_at,
+            issued_at=int(issued_at),
+            observed_lifetimes=self._observed_lifetimes,
+        )
+
+        if not saved:
+            self.invalidate()
+            return False
+
+        version = expected_version + 1
+        _WARM_CACHE[self._cache_key] = CachedCookies(
+            cookies=[dict(cookie) for cookie in cookies],
+            version=version,
+            expires_at=expires_at,
+            loaded_at=now,
+            issued_at=issued_at,
+            observed_lifetimes=list(self._observed_lifetimes),
+        )
+        self._version = version
+        return True
+
+    def predicted_expiry(self) -> Optional[float]:
+        """
+        When the cached cookies are expected to stop working.
+
+        The earlier of the cookie `expiry` bound and issue time plus the
+        median observed lifetime (never less than min_lifetime_seconds).
+        None if no cookies are cached.
+        """
+        cached = _WARM_CACHE.get(self._cache_key)
+        if cached is None:
+            return None
+
+        candidates = [cached.expires_at] if cached.expires_at is not None else []
+        if cached.issued_at and self._observed_lifetimes:
+            median = statistics.median_low(self._observed_lifetimes)
+            lifetime = max(median, self.min_lifetime_seconds)
+            candidates.append(cached.issued_at + lifetime)
+        return min(candidates) if candidates else None
+
+    def refresh_reason(self, now: Optional[float] = None) -> Optional[str]:
+        """
+        Decide whether to re-authenticate before this run starts fetching.
+
+        Returns:
+            "near_expiry" or "off_peak" when a proactive refresh is due,
+            None to keep using the cached cookies
+        """
+        now = time.time() if now is None else now
+        expiry = self.predicted_expiry()
+        if expiry is None:
+            return None
+
+        remaining = expiry - now
+        if remaining <= self.refresh_margin_seconds:
+            reason = "near_expiry"
+        elif remaining <= self.offpeak_margin_seconds and in_offpeak_window(
+            self.offpeak_hours, now
+        ):
+            reason = "off_peak"
+        else:
+            return None
+
+        logger.info(
+            "Proactive cookie refresh due",
+            operation="cookie_store_refresh",
+            context={
+                "reason": reason,
+                "remaining_seconds": int(remaining),
+                "lifetime_samples": len(self._observed_lifetimes),
+            },
+        )
+        return reason
+
+    def record_auth_failure(self, now: Optional[float] = None) -> Optional[int]:
+        """
+        Remember how long the current cookies lived before a 401/403.
+
+        The sample is kept in memory and written with the next save_cookies(),
+        so call this before clear(). Failures on cookies younger than
+        min_lifetime_seconds are not treated as expiry and are not recorded.
+
+        Returns:
+            Observed lifetime in seconds, or None if the issue time is unknown
+            or the failure came too early to be an expiry
+        """
+        cached = _WARM_CACHE.get(self._cache_key)
+        if cached is None or not cached.issued_at:
+            return None
+
+        now = time.time() if now is None else now
+        lifetime = max(0, int(now - cached.issued_at))
+        if lifetime < self.min_lifetime_seconds:
+            logger.info(
+                "Auth failure on young cookies; not recorded as a lifetime",
+                operation="cookie_store_lifetime",
+                context={"age_seconds": lifetime, "floor_seconds": self.min_lifetime_seconds},
+            )
+            return None
+        samples = self._observed_lifetimes + [lifetime]
+        self._observed_lifetimes = samples[-COOKIE_LIFETIME_SAMPLES:]
+        cached.observed_lifetimes = list(self._observed_lifetimes)
+        logger.info(
+            "Recorded cookie lifetime at auth failure",
+            operation="cookie_store_lifetime",
+            context={"lifetime_seconds": lifetime, "samples": len(self._observed_lifetimes)},
+        )
+        return lifetime
+
+    def invalidate(self) -> None:
+        """Forget the warm-cached cookies (e.g. after a 401/403)."""
+        if _WARM_CACHE.pop(self._cache_key, None) is not None:
+            logger.info("Warm cookie cache invalidated", operation="cookie_store_invalidate")
+        self._version = None
+
+    def clear(self) -> bool:
+        """
+        Delete stored cookies if they are still the version this run saw.
+
+        Returns:
+            True if deleted, False if another run refreshed them meanwhile
+        """
+        expected_version = self.version
+        self.invalidate()
+        return self.repository.delete_session(expected_version=expected_version)
@@ -5,23 +5,153 @@ import time
 from collections import defaultdict
 from pathlib import Path
 from random import uniform
-from typing import Any, Dict, List, Optional
-from selenium import webdriver
-from selenium.common.exceptions import (
-    InvalidCookieDomainException,
-    WebDriverException,
-    TimeoutException,
-)
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from typing import Any, Callable, Dict, List, Optional
 
+from ..api.naver_booking import NaverBookingAPIClient
+from .browser_keeper import get_browser_keeper
+from .chrome_profile import snapshot_from_env
 from ..utils.logger import get_logger
+from ..utils.timing import PhaseTimer
 
 logger = get_logger(__name__)
 
+# Selenium names bound into this module on first browser use. Importing the
+# selenium package costs noticeable cold-start time and is skipped entirely
+# when cached cookies pass the HTTP probe.
+_SELENIUM_NAMES = (
+    "webdriver",
+    "InvalidCookieDomainException",
+    "WebDriverException",
+    "TimeoutException",
+    "Options",
+    "Service",
+    "By",
+    "WebDriverWait",
+    "EC",
+)
+
+# Resources blocked via CDP Network.setBlockedURLs when NAVER_BLOCK_RESOURCES
+# is enabled: images, fonts, media and third-party analytics/ad hosts. Login,
+# cookie validation and partner warmup only need documents, scripts and XHR.
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*wcs.naver.net*",
+    "*lcs.naver.com*",
+    "*siape.veta.naver.com*",
+)
+
+
+def blocked_url_patterns(allowlist: Optional[List[str]] = None) -> List[str]:
+    """
+    Resolve the URL patterns to block.
+
+    Args:
+        allowlist: Patterns to keep loading (exact entries of
+            DEFAULT_BLOCKED_URL_PATTERNS). Defaults to the comma-separated
+            NAVER_BLOCK_ALLOWLIST environment variable.
+
+    Returns:
+        Patterns for CDP Network.setBlockedURLs
+    """
+    if allowlist is None:
+        allowlist = [
+            entry.strip()
+            for entry in os.getenv("NAVER_BLOCK_ALLOWLIST", "").split(",")
+            if entry.strip()
+        ]
+    allowed = set(allowlist)
+    return [pattern for pattern in DEFAULT_BLOCKED_URL_PATTERNS if pattern not in allowed]
+
+
+# Interval between condition checks in _wait_until()
+WAIT_POLL_SECONDS = 0.1
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+# Last measured browser startup costs in this container (ms), reported as the
+# time avoided when a later invocation authenticates without a browser
+_LAST_BROWSER_STARTUP_MS: Dict[str, float] = {}
+
+
+def _cookie_domain_matches(host: str, domain: str) -> bool:
+    """True if a cookie set for `domain` is sent to `host` (same host or a parent domain)."""
+    domain = domain.lstrip(".")
+    return bool(domain) and (host == domain or host.endswith("." + domain))
+
+
+def _load_selenium() -> float:
+    """
+    Bind the Selenium stack into module globals on first use.
+
+    Names that are already bound (e.g. patched by tests) are left untouched.
+
+    Returns:
+        Import time in milliseconds (0 if everything was already bound)
+    """
+    module_globals = globals()
+    if all(name in module_globals for name in _SELENIUM_NAMES):
+        return 0.0
+
+    started = time.perf_counter()
+    from selenium import webdriver
+    from selenium.common.exceptions import (
+        InvalidCookieDomainException,
+        WebDriverException,
+        TimeoutException,
+    )
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    loaded = {
+        "webdriver": webdriver,
+        "InvalidCookieDomainException": InvalidCookieDomainException,
+        "WebDriverException": WebDriverException,
+        "TimeoutException": TimeoutException,
+        "Options": Options,
+        "Service": Service,
+        "By": By,
+        "WebDriverWait": WebDriverWait,
+        "EC": EC,
+    }
+    for name, value in loaded.items():
+        module_globals.setdefault(name, value)
+    return (time.perf_counter() - started) * 1000
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: `naver_login.webdriver` etc. still resolve for callers and
+    # mock.patch targets without importing selenium at module load
+    if name in _SELENIUM_NAMES:
+        _load_selenium()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class NaverAuthenticator:
     """Exact extraction of the legacy Naver login flow."""
@@ -36,10 +166,46 @@ class NaverAuthenticator:
             Path("/tmp/data-path"),
             Path("/tmp/cache-dir"),
         ]
+        # Optional pre-initialized profile (NAVER_CHROME_PROFILE_SNAPSHOT)
+        self._profile_snapshot = snapshot_from_env()
+        # Optional module-scope driver reuse (NAVER_BROWSER_KEEPALIVE)
+        self._browser_keeper = get_browser_keeper()
+        self._browser_reused = False
+        self._login_succeeded = False
         self._tab_crash_retries = 0
         self._max_tab_crash_retries = 1
         self._cdp_network_enabled = False
         import os
+        # Cached cookies accepted by the HTTP probe (no browser started)
+        self._validated_cookies: Optional[List[Dict[str, Any]]] = None
+        # store_id -> last HTTP probe outcome for the current cookies
+        self.probe_results: Dict[str, Optional[bool]] = {}
+        self._http_probe_enabled = os.getenv("NAVER_COOKIE_HTTP_PROBE", "true").lower() == "true"
+        self.startup_timer = PhaseTimer()
+        # How this run authenticated: cached_valid / cached_invalid / full_login,
+        # and whether cached cookies were checked via "http_probe" or "browser"
+        self.auth_path: Optional[str] = None
+        self.cookie_check: Optional[str] = None
+        # Rehydrate cached cookies with one Network.setCookies call instead of
+        # navigating to every cookie domain (opt-in; legacy path is default)
+        self._bulk_cookie_inject = os.getenv("NAVER_COOKIE_BULK_INJECT", "false").lower() == "true"
+        self._block_resources = os.getenv("NAVER_BLOCK_RESOURCES", "false").lower() == "true"
+        # Anti-bot typing cadence multiplier (0 disables human-like pauses);
+        # kept separate from the condition waits below
+        self._typing_cadence = _env_seconds("NAVER_TYPING_CADENCE", 1.0)
+        # Per-step deadlines for condition-driven waits
+        self._login_cookie_wait = _env_seconds("NAVER_LOGIN_COOKIE_WAIT_SECONDS", 15.0)
+        self._partner_cookie_wait = _env_seconds("NAVER_PARTNER_COOKIE_WAIT_SECONDS", 1.0)
+        self._validate_wait = _env_seconds("NAVER_COOKIE_VALIDATE_WAIT_SECONDS", 3.0)
+        # A loaded page only proves the cookies once its URL has stayed off the
+        # login page this long (Naver redirects from JS after readyState)
+        self._url_settle_seconds = _env_seconds("NAVER_COOKIE_URL_SETTLE_SECONDS", 1.0)
+        # Service cookies the partner API needs (comma separated)
+        self._partner_service_cookies = {
+            name.strip()
+            for name in os.getenv("NAVER_PARTNER_SERVICE_COOKIES", "BUC").split(",")
+            if name.strip()
+        }
         # Enable stealth by default in Lambda to avoid bot-detection signals
         self._is_lambda = os.getenv("AWS_LAMBDA_FUNCTION_NAME") is not None
         env_flag = os.getenv("NAVER_STEALTH_MODE")
@@ -49,6 +215,14 @@ class NaverAuthenticator:
             self._stealth_enabled = env_flag.lower() == "true"
 
     def setup_driver(self, skip_warmup: bool = False):
+        import_ms = _load_selenium()
+        if import_ms:
+            self.startup_timer.record("selenium_import", import_ms)
+
+        if self._browser_keeper is not None and self._reuse_parked_browser(skip_warmup):
+            return
+
+        launch_started = time.perf_counter()
         self._prepare_chrome_profile_dirs()
         chrome_options = Options()
         chrome_binary = self._resolve_chrome_binary_location()
@@ -136,12 +310,21 @@ class NaverAuthenticator:
             service = Service()
 
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.startup_timer.record("chrome_launch", (time.perf_counter() - launch_started) * 1000)
+        _LAST_BROWSER_STARTUP_MS.update(self.startup_timer.phases)
+        if self._browser_keeper is not None:
+            self._browser_keeper.adopt(self.driver)
         try:
             self.driver.set_page_load_timeout(45)
             self.driver.set_script_timeout(30)
         except Exception:
             pass
         self._tab_crash_retries = 0
+        # New browser process: CDP domains must be enabled again
+        self._cdp_network_enabled = False
+
+        if self._block_resources:
+            self._apply_resource_blocking()
 
         # Apply stealth JS hooks to hide webdriver if enabled
         if self._stealth_enabled:
@@ -163,6 +346,66 @@ class NaverAuthenticator:
         if not skip_warmup:
             self._safe_get("https://new.smartplace.naver.com/", timeout=30)
 
+    def _reuse_parked_browser(self, skip_warmup: bool) -> bool:
+        """
+        Take over the browser parked by a previous warm invocation.
+
+        Cookies are cleared so the run starts from the same state as a fresh
+        launch. Returns False if no healthy browser is parked.
+        """
+        with self.startup_timer.phase("browser_reuse"):
+            driver = self._browser_keeper.acquire()
+            if driver is None:
+                return False
+
+            self.driver = driver
+            self._browser_reused = True
+            self._tab_crash_retries = 0
+            self._cdp_network_enabled = False
+            if self._ensure_cdp_network():
+                try:
+                    self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                except WebDriverException as exc:
+                    logger.warning(
+                        "Failed to clear cookies of reused browser",
+                        operation="browser_keeper",
+                        error=str(exc),
+                    )
+
+        if not skip_warmup:
+            self._safe_get("https://new.smartplace.naver.com/", timeout=30)
+        return True
+
+    def _apply_resource_blocking(self) -> bool:
+        """
+        Block non-essential resources for every later navigation of this browser.
+
+        Covers login, cookie validation and partner warmup page loads.
+
+        Returns:
+            True if the block list was installed
+        """
+        patterns = blocked_url_patterns()
+        if not patterns or not self._ensure_cdp_network():
+            return False
+
+        try:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except WebDriverException as exc:
+            logger.warning(
+                "Failed to install resource block list; loading all resources",
+                operation="naver_resource_blocking",
+                error=str(exc),
+            )
+            return False
+
+        logger.info(
+            "Resource block list installed",
+            operation="naver_resource_blocking",
+            context={"pattern_count": len(patterns)},
+        )
+        return True
+
     def _prepare_chrome_profile_dirs(self) -> None:
         """
         Ensure Chrome profile directories are clean before launching a new browser.
@@ -170,8 +413,19 @@ class NaverAuthenticator:
         Lambda containers reuse /tmp between invocations. Stale profile data from
         previous Chrome sessions can corrupt the next launch and trigger tab
         crashes. Removing the directories pre-launch keeps the profile pristine.
+
+        With NAVER_CHROME_PROFILE_SNAPSHOT set, a verified snapshot (or the
+        intact profile of the previous warm invocation) is used instead and
+        only the disk cache is wiped.
         """
-        for path in self._chrome_profile_paths:
+        paths = self._chrome_profile_paths
+        if self._profile_snapshot is not None:
+            with self.startup_timer.phase("profile_restore"):
+                restored = self._profile_snapshot.prepare()
+            if restored:
+                paths = [path for path in paths if path.name == "cache-dir"]
+
+        for path in paths:
             try:
                 if path.exists():
                     shutil.rmtree(path)
@@ -198,6 +452,11 @@ class NaverAuthenticator:
         """Shut down the current driver process if it is still running."""
         if not self.driver:
             return
+        if self._browser_keeper is not None and self._browser_keeper.driver is self.driver:
+            # Broken or finished kept browser: stop tracking it as well
+            self._browser_keeper.discard()
+            self.driver = None
+            return
         try:
             self.driver.quit()
         except Exception:
@@ -213,6 +472,7 @@ class NaverAuthenticator:
         """
         if not self.driver:
             return False
+        _load_selenium()
 
         try:
             try:
@@ -344,9 +604,29 @@ class NaverAuthenticator:
 
         return None
 
-    def login(self, cached_cookies=None):
+    def login(self, cached_cookies=None, probe_store_id: Optional[str] = None):
+        # Validate cached cookies over plain HTTP first; Chrome only starts
+        # when Naver rejects them (or the probe is inconclusive)
+        if cached_cookies and probe_store_id and self._http_probe_enabled:
+            accepted = self._probe_cached_cookies(cached_cookies, probe_store_id)
+            if accepted is not None:
+                self.cookie_check = "http_probe"
+            if accepted:
+                self.auth_path = "cached_valid"
+                return cached_cookies
+            if accepted is False:
+                self.auth_path = "cached_invalid"
+                logger.warning(
+                    "Cached cookies rejected by HTTP probe, re-authenticating",
+                    operation="naver_login_probe",
+                    error="Cached cookie invalid",
+                )
+                cached_cookies = None
+
         if not self.driver:
-            self.setup_driver()
+            # Bulk rehydration needs no page loaded, so skip the warmup load
+            self.setup_driver(skip_warmup=bool(cached_cookies) and self._bulk_cookie_inject)
+        _load_selenium()
 
         driver = self.driver
         userid = self.username
@@ -356,6 +636,10 @@ class NaverAuthenticator:
 
         logger.info("로그인")
         if not cached_cookies:
+            self.probe_results.clear()
+            if self.auth_path is None:
+                self.auth_path = "full_login"
+            credential_started = time.perf_counter()
             logger.info("Starting fresh Naver login", operation="naver_login")
             logger.debug(
                 "No cached cookies, proceeding with Selenium login", operation="naver_login"
@@ -388,22 +672,22 @@ class NaverAuthenticator:
                 if self._stealth_enabled:
                     for ch in str(userid):
                         id_input.send_keys(ch)
-                        time.sleep(uniform(0.05, 0.12))
-                    time.sleep(uniform(0.15, 0.35))
+                        self._human_pause(0.05, 0.12)
+                    self._human_pause(0.15, 0.35)
                     for ch in str(userpw):
                         pw_input.send_keys(ch)
-                        time.sleep(uniform(0.05, 0.12))
-                    time.sleep(uniform(0.15, 0.35))
+                        self._human_pause(0.05, 0.12)
+                    self._human_pause(0.15, 0.35)
                 else:
                     # Fallback to legacy JS injection (preserves unit tests behaviour)
                     driver.execute_script(
                         "document.querySelector('input[id=\\\"id\\\"]').setAttribute('value', '{}')".format(userid)
                     )
-                    time.sleep(uniform(delay + 0.33643, delay + 0.54354))
+                    self._human_pause(delay + 0.33643, delay + 0.54354)
                     driver.execute_script(
                         "document.querySelector('input[id=\\\"pw\\\"]').setAttribute('value', '{}')".format(userpw)
                     )
-                    time.sleep(uniform(delay + 0.33643, delay + 0.54354))
+                    self._human_pause(delay + 0.33643, delay + 0.54354)
 
                 login_btn = driver.find_element(By.ID, "log.login")
                 login_btn.click()
@@ -413,33 +697,44 @@ class NaverAuthenticator:
                 driver.execute_script(
                     "document.querySelector('input[id=\\\"id\\\"]').setAttribute('value', '{}')".format(userid)
                 )
-                time.sleep(uniform(delay + 0.33643, delay + 0.54354))
+                self._human_pause(delay + 0.33643, delay + 0.54354)
                 driver.execute_script(
                     "document.querySelector('input[id=\\\"pw\\\"]').setAttribute('value', '{}')".format(userpw)
                 )
-                time.sleep(uniform(delay + 0.33643, delay + 0.54354))
+                self._human_pause(delay + 0.33643, delay + 0.54354)
                 login_btn.click()
-            time.sleep(uniform(delay + 0.63643, delay + 0.94354))
+            self._human_pause(delay + 0.63643, delay + 0.94354)
 
-            time.sleep(1)
+            # Login is done once Naver issues the auth cookie
+            self._wait_until(
+                "login_auth_cookie",
+                lambda: "NID_AUT" in self._browser_cookie_names(),
+                self._login_cookie_wait,
+            )
 
             WebDriverWait(driver, 15).until(EC.url_contains("naver.com"))
 
             # Warm partner domain to establish service cookies if required by API
             try:
                 self._safe_get("https://partner.booking.naver.com/", timeout=40)
-                time.sleep(1)
+                self._wait_for_partner_cookies()
             except Exception:
                 # Non-fatal; proceed with whatever cookies we have
                 pass
 
             cookies = driver.get_cookies()
+            self.startup_timer.record(
+                "credential_login", (time.perf_counter() - credential_started) * 1000
+            )
             session_cookie = json.dumps(cookies)
             dynamodb_session.put_item(Item={"id": "1", "cookies": session_cookie})
+            self._login_succeeded = True
 
             return cookies
         else:
-            self._apply_cached_cookies(cached_cookies)
+            self.cookie_check = "browser"
+            with self.startup_timer.phase("cookie_injection"):
+                self._apply_cached_cookies(cached_cookies)
 
             # In Lambda/stealth mode, validate against partner domain instead of account page
             validate_url = (
@@ -447,22 +742,73 @@ class NaverAuthenticator:
                 if self._stealth_enabled
                 else "https://nid.naver.com/user2/help/myInfoV2?lang=ko_KR"
             )
-            self._safe_get(validate_url, timeout=30)
-            driver.implicitly_wait(10)
-
-            logger.debug("Validating cached cookie", operation="naver_login_cached")
-            time.sleep(3)
+            with self.startup_timer.phase("cookie_validation"):
+                self._safe_get(validate_url, timeout=30)
+                driver.implicitly_wait(10)
+
+                logger.debug("Validating cached cookie", operation="naver_login_cached")
+                # Settle once Naver redirects to login, or once the loaded page's
+                # URL has stayed put long enough for a JS redirect to have fired
+                self._wait_until(
+                    "cached_cookie_validation",
+                    self._login_redirect_or_settled_url(),
+                    self._validate_wait,
+                )
             if "login" in driver.current_url:
                 msg = "Cookie validation failed, re-authenticating"
                 logger.warning(msg, operation="naver_login_cached", error="Cached cookie invalid")
+                self.auth_path = "cached_invalid"
                 return self.login(None)
             else:
                 logger.info(
                     "Cached cookie validation successful",
                     operation="naver_login_cached",
                 )
+                self.auth_path = "cached_valid"
+                self._login_succeeded = True
                 return cached_cookies
 
+    def _probe_cached_cookies(
+        self, cached_cookies: List[Dict[str, Any]], store_id: str
+    ) -> Optional[bool]:
+        """
+        Validate cached cookies with one partner API request instead of Chrome.
+
+        Returns:
+            True if accepted, False on 401/403, None if inconclusive
+        """
+        with self.startup_timer.phase("cookie_probe"):
+            client = NaverBookingAPIClient(session=self._build_session(cached_cookies))
+            accepted = client.probe_session(store_id)
+        logger.info(
+            "Cached cookie HTTP probe finished",
+            operation="naver_login_probe",
+            context={"store_id": store_id, "accepted": accepted},
+            duration_ms=self.startup_timer.phases["cookie_probe"],
+        )
+        self.probe_results[store_id] = accepted
+        if accepted:
+            self._validated_cookies = cached_cookies
+        return accepted
+
+    def startup_summary(self) -> Dict[str, Any]:
+        """
+        Startup phase timings for this authenticator.
+
+        When no browser was started, `avoided_ms` reports the import + launch
+        cost last measured in this container (None if never measured).
+        """
+        summary: Dict[str, Any] = dict(self.startup_timer.as_context())
+        summary["browser_started"] = self.driver is not None or "chrome_launch" in self.startup_timer.phases
+        summary["browser_reused"] = self._browser_reused
+        summary["auth_path"] = self.auth_path
+        summary["cookie_check"] = self.cookie_check
+        if not summary["browser_started"]:
+            summary["avoided_ms"] = (
+                round(sum(_LAST_BROWSER_STARTUP_MS.values()), 2) if _LAST_BROWSER_STARTUP_MS else None
+            )
+        return summary
+
     def get_session(self):
         """
         Build a requests.Session seeded with Selenium cookies.
@@ -470,7 +816,16 @@ class NaverAuthenticator:
         Critical fix: preserve cookie domain/path so requests sends them to
         partner.booking.naver.com. Also align the default User-Agent with the
         browser UA used during Selenium login to reduce server-side suspicion.
+
+        Without a driver, falls back to cached cookies that passed the HTTP
+        probe in login().
         """
+        if self.driver:
+            return self._build_session(self.driver.get_cookies())
+        return self._build_session(self._validated_cookies or [])
+
+    def _build_session(self, cookies: List[Dict[str, Any]]):
+        """Create a requests.Session with the browser UA and the given cookies."""
         import requests
 
         session = requests.Session()
@@ -485,33 +840,31 @@ class NaverAuthenticator:
         except Exception:
             pass
 
-        if self.driver:
-            cookies = self.driver.get_cookies()
-            for cookie in cookies:
-                name = cookie.get("name")
-                value = cookie.get("value")
-                domain = cookie.get("domain") or None
-                path = cookie.get("path") or "/"
+        for cookie in cookies:
+            name = cookie.get("name")
+            value = cookie.get("value")
+            domain = cookie.get("domain") or None
+            path = cookie.get("path") or "/"
 
-                # Ensure integer expiry when present (requests ignores it for sending)
-                expires = cookie.get("expiry")
-                if isinstance(expires, float):
-                    expires = int(expires)
+            # Ensure integer expiry when present (requests ignores it for sending)
+            expires = cookie.get("expiry")
+            if isinstance(expires, float):
+                expires = int(expires)
 
-                try:
-                    # Preserve domain/path so cookies are sent to the correct host
-                    session.cookies.set(
-                        name,
-                        value,
-                        domain=domain,
-                        path=path,
-                    )
-                except Exception:
-                    # Fallback to name/value only if anything goes wrong
-                    session.cookies.set(name, value)
+            try:
+                # Preserve domain/path so cookies are sent to the correct host
+                session.cookies.set(
+                    name,
+                    value,
+                    domain=domain,
+                    path=path,
+                )
+            except Exception:
+                # Fallback to name/value only if anything goes wrong
+                session.cookies.set(name, value)
 
-            # Note: Avoid duplicating cookies with the same name across domains,
-            # as requests' cookie jar will raise CookieConflictError on get().
+        # Note: Avoid duplicating cookies with the same name across domains,
+        # as requests' cookie jar will raise CookieConflictError on get().
 
         return session
 
@@ -521,9 +874,23 @@ class NaverAuthenticator:
 
         This helps establish cookies scoped specifically to
         https://partner.booking.naver.com for the target store.
+
+        When login() was satisfied by the HTTP probe there is no browser yet;
+        the new one is seeded with the validated cookies before navigating, so
+        get_session() afterwards still carries the authenticated session.
+
+        Raises:
+            RuntimeError: If no browser is running and no validated cookies exist
         """
         if not self.driver:
-            self.setup_driver()
+            seed_cookies = self._validated_cookies
+            if not seed_cookies:
+                raise RuntimeError("No authenticated cookies to seed the partner browser with")
+            self.setup_driver(skip_warmup=True)
+            _load_selenium()
+            with self.startup_timer.phase("cookie_injection"):
+                if not self._set_cookies_via_devtools(seed_cookies):
+                    self._apply_cookies_per_domain(seed_cookies)
 
         url = f"https://partner.booking.naver.com/bizes/{store_id}/booking-list-view"
         logger.info(
@@ -532,20 +899,135 @@ class NaverAuthenticator:
             context={"store_id": store_id, "url": url},
         )
         self._safe_get(url, timeout=timeout)
-        # Give the site a brief moment to drop service cookies
-        try:
-            time.sleep(1)
-        except Exception:
-            pass
+        self._wait_for_partner_cookies()
+
+    def _human_pause(self, low: float, high: float) -> None:
+        """Anti-bot typing cadence pause, scaled by NAVER_TYPING_CADENCE."""
+        if self._typing_cadence > 0:
+            time.sleep(uniform(low, high) * self._typing_cadence)
+
+    def _wait_until(self, step: str, condition, timeout: float) -> bool:
+        """
+        Poll condition until it holds or the step deadline passes.
+
+        Returns:
+            True if the condition was met before the deadline
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            try:
+                met = bool(condition())
+            except Exception:
+                met = False
+            if met or time.monotonic() >= deadline:
+                break
+            time.sleep(WAIT_POLL_SECONDS)
+
+        logger.info(
+            "Browser wait finished",
+            operation="naver_wait",
+            context={"step": step, "met": met, "timeout_seconds": timeout},
+            duration_ms=(time.monotonic() - started) * 1000,
+        )
+        return met
+
+    def _login_redirect_or_settled_url(self) -> Callable[[], bool]:
+        """
+        Wait condition for cached-cookie validation.
+
+        Holds when the browser is on a login URL, or when the page has
+        finished loading and its URL has not changed for _url_settle_seconds.
+        readyState alone is not enough: Naver's redirect to the login page
+        runs from JS after the document completes.
+        """
+        state: Dict[str, Any] = {"url": None, "since": 0.0}
+
+        def settled() -> bool:
+            url = self.driver.current_url
+            if "login" in url:
+                return True
+            now = time.monotonic()
+            if url != state["url"] or not self._page_complete():
+                state["url"] = url
+                state["since"] = now
+                return False
+            return now - state["since"] >= self._url_settle_seconds
+
+        return settled
+
+    def _wait_for_partner_cookies(self) -> bool:
+        """Wait until the partner API's service cookies (NAVER_PARTNER_SERVICE_COOKIES) are set."""
+        return self._wait_until(
+            "partner_service_cookies",
+            lambda: self._partner_service_cookies
+            <= self._browser_cookie_names("partner.booking.naver.com"),
+            self._partner_cookie_wait,
+        )
+
+    def _browser_cookie_names(self, host: Optional[str] = None) -> set:
+        """
+        Names of cookies currently held by the browser.
+
+        Uses CDP Network.getAllCookies (all domains) when available, falling
+        back to the current page's cookies. With `host`, only cookies the
+        browser would send to that host (exact or parent domain) are counted.
+        """
+        cookies = None
+        if self._ensure_cdp_network():
+            try:
+                result = self.driver.execute_cdp_cmd("Network.getAllCookies", {})
+                if isinstance(result, dict) and isinstance(result.get("cookies"), list):
+                    cookies = result["cookies"]
+            except Exception:
+                cookies = None
+        if cookies is None:
+            cookies = self.driver.get_cookies()
+
+        return {
+            cookie.get("name")
+            for cookie in cookies
+            if host is None or _cookie_domain_matches(host, cookie.get("domain") or "")
+        }
+
+    def _page_complete(self) -> bool:
+        return self.driver.execute_script("return document.readyState") == "complete"
 
     def cleanup(self):
-        self._cleanup_driver_process()
+        if self._browser_keeper is not None and self.driver is not None:
+            # Park the browser for the next warm invocation (or recycle it)
+            parked = self._browser_keeper.release(self.driver)
+            self.driver = None
+            if parked:
+                return
+        else:
+            self._cleanup_driver_process()
+        # Capture the profile once a browser run has succeeded (Chrome has exited)
+        if self._profile_snapshot is not None and self._login_succeeded:
+            self._profile_snapshot.save_if_missing()
 
     def _apply_cached_cookies(self, cached_cookies: List[Dict[str, Any]]) -> None:
         """Rehydrate Selenium session by aligning domains before adding cookies."""
         if not self.driver:
             return
+        _load_selenium()
+
+        started = time.perf_counter()
+        mode = "per_domain"
+        if self._bulk_cookie_inject and self._set_cookies_via_devtools(cached_cookies):
+            mode = "bulk"
+        else:
+            self._apply_cookies_per_domain(cached_cookies)
 
+        logger.info(
+            "Cached cookies rehydrated",
+            operation="naver_cookie_rehydrate",
+            context={"mode": mode, "cookie_count": len(cached_cookies)},
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def _apply_cookies_per_domain(self, cached_cookies: List[Dict[str, Any]]) -> None:
+        """Legacy rehydration: navigate to each cookie domain, then add_cookie."""
         driver = self.driver
         cookies_by_domain: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
@@ -592,6 +1074,7 @@ class NaverAuthenticator:
         """Enable Chrome DevTools Protocol network domain once per session."""
         if not self.driver or self._cdp_network_enabled:
             return bool(self.driver)
+        _load_selenium()
 
         try:
             self.driver.execute_cdp_cmd("Network.enable", {})
@@ -612,7 +1095,63 @@ class NaverAuthenticator:
         """
         if not self.driver or not self._ensure_cdp_network():
             return False
+        _load_selenium()
 
+        cookie_args = self._cdp_cookie_params(cookie)
+        domain = cookie.get("domain")
+
+        try:
+            self.driver.execute_cdp_cmd("Network.setCookie", cookie_args)
+            logger.debug(
+                "Injected cookie via CDP after Selenium rejection",
+                operation="naver_login_cdp",
+                context={
+                    "domain": domain or "naver.com",
+                    "cookie": cookie["name"],
+                },
+            )
+            return True
+        except WebDriverException as exc:
+            logger.error(
+                "Failed to inject cookie via CDP",
+                operation="naver_login_cdp",
+                error=str(exc),
+                context={"cookie": cookie["name"], "domain": domain or "naver.com"},
+            )
+            return False
+
+    def _set_cookies_via_devtools(self, cookies: List[Dict[str, Any]]) -> bool:
+        """
+        Inject all cached cookies with a single CDP Network.setCookies call.
+
+        Works on a blank page, so no per-domain navigation is needed.
+
+        Returns:
+            True if Chrome accepted the batch, False to fall back to the
+            per-domain path
+        """
+        if not self.driver or not self._ensure_cdp_network():
+            return False
+        _load_selenium()
+
+        try:
+            self.driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [self._cdp_cookie_params(cookie) for cookie in cookies]},
+            )
+            return True
+        except WebDriverException as exc:
+            logger.warning(
+                "Bulk CDP cookie injection failed; falling back to per-domain injection",
+                operation="naver_login_cdp",
+                error=str(exc),
+                context={"cookie_count": len(cookies)},
+            )
+            return False
+
+    @staticmethod
+    def _cdp_cookie_params(cookie: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a Selenium cookie dict to CDP Network.CookieParam."""
         cookie_args: Dict[str, Any] = {
             "name": cookie["name"],
             "value": cookie["value"],
@@ -635,22 +1174,4 @@ class NaverAuthenticator:
         if same_site:
             cookie_args["sameSite"] = same_site
 
-        try:
-            self.driver.execute_cdp_cmd("Network.setCookie", cookie_args)
-            logger.debug(
-                "Injected cookie via CDP after Selenium rejection",
-                operation="naver_login_cdp",
-                context={
-                    "domain": domain or "naver.com",
-                    "cookie": cookie["name"],
-                },
-            )
-            return True
-        except WebDriverException as exc:
-            logger.error(
-                "Failed to inject cookie via CDP",
-                operation="naver_login_cdp",
-                error=str(exc),
-                context={"cookie": cookie["name"], "domain": domain or "naver.com"},
-            )
-            return False
+        return cookie_args
@@ -0,0 +1,262 @@
+"""
+Partner Warmup Planner - Ensure partner service cookies for every store
+
+The partner booking API sometimes rejects otherwise valid Naver cookies until
+partner.booking.naver.com has issued its service cookies. Instead of loading
+one store's booking-list view in Chrome and retrying the whole fetch on 401,
+the planner:
+
+1. Probes each store over HTTP with the authenticated session (one cheap
+   bookings count request per store, skipped for stores already known good)
+2. Warms rejected stores with plain HTTP page requests on the same session
+3. Falls back to browser navigations only for stores still rejected: one
+   store at a time, re-probing the others after each navigation, so a single
+   navigation is enough whenever the service cookies it issues cover every
+   store
+
+Results are cached per cookie set in process memory, so warm invocations
+with unchanged cookies skip warmup entirely until the cookies expire. A cached
+result only counts while the session still carries the partner service
+cookies the store was warmed with; otherwise the store is probed again.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import requests
+
+from ..api.naver_booking import NaverBookingAPIClient
+from ..utils.logger import get_logger
+from .cookie_store import COOKIE_CACHE_MAX_AGE_SECONDS, cookie_expiry
+
+logger = get_logger(__name__)
+
+PARTNER_BASE_URL = "https://partner.booking.naver.com"
+
+
+@dataclass
+class StoreWarmupState:
+    """Cached warmup outcome for one store under one cookie set."""
+
+    ready: bool
+    expires_at: float
+    service_cookies: List[str] = field(default_factory=list)
+
+
+# (cookie fingerprint, store_id) -> state; survives warm invocations
+_WARMUP_CACHE: Dict[tuple, StoreWarmupState] = {}
+
+
+def reset_warmup_cache() -> None:
+    """Drop all cached warmup results (tests and forced re-auth)."""
+    _WARMUP_CACHE.clear()
+
+
+def cookie_fingerprint(session: requests.Session) -> str:
+    """Stable hash of the auth cookies carried by session."""
+    items = sorted(
+        (cookie.name, cookie.value or "")
+        for cookie in session.cookies
+        if cookie.name in ("NID_AUT", "NID_SES")
+    )
+    return hashlib.sha256(repr(items).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class WarmupResult:
+    """Outcome of PartnerWarmupPlanner.ensure_ready()."""
+
+    session: Any
+    ready: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    warmed_via: Dict[str, str] = field(default_factory=dict)
+
+
+class PartnerWarmupPlanner:
+    """
+    Decide which stores need partner warmup and acquire their cookies.
+
+    Usage:
+        planner = PartnerWarmupPlanner(authenticator, client_factory)
+        result = planner.ensure_ready(store_ids, authenticator.get_session())
+        if result.failed:
+            ...  # cookies themselves are invalid - re-authenticate once
+    """
+
+    def __init__(
+        self,
+        authenticator: Any,
+        client_factory: Optional[Callable[[Any], NaverBookingAPIClient]] = None,
+        cache_ttl_seconds: int = COOKIE_CACHE_MAX_AGE_SECONDS,
+    ):
+        """
+        Args:
+            authenticator: NaverAuthenticator (browser fallback and session refresh)
+            client_factory: Builds an API client for a session (default: NaverBookingAPIClient)
+            cache_ttl_seconds: Cache lifetime when cookies carry no expiry
+        """
+        self.authenticator = authenticator
+        self.client_factory = client_factory or (lambda session: NaverBookingAPIClient(session=session))
+        self.cache_ttl_seconds = cache_ttl_seconds
+
+    def ensure_ready(self, store_ids: List[str], session: Any, force: bool = False) -> WarmupResult:
+        """
+        Make sure every store accepts the session, warming only where needed.
+
+        Args:
+            store_ids: Stores about to be fetched
+            session: Authenticated requests.Session
+            force: Ignore cached results (e.g. right after re-authentication)
+
+        Returns:
+            WarmupResult with the session to use and per-store outcome
+        """
+        started = time.perf_counter()
+        result = WarmupResult(session=session)
+        fingerprint = self._fingerprint(session)
+        now = time.time()
+
+        session_cookies = self._cookie_names(session)
+        pending: List[str] = []
+        for store_id in store_ids:
+            cached = None if force else _WARMUP_CACHE.get((fingerprint, store_id))
+            if (
+                cached is not None
+                and cached.ready
+                and cached.expires_at > now
+                and session_cookies.issuperset(cached.service_cookies)
+            ):
+                result.ready.append(store_id)
+                result.warmed_via[store_id] = "cache"
+            elif not force and self._probed_by_login(store_id):
+                result.ready.append(store_id)
+                result.warmed_via[store_id] = "login_probe"
+            else:
+                pending.append(store_id)
+
+        rejected = self._probe(session, pending, result, via="probe")
+
+        if rejected:
+            for store_id in rejected:
+                self._warm_over_http(session, store_id)
+            rejected = self._probe(session, rejected, result, via="http")
+
+        while rejected:
+            store_id = rejected[0]
+            browser_session = self._warm_in_browser(store_id)
+            if browser_session is None:
+                break
+            session = browser_session
+            result.session = session
+            still_rejected = self._probe(session, rejected, result, via="browser")
+            if store_id in still_rejected:
+                # Its own booking-list view did not help: the cookies are the problem
+                rejected = still_rejected
+                break
+            rejected = still_rejected
+
+        result.failed = rejected
+        self._remember(session, result)
+
+        logger.info(
+            "Partner warmup planned",
+            operation="partner_warmup",
+            context={
+                "stores": len(store_ids),
+                "ready": len(result.ready),
+                "failed": result.failed,
+                "warmed_via": result.warmed_via,
+            },
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+        return result
+
+    def _probe(
+        self, session: Any, store_ids: List[str], result: WarmupResult, via: str
+    ) -> List[str]:
+        """Probe stores; record accepted/inconclusive ones as ready, return rejected."""
+        if not store_ids:
+            return []
+
+        client = self.client_factory(session)
+        rejected = []
+        for store_id in store_ids:
+            accepted = client.probe_session(store_id)
+            if accepted is False:
+                rejected.append(store_id)
+                continue
+            # Inconclusive probes do not block (the fetch surfaces real auth
+            # errors) but are not cached as known good
+            result.ready.append(store_id)
+            result.warmed_via[store_id] = via if accepted is True else "unverified"
+        return rejected
+
+    def _warm_over_http(self, session: Any, store_id: str) -> None:
+        """Request the store's booking-list view so partner Set-Cookie lands in the jar."""
+        url = f"{PARTNER_BASE_URL}/bizes/{store_id}/booking-list-view"
+        try:
+            session.get(url, timeout=10)
+        except requests.RequestException as e:
+            logger.warning(
+                "HTTP partner warmup failed",
+                operation="partner_warmup",
+                context={"store_id": store_id},
+                error=str(e),
+            )
+
+    def _warm_in_browser(self, store_id: str) -> Optional[Any]:
+        """One browser navigation, then a fresh session with the browser's cookies."""
+        try:
+            self.authenticator.ensure_partner_session_for_store(store_id)
+            return self.authenticator.get_session()
+        except Exception as e:
+            logger.warning(
+                "Browser partner warmup failed",
+                operation="partner_warmup",
+                context={"store_id": store_id},
+                error=str(e),
+            )
+            return None
+
+    def _probed_by_login(self, store_id: str) -> bool:
+        probe_results = getattr(self.authenticator, "probe_results", None)
+        return isinstance(probe_results, dict) and probe_results.get(store_id) is True
+
+    @staticmethod
+    def _cookie_names(session: Any) -> Set[str]:
+        try:
+            return {cookie.name for cookie in session.cookies}
+        except Exception:
+            return set()
+
+    def _fingerprint(self, session: Any) -> Optional[str]:
+        try:
+            return cookie_fingerprint(session)
+        except Exception:
+            return None
+
+    def _remember(self, session: Any, result: WarmupResult) -> None:
+        fingerprint = self._fingerprint(session)
+        if fingerprint is None:
+            return
+
+        cookies = [
+            {"name": cookie.name, "expiry": cookie.expires}
+            for cookie in getattr(session, "cookies", [])
+        ]
+        expires_at = cookie_expiry(cookies, self.cache_ttl_seconds)
+        service_cookies = sorted(
+            cookie.name
+            for cookie in session.cookies
+            if (cookie.domain or "").lstrip(".").endswith("partner.booking.naver.com")
+        )
+        for store_id in result.ready:
+            if result.warmed_via.get(store_id) == "unverified":
+                continue
+            _WARMUP_CACHE[(fingerprint, store_id)] = StoreWarmupState(
+                ready=True, expires_at=expires_at, service_cookies=service_cookies
+            )
+        for store_id in result.failed:
+            _WARMUP_CACHE.pop((fingerprint, store_id), None)
@@ -5,6 +5,8 @@ Session Manager - Handles DynamoDB cookie storage and retrieval
 import json
 import logging
 
+from .cookie_store import CookieStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,7 +15,9 @@ class SessionManager:
     Manages session cookies in DynamoDB.
 
     Handles persistence and retrieval of Naver authentication cookies
-    to enable cookie reuse across Lambda invocations..
+    to enable cookie reuse across Lambda invocations. Storage is delegated
+    to CookieStore, which keeps decoded cookies warm in process memory and
+    versions every write.
     """
 
     def __init__(self, dynamodb_resource):
@@ -24,39 +28,33 @@ class SessionManager:
             dynamodb_resource: boto3 DynamoDB resource.
         """
         self.dynamodb = dynamodb_resource
-        self.table = self.dynamodb.Table("session")
+        self.cookie_store = CookieStore(dynamodb_resource)
+        self.table = self.cookie_store.repository.table
 
     def get_cookies(self):
         """
-        Retrieve cached cookies from DynamoDB.
+        Retrieve cached cookies (warm cache first, then DynamoDB).
 
         Returns:
             List of cookie dicts or None if no cookies exist
         """
         try:
-            response = self.table.get_item(Key={"id": "1"})
-            cookies_json = response["Item"]["cookies"]
-            cookies = json.loads(cookies_json)
-            logger.info(f"Retrieved {len(cookies)} cookies from DynamoDB")
-            return cookies
-        except KeyError:
-            logger.info("No cached cookies found in DynamoDB")
-            return None
+            return self.cookie_store.get_cookies()
         except Exception as e:
             logger.error(f"Error retrieving cookies: {e}")
             return None
 
-    def put_item(self, Item: dict):
+    def put_item(self, Item: dict) -> bool:
         """
         Minimal DynamoDB compatibility layer for preserved login code.
 
         Args:
-            Item: DynamoDB item payload
+            Item: DynamoDB item payload ({"id": "1", "cookies": <json>})
 
         Returns:
-            dict: Result from DynamoDB put_item
+            True if saved, False if another run stored newer cookies first
         """
-        return self.table.put_item(Item=Item)
+        return self.cookie_store.save_cookies(json.loads(Item["cookies"]))
 
     def save_cookies(self, cookies_json: str) -> bool:
         """
@@ -69,34 +67,63 @@ class SessionManager:
             True if successful, False otherwise
         """
         try:
-            response = self.put_item({"id": "1", "cookies": cookies_json})
-
-            http_status = response["ResponseMetadata"]["HTTPStatusCode"]
-            if http_status == 200:
+            if self.put_item({"id": "1", "cookies": cookies_json}):
                 logger.info("Cookies saved to DynamoDB successfully")
                 return True
-            else:
-                logger.error(f"DynamoDB put_item failed with status {http_status}")
-                return False
+            logger.warning("Cookies not saved; a newer session was stored by another run")
+            return False
         except Exception as e:
             logger.error(f"Error saving cookies: {e}")
             return False
 
+    def invalidate_cookies(self) -> None:
+        """Drop the warm-cached cookies so the next read goes to DynamoDB."""
+        self.cookie_store.invalidate()
+
+    def refresh_reason(self):
+        """
+        Reason to re-authenticate before fetching, or None to reuse cached cookies.
+
+        Returns:
+            "near_expiry", "off_peak" or None
+        """
+        try:
+            return self.cookie_store.refresh_reason()
+        except Exception as e:
+            logger.error(f"Error checking cookie refresh schedule: {e}")
+            return None
+
+    def record_auth_failure(self):
+        """
+        Record how long the current cookies lived before an auth failure.
+
+        Call before clear_cookies() so the sample is kept with the next save.
+
+        Returns:
+            Observed lifetime in seconds, or None if unknown
+        """
+        try:
+            return self.cookie_store.record_auth_failure()
+        except Exception as e:
+            logger.error(f"Error recording cookie lifetime: {e}")
+            return None
+
     def clear_cookies(self) -> bool:
         """
         Remove cached cookies from DynamoDB.
 
+        Only deletes the version this run read, so cookies refreshed by a
+        concurrent run are kept.
+
         Returns:
             True if cookies were deleted successfully, False otherwise.
         """
         try:
-            response = self.table.delete_item(Key={"id": "1"})
-            http_status = response["ResponseMetadata"]["HTTPStatusCode"]
-            if http_status == 200:
+            if self.cookie_store.clear():
                 logger.info("Cleared cached cookies from DynamoDB")
                 return True
 
-            logger.warning(f"DynamoDB delete_item returned unexpected status {http_status}")
+            logger.info("Kept cookies refreshed by another run")
             return False
         except Exception as e:
             logger.error(f"Error clearing cached cookies: {e}")
@@ -68,6 +68,49 @@ COMPARISON_MODE_ENABLED = os.getenv("COMPARISON_MODE_ENABLED", "false") == "true
 # Adjustable via TELEGRAM_THROTTLE_SECONDS environment variable
 TELEGRAM_THROTTLE_SECONDS = float(os.getenv("TELEGRAM_THROTTLE_SECONDS", "0.15"))
 
+# Run lease / sharding configuration
+# Default: False (no lease) - every invocation processes every store.
+# When enabled each invocation claims one of RUN_SHARD_COUNT shards in the
+# run_lease table and processes only that shard's stores.
+RUN_LOCK_ENABLED = os.getenv("RUN_LOCK_ENABLED", "false").lower() == "true"
+RUN_SHARD_COUNT = int(os.getenv("RUN_SHARD_COUNT", "1"))
+RUN_LEASE_SECONDS = int(os.getenv("RUN_LEASE_SECONDS", "600"))
+RUN_LEASE_TABLE = os.getenv("RUN_LEASE_TABLE", "run_lease")
+
+# Rule engine condition ordering
+# "cost" (default): compiled rules evaluate cheap, highly selective conditions first
+# "declared": keep rules.yaml order (debugging)
+RULE_CONDITION_ORDER = os.getenv("RULE_CONDITION_ORDER", "cost").lower()
+
+# Rule matching strategy
+# "indexed" (default): skip rules whose status/store/hour/date-range conditions cannot match
+# "linear": check every compiled rule for every booking
+RULE_MATCHER = os.getenv("RULE_MATCHER", "indexed").lower()
+
+# Batch rule evaluation (one condition mask per distinct condition over the whole run)
+# Off by default; intended for large replays such as comparison/validation campaigns
+RULE_BATCH_EVALUATION = os.getenv("RULE_BATCH_EVALUATION", "false").lower() == "true"
+
+# Rule engine logging
+# "verbose" (default): log every booking, rule match and failed condition
+# "summary": count rule matches/failed conditions, log one summary per run (opt-in)
+RULE_LOG_MODE = os.getenv("RULE_LOG_MODE", "verbose").lower()
+
+# Concurrent rule processing (bookings on worker threads, actions in order per booking)
+# 1 (default) keeps the sequential loop
+RULE_WORKERS = int(os.getenv("RULE_WORKERS", "1"))
+# Max concurrent actions per type across workers ("action_type=n" pairs)
+RULE_ACTION_LIMITS = os.getenv("RULE_ACTION_LIMITS", "send_telegram=1,send_sms=4")
+
+# Action scheduling within a rule
+# "sequential" (default): declared order, failures don't stop later actions (halt_on_failure aside)
+# "dag": independent actions run concurrently; actions whose dependency failed are skipped
+RULE_ACTION_SCHEDULING = os.getenv("RULE_ACTION_SCHEDULING", "sequential").lower()
+
+# Rules document source; the parsed engine is cached until the document's hash changes
+# "" (default): bundled config/rules.yaml, "s3://bucket/key": S3 (update without redeploy)
+RULES_SOURCE = os.getenv("RULES_SOURCE", "")
+
 _TELEGRAM_CREDENTIALS_CACHE: Optional[Dict[str, str]] = None
 
 
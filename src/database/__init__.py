@@ -1,20 +1,26 @@
 """Database module - DynamoDB repository pattern implementation."""
 
 from .dynamodb_client import BookingRepository, SessionRepository
+from .run_lease import RunLeaseRepository, LeaseHeartbeat, shard_store_ids
 from .exceptions import (
     DynamoDBException,
     NotFoundError,
     ThrottlingError,
     NetworkError,
     PermissionError,
+    DuplicateBookingError,
 )
 
 __all__ = [
     "BookingRepository",
     "SessionRepository",
+    "RunLeaseRepository",
+    "LeaseHeartbeat",
+    "shard_store_ids",
     "DynamoDBException",
     "NotFoundError",
     "ThrottlingError",
     "NetworkError",
     "PermissionError",
+    "DuplicateBookingError",
 ]
@@ -7,7 +7,7 @@ dependency injection for testability and structured logging.
 
 import time
 from datetime import datetime
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError
@@ -61,6 +61,26 @@ class BookingRepository:
         self.max_retries = max_retries
         self.backoff_base = backoff_base
 
+    def for_worker_thread(self) -> "BookingRepository":
+        """
+        Same table and retry settings on a resource from a new boto3 session.
+
+        boto3 resources are not thread-safe; each worker thread of a
+        concurrent run uses its own copy instead of sharing this one.
+        """
+        client_meta = self.dynamodb.meta.client.meta
+        resource = boto3.session.Session().resource(
+            "dynamodb",
+            region_name=client_meta.region_name,
+            endpoint_url=client_meta.endpoint_url,
+        )
+        return BookingRepository(
+            table_name=self.table_name,
+            dynamodb_resource=resource,
+            max_retries=self.max_retries,
+            backoff_base=self.backoff_base,
+        )
+
     def get_booking(  # type: ignore[return] # noqa: C901
         self, prefix: str, phone: str
     ) -> Optional[Union[Booking, Dict[str, Any]]]:
@@ -164,30 +184,107 @@ class BookingRepository:
                 )
                 raise NetworkError(f"Network error: {e}")  # type: ignore[no-unreachable]
 
-    def create_booking(self, record: Dict[str, Any]) -> bool:  # type: ignore[return]
+    def batch_get_bookings(  # type: ignore[return]
+        self, keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
         """
-        Create a new booking record.
+        Retrieve many bookings with BatchGetItem.
 
-        Implements AC-1 put_item behavior from lambda_function.py:150.
-        Validates required fields exist before insertion.
+        Keys are fetched in chunks of 100 (the BatchGetItem limit) and
+        UnprocessedKeys are retried with exponential backoff.
 
         Args:
-            record: Booking data dict with keys:
-                - booking_num: "{biz_id}_{book_id}"
-                - phone: "010-XXXX-XXXX"
-                - name: Customer name
-                - booking_time: "YYYY-MM-DD HH:MM:SS"
-                - confirm_sms: bool
-                - remind_sms: bool
-                - option_sms: bool
+            keys: List of (booking_num, phone) tuples
 
         Returns:
-            True if successful
+            Dict mapping (booking_num, phone) to the stored record. Missing
+            bookings are omitted.
 
         Raises:
-            DynamoDBException: If validation fails or DynamoDB error
-            ThrottlingError: If throttled
+            ThrottlingError: If keys remain unprocessed after max retries
             NetworkError: If connection fails
+            PermissionError: If IAM permissions insufficient
+        """
+        results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        context = {"key_count": len(unique_keys)}
+
+        logger.debug("Batch fetching bookings", operation="batch_get_bookings", context=context)
+
+        start_time = time.time()
+        for chunk_start in range(0, len(unique_keys), 100):
+            request_keys = [
+                {"booking_num": prefix, "phone": phone}
+                for prefix, phone in unique_keys[chunk_start : chunk_start + 100]
+            ]
+
+            for attempt in range(self.max_retries):
+                try:
+                    response = self.dynamodb.batch_get_item(
+                        RequestItems={self.table_name: {"Keys": request_keys}}
+                    )
+                except ClientError as e:
+                    error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                    if error_code == "AccessDeniedException":
+                        raise PermissionError(f"Insufficient IAM permissions: {error_code}")
+                    if error_code != "ProvisionedThroughputExceededException":
+                        logger.error(
+                            "DynamoDB error",
+                            operation="batch_get_bookings",
+                            context=context,
+                            error=str(e),
+                        )
+                        raise DynamoDBException(f"DynamoDB error: {e}")
+                    response = {"UnprocessedKeys": {self.table_name: {"Keys": request_keys}}}
+                except (BotoCoreError, OSError) as e:
+                    logger.error(
+                        "Network error",
+                        operation="batch_get_bookings",
+                        context=context,
+                        error=str(e),
+                    )
+                    raise NetworkError(f"Network error: {e}")
+
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    results[(item["booking_num"], item["phone"])] = dict(item)
+
+                request_keys = (
+                    response.get("UnprocessedKeys", {}).get(self.table_name, {}).get("Keys", [])
+                )
+                if not request_keys:
+                    break
+
+                if attempt < self.max_retries - 1:
+                    wait_time = self.backoff_base * (2**attempt)
+                    logger.warning(
+                        f"{len(request_keys)} keys unprocessed, retrying after {wait_time}s",
+                        operation="batch_get_bookings",
+                        context=context,
+                    )
+                    time.sleep(wait_time)
+            else:
+                raise ThrottlingError(
+                    f"DynamoDB batch read throttled after {self.max_retries} retries"
+                )
+
+        logger.info(
+            f"Batch fetched {len(results)} of {len(unique_keys)} bookings",
+            operation="batch_get_bookings",
+            context=context,
+            duration_ms=(time.time() - start_time) * 1000,
+        )
+        return results
+
+    @staticmethod
+    def _prepare_record(record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalise a booking record for persistence.
+
+        Copies the input, strips disallowed columns, validates required fields,
+        drops None values and moves booking_num last for readability.
+
+        Raises:
+            DynamoDBException: If required fields are missing
         """
         # Copy to avoid mutating caller data
         record = dict(record)
@@ -212,10 +309,37 @@ class BookingRepository:
         record = {key: value for key, value in record.items() if value is not None}
 
         # Ensure booking_num is positioned last for readability
-        if "booking_num" in record:
-            booking_num_value = record["booking_num"]
-            record = {key: value for key, value in record.items() if key != "booking_num"}
-            record["booking_num"] = booking_num_value
+        booking_num_value = record.pop("booking_num")
+        record["booking_num"] = booking_num_value
+
+        return record
+
+    def create_booking(self, record: Dict[str, Any]) -> bool:  # type: ignore[return]
+        """
+        Create a new booking record.
+
+        Implements AC-1 put_item behavior from lambda_function.py:150.
+        Validates required fields exist before insertion.
+
+        Args:
+            record: Booking data dict with keys:
+                - booking_num: "{biz_id}_{book_id}"
+                - phone: "010-XXXX-XXXX"
+                - name: Customer name
+                - booking_time: "YYYY-MM-DD HH:MM:SS"
+                - confirm_sms: bool
+                - remind_sms: bool
+                - option_sms: bool
+
+        Returns:
+            True if successful
+
+        Raises:
+            DynamoDBException: If validation fails or DynamoDB error
+            ThrottlingError: If throttled
+            NetworkError: If connection fails
+        """
+        record = self._prepare_record(record)
 
         context = {
             "booking_num": record["booking_num"],
@@ -278,6 +402,101 @@ class BookingRepository:
                 )
                 raise NetworkError(f"Network error: {e}")  # type: ignore[no-unreachable]
 
+    def create_booking_if_absent(self, record: Dict[str, Any]) -> bool:  # type: ignore[return]
+        """
+        Create a booking record only if no record exists for its key.
+
+        Issues a single conditional put_item (attribute_not_exists) so the
+        record can be written with its final flag state in one round trip.
+        When two invocations race on the same booking exactly one wins.
+
+        Args:
+            record: Booking data dict (same shape as create_booking)
+
+        Returns:
+            True if this call created the record, False if it already existed
+
+        Raises:
+            DynamoDBException: If validation fails or DynamoDB error
+            ThrottlingError: If throttled
+            NetworkError: If connection fails
+        """
+        record = self._prepare_record(record)
+
+        context = {
+            "booking_num": record["booking_num"],
+            "phone_masked": mask_phone(record["phone"]),
+        }
+
+        logger.debug(
+            "Creating booking if absent", operation="create_booking_if_absent", context=context
+        )
+
+        for attempt in range(self.max_retries):
+            try:
+                start_time = time.time()
+                self.table.put_item(
+                    Item=record,
+                    ConditionExpression="attribute_not_exists(booking_num)",
+                )
+                duration_ms = (time.time() - start_time) * 1000
+
+                logger.info(
+                    "Booking created",
+                    operation="create_booking_if_absent",
+                    context={**context, "created": True},
+                    duration_ms=duration_ms,
+                )
+                return True
+
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+
+                if error_code == "ConditionalCheckFailedException":
+                    logger.info(
+                        "Booking already exists, skipping create",
+                        operation="create_booking_if_absent",
+                        context={**context, "created": False},
+                    )
+                    return False
+
+                elif error_code == "ProvisionedThroughputExceededException":
+                    if attempt < self.max_retries - 1:
+                        wait_time = self.backoff_base * (2**attempt)
+                        logger.warning(
+                            f"Throttled, retrying after {wait_time}s",
+                            operation="create_booking_if_absent",
+                            context=context,
+                            error=error_code,
+                        )
+                        time.sleep(wait_time)
+                        continue
+                    else:
+                        raise ThrottlingError(
+                            f"DynamoDB throttled after {self.max_retries} retries"
+                        )
+
+                elif error_code == "AccessDeniedException":
+                    raise PermissionError(f"Insufficient IAM permissions: {error_code}")
+
+                else:
+                    logger.error(
+                        "DynamoDB error",
+                        operation="create_booking_if_absent",
+                        context=context,
+                        error=str(e),
+                    )
+                    raise DynamoDBException(f"DynamoDB error: {e}")
+
+            except (BotoCoreError, OSError) as e:
+                logger.error(
+                    "Network error",
+                    operation="create_booking_if_absent",
+                    context=context,
+                    error=str(e),
+                )
+                raise NetworkError(f"Network error: {e}")  # type: ignore[no-unreachable]
+
     def update_flag(  # type: ignore[return]
         self,
         prefix: str,
@@ -406,14 +625,20 @@ class BookingRepository:
         try:
             start_time = time.time()
 
-            # Scan for option_sms=False
-            response = self.table.scan(
-                FilterExpression="attribute_exists(option_sms) AND #opt = :false",
-                ExpressionAttributeNames={"#opt": "option_sms"},
-                ExpressionAttributeValues={":false": False},
-            )
-
-            items = response.get("Items", [])
+            # Scan for option_sms=False, following pagination past the 1 MB page limit
+            scan_kwargs: Dict[str, Any] = {
+                "FilterExpression": "attribute_exists(option_sms) AND #opt = :false",
+                "ExpressionAttributeNames": {"#opt": "option_sms"},
+                "ExpressionAttributeValues": {":false": False},
+            }
+            items: List[Dict[str, Any]] = []
+            while True:
+                response = self.table.scan(**scan_kwargs)
+                items.extend(response.get("Items", []))
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    break
+                scan_kwargs["ExclusiveStartKey"] = last_key
             duration_ms = (time.time() - start_time) * 1000
 
             logger.info(
@@ -592,18 +817,34 @@ class SessionRepository:
             )
             raise NetworkError(f"Network error: {e}")  # type: ignore[no-unreachable]
 
-    def save_session(self, cookies_json: str) -> bool:  # type: ignore[return]
+    def save_session(  # type: ignore[return]
+        self,
+        cookies_json: str,
+        expected_version: Optional[int] = None,
+        expires_at: Optional[int] = None,
+        issued_at: Optional[int] = None,
+        observed_lifetimes: Optional[List[int]] = None,
+    ) -> bool:
         """
         Save session cookies.
 
         Implements AC-2 session_upsert_db behavior from lambda_function.py:110-128.
         Uses put_item for upsert semantics (overwrites existing session).
 
+        When expected_version is given the write is conditional: it only
+        succeeds if the stored version still matches (0 means "no versioned
+        record yet"), and the new item is stored with version + 1. This keeps
+        concurrent refreshes from clobbering each other.
+
         Args:
             cookies_json: JSON string of Selenium cookies list
+            expected_version: Version the caller last read (None = unconditional)
+            expires_at: Epoch seconds after which the cookies are stale
+            issued_at: Epoch seconds when the cookies were obtained by a fresh login
+            observed_lifetimes: Recent issue-to-401 lifetimes to carry forward
 
         Returns:
-            True if successful
+            True if successful, False if the conditional write lost to a newer version
 
         Raises:
             DynamoDBException: If validation fails
@@ -617,18 +858,29 @@ class SessionRepository:
         for attempt in range(self.max_retries):
             try:
                 start_time = time.time()
-                self.table.put_item(
-                    Item={
-                        "id": self.session_id,
-                        "cookies": cookies_json,
-                    }
-                )
+                item: Dict[str, Any] = {
+                    "id": self.session_id,
+                    "cookies": cookies_json,
+                }
+                put_kwargs: Dict[str, Any] = {}
+                if expected_version is not None:
+                    item["version"] = expected_version + 1
+                    item["updated_at"] = int(time.time())
+                    put_kwargs.update(self._version_condition(expected_version))
+                if expires_at is not None:
+                    item["expires_at"] = int(expires_at)
+                if issued_at is not None:
+                    item["issued_at"] = int(issued_at)
+                if observed_lifetimes:
+                    item["observed_lifetimes"] = [int(v) for v in observed_lifetimes]
+
+                self.table.put_item(Item=item, **put_kwargs)
                 duration_ms = (time.time() - start_time) * 1000
 
                 logger.info(
                     "Session saved",
                     operation="save_session",
-                    context=context,
+                    context={**context, "version": item.get("version")},
                     duration_ms=duration_ms,
                 )
                 return True
@@ -636,7 +888,15 @@ class SessionRepository:
             except ClientError as e:
                 error_code = e.response.get("Error", {}).get("Code", "Unknown")
 
-                if error_code == "ProvisionedThroughputExceededException":
+                if error_code == "ConditionalCheckFailedException":
+                    logger.info(
+                        "Session was updated by another run, skipping save",
+                        operation="save_session",
+                        context={**context, "expected_version": expected_version},
+                    )
+                    return False
+
+                elif error_code == "ProvisionedThroughputExceededException":
                     if attempt < self.max_retries - 1:
                         wait_time = 1.0 * (2**attempt)
                         logger.warning(
@@ -673,15 +933,21 @@ class SessionRepository:
                 )
                 raise NetworkError(f"Network error: {e}")
 
-    def delete_session(self) -> bool:
+    def delete_session(self, expected_version: Optional[int] = None) -> bool:
         """
         Delete session cookies (cache invalidation).
 
         Implements AC-2 requirement for cache invalidation.
         Used when session is invalid and needs to be cleared.
 
+        Args:
+            expected_version: Only delete if the stored version still matches
+                (None = unconditional). Prevents deleting cookies another run
+                has just refreshed.
+
         Returns:
-            True if successful (or item didn't exist)
+            True if successful (or item didn't exist), False if a newer
+            version was kept
 
         Raises:
             NetworkError: If connection fails
@@ -693,7 +959,10 @@ class SessionRepository:
 
         try:
             start_time = time.time()
-            self.table.delete_item(Key={"id": self.session_id})
+            delete_kwargs: Dict[str, Any] = {}
+            if expected_version is not None:
+                delete_kwargs.update(self._version_condition(expected_version))
+            self.table.delete_item(Key={"id": self.session_id}, **delete_kwargs)
             duration_ms = (time.time() - start_time) * 1000
 
             logger.info(
@@ -707,7 +976,15 @@ class SessionRepository:
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
 
-            if error_code == "AccessDeniedException":
+            if error_code == "ConditionalCheckFailedException":
+                logger.info(
+                    "Session was refreshed by another run, keeping it",
+                    operation="delete_session",
+                    context={**context, "expected_version": expected_version},
+                )
+                return False
+
+            elif error_code == "AccessDeniedException":
                 logger.error(
                     "Permission denied",
                     operation="delete_session",
@@ -733,3 +1010,15 @@ class SessionRepository:
                 error=str(e),
             )
             raise NetworkError(f"Network error: {e}")
+
+    @staticmethod
+    def _version_condition(expected_version: int) -> Dict[str, Any]:
+        """Build the ConditionExpression kwargs for a versioned session write."""
+        if expected_version == 0:
+            return {
+                "ConditionExpression": "attribute_not_exists(id) OR attribute_not_exists(version)"
+            }
+        return {
+            "ConditionExpression": "version = :expected",
+            "ExpressionAttributeValues": {":expected": expected_version},
+        }
@@ -56,3 +56,14 @@ class PermissionError(DynamoDBException):
     """
 
     pass
+
+
+class DuplicateBookingError(DynamoDBException):
+    """
+    Raised when a conditional create loses to an existing record.
+
+    Signals that another invocation already claimed the booking, so any
+    follow-up side effects (e.g. confirmation SMS) must not run again.
+    """
+
+    pass
@@ -0,0 +1,286 @@
+"""
+DynamoDB-backed run leases for overlapping Lambda invocations.
+
+Each invocation claims one shard of the configured stores by writing a lease
+item with a conditional put. Leases expire on their own, so a crashed
+invocation never blocks the next run for longer than the lease duration, and
+a heartbeat thread keeps the lease alive while a long run is still working.
+"""
+
+import threading
+import time
+import zlib
+from typing import Any, List, Optional, Sequence
+
+import boto3
+from botocore.exceptions import ClientError, BotoCoreError
+
+from src.utils.logger import get_logger
+from .exceptions import (
+    DynamoDBException,
+    NetworkError,
+    PermissionError,
+)
+
+
+logger = get_logger(__name__)
+
+
+def shard_lease_id(shard_index: int, shard_count: int) -> str:
+    """Return the lease key for a shard (e.g. "shard-0-of-4")."""
+    return f"shard-{shard_index}-of-{shard_count}"
+
+
+def shard_store_ids(store_ids: Sequence[str], shard_index: int, shard_count: int) -> List[str]:
+    """
+    Select the stores owned by a shard.
+
+    Stores are assigned round-robin over their sorted IDs so every invocation
+    computes the same assignment regardless of stores.yaml ordering.
+
+    Args:
+        store_ids: All configured store IDs
+        shard_index: Zero-based shard number
+        shard_count: Total number of shards
+
+    Returns:
+        Store IDs belonging to the shard, in sorted order
+
+    Raises:
+        ValueError: If shard_index/shard_count are out of range
+    """
+    if shard_count < 1:
+        raise ValueError(f"shard_count must be >= 1, got {shard_count}")
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard_index must be in [0, {shard_count}), got {shard_index}")
+
+    return sorted(store_ids)[shard_index::shard_count]
+
+
+class RunLeaseRepository:
+    """
+    Repository for run leases in DynamoDB.
+
+    Table Schema:
+        Partition Key: lease_id (e.g., "shard-0-of-2")
+        Attributes: owner (invocation ID), expires_at (epoch seconds),
+            heartbeat_at (epoch seconds)
+    """
+
+    def __init__(
+        self,
+        table_name: str = "run_lease",
+        dynamodb_resource: Optional[Any] = None,
+        lease_seconds: int = 300,
+    ):
+        """
+        Initialize RunLeaseRepository.
+
+        Args:
+            table_name: DynamoDB table name (default: "run_lease")
+            dynamodb_resource: boto3 DynamoDB resource (default: creates new)
+            lease_seconds: How long a lease stays valid without a heartbeat
+        """
+        self.table_name = table_name
+        self.dynamodb = dynamodb_resource or boto3.resource("dynamodb")
+        self.table = self.dynamodb.Table(table_name)
+        self.lease_seconds = lease_seconds
+
+    def acquire(self, lease_id: str, owner: str) -> bool:
+        """
+        Claim a lease if it is free or expired.
+
+        Args:
+            lease_id: Lease key
+            owner: Unique invocation identifier
+
+        Returns:
+            True if the lease was acquired, False if another owner holds it
+
+        Raises:
+            DynamoDBException: On DynamoDB errors
+            PermissionError: If IAM permissions are insufficient
+            NetworkError: If connection fails
+        """
+        now = int(time.time())
+        context = {"lease_id": lease_id, "owner": owner}
+
+        try:
+            self.table.put_item(
+                Item={
+                    "lease_id": lease_id,
+                    "owner": owner,
+                    "expires_at": now + self.lease_seconds,
+                    "heartbeat_at": now,
+                },
+                ConditionExpression="attribute_not_exists(lease_id) OR expires_at < :now",
+                ExpressionAttributeValues={":now": now},
+            )
+        except ClientError as e:
+            if self._is_condition_failure(e):
+                logger.info("Lease held by another run", operation="lease_acquire", context=context)
+                return False
+            self._raise_translated(e, "lease_acquire", context)
+        except (BotoCoreError, OSError) as e:
+            raise NetworkError(f"Network error: {e}")
+
+        logger.info("Lease acquired", operation="lease_acquire", context=context)
+        return True
+
+    def renew(self, lease_id: str, owner: str) -> bool:
+        """
+        Extend a lease held by owner.
+
+        Returns:
+            True if renewed, False if the lease was lost to another owner
+        """
+        now = int(time.time())
+        context = {"lease_id": lease_id, "owner": owner}
+
+        try:
+            self.table.update_item(
+                Key={"lease_id": lease_id},
+                UpdateExpression="SET expires_at = :exp, heartbeat_at = :now",
+                ConditionExpression="#owner = :owner",
+                ExpressionAttributeNames={"#owner": "owner"},
+                ExpressionAttributeValues={
+                    ":exp": now + self.lease_seconds,
+                    ":now": now,
+                    ":owner": owner,
+                },
+            )
+        except ClientError as e:
+            if self._is_condition_failure(e):
+                logger.warning("Lease lost before renewal", operation="lease_renew", context=context)
+                return False
+            self._raise_translated(e, "lease_renew", context)
+        except (BotoCoreError, OSError) as e:
+            raise NetworkError(f"Network error: {e}")
+
+        logger.debug("Lease renewed", operation="lease_renew", context=context)
+        return True
+
+    def release(self, lease_id: str, owner: str) -> bool:
+        """
+        Release a lease held by owner.
+
+        Returns:
+            True if released, False if owner no longer held the lease
+        """
+        context = {"lease_id": lease_id, "owner": owner}
+
+        try:
+            self.table.delete_item(
+                Key={"lease_id": lease_id},
+                ConditionExpression="#owner = :owner",
+                ExpressionAttributeNames={"#owner": "owner"},
+                ExpressionAttributeValues={":owner": owner},
+            )
+        except ClientError as e:
+            if self._is_condition_failure(e):
+                return False
+            self._raise_translated(e, "lease_release", context)
+        except (BotoCoreError, OSError) as e:
+            raise NetworkError(f"Network error: {e}")
+
+        logger.info("Lease released", operation="lease_release", context=context)
+        return True
+
+    def claim_shard(self, shard_count: int, owner: str) -> Optional[int]:
+        """
+        Claim the first free shard.
+
+        The search starts at a shard derived from owner so concurrent
+        invocations spread out instead of all contending for shard 0.
+
+        Returns:
+            Claimed shard index, or None if every shard is held
+        """
+        start = zlib.crc32(owner.encode("utf-8")) % shard_count
+        for offset in range(shard_count):
+            shard_index = (start + offset) % shard_count
+            if self.acquire(shard_lease_id(shard_index, shard_count), owner):
+                return shard_index
+        return None
+
+    @staticmethod
+    def _is_condition_failure(error: ClientError) -> bool:
+        return error.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+    @staticmethod
+    def _raise_translated(error: ClientError, operation: str, context: dict) -> None:
+        error_code = error.response.get("Error", {}).get("Code", "Unknown")
+        if error_code == "AccessDeniedException":
+            raise PermissionError(f"Insufficient IAM permissions: {error_code}")
+        logger.error("DynamoDB error", operation=operation, context=context, error=str(error))
+        raise DynamoDBException(f"DynamoDB error: {error}")
+
+
+class LeaseHeartbeat:
+    """
+    Background thread that renews a lease until stopped.
+
+    Usage:
+        heartbeat = LeaseHeartbeat(repo, lease_id, owner)
+        heartbeat.start()
+        try:
+            ...
+        finally:
+            heartbeat.stop(release=True)
+    """
+
+    def __init__(
+        self,
+        repository: RunLeaseRepository,
+        lease_id: str,
+        owner: str,
+        interval_seconds: Optional[float] = None,
+    ):
+        self.repository = repository
+        self.lease_id = lease_id
+        self.owner = owner
+        self.interval_seconds = (
+            interval_seconds
+            if interval_seconds is not None
+            else max(repository.lease_seconds / 3.0, 1.0)
+        )
+        self.lost = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start renewing the lease in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name=f"lease-heartbeat-{self.lease_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, release: bool = True) -> None:
+        """Stop the heartbeat and optionally release the lease."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds)
+        if release and not self.lost:
+            try:
+                self.repository.release(self.lease_id, self.owner)
+            except DynamoDBException as e:
+                logger.warning(
+                    "Failed to release lease; it will expire on its own",
+                    operation="lease_release",
+                    context={"lease_id": self.lease_id},
+                    error=str(e),
+                )
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                if not self.repository.renew(self.lease_id, self.owner):
+                    self.lost = True
+                    return
+            except DynamoDBException as e:
+                logger.warning(
+                    "Lease heartbeat failed",
+                    operation="lease_renew",
+                    context={"lease_id": self.lease_id},
+                    error=str(e),
+                )
@@ -7,7 +7,7 @@ for session reuse across Lambda invocations.
 
 import json
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 
 @dataclass
@@ -18,6 +18,11 @@ class Session:
     Attributes:
         id: Session ID (always '1' for single-record design in current implementation)
         cookies: JSON string representation of Selenium cookies
+        version: Monotonic write version used for conditional updates (None for legacy items)
+        updated_at: Epoch seconds of the last write
+        expires_at: Epoch seconds after which the cookies should be treated as stale
+        issued_at: Epoch seconds when these cookies were obtained by a fresh login
+        observed_lifetimes: Recent issue-to-401 lifetimes in seconds (oldest first)
 
     Design Note:
         DynamoDB session table uses a single record (id='1') currently.
@@ -27,6 +32,11 @@ class Session:
 
     id: str
     cookies: str
+    version: Optional[int] = None
+    updated_at: Optional[int] = None
+    expires_at: Optional[int] = None
+    issued_at: Optional[int] = None
+    observed_lifetimes: Optional[List[int]] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Session":
@@ -39,7 +49,19 @@ class Session:
         Returns:
             Session instance
         """
-        return cls(id=data.get("id", "1"), cookies=data.get("cookies", "[]"))
+        def _as_int(value: Any) -> Optional[int]:
+            # DynamoDB returns numbers as Decimal
+            return int(value) if value is not None else None
+
+        return cls(
+            id=data.get("id", "1"),
+            cookies=data.get("cookies", "[]"),
+            version=_as_int(data.get("version")),
+            updated_at=_as_int(data.get("updated_at")),
+            expires_at=_as_int(data.get("expires_at")),
+            issued_at=_as_int(data.get("issued_at")),
+            observed_lifetimes=[int(v) for v in data.get("observed_lifetimes") or []] or None,
+        )
 
     @classmethod
     def from_cookies_list(cls, cookies_list: List[Dict[str, Any]]) -> "Session":
@@ -62,7 +84,12 @@ class Session:
         Returns:
             Dictionary representation
         """
-        return {"id": self.id, "cookies": self.cookies}
+        data: Dict[str, Any] = {"id": self.id, "cookies": self.cookies}
+        for key in ("version", "updated_at", "expires_at", "issued_at", "observed_lifetimes"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        return data
 
     def get_cookies_list(self) -> List[Dict[str, Any]]:
         """
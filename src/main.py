@@ -7,27 +7,52 @@ Implements Story 4.1 requirements for end-to-end Lambda execution.
 
 import json
 import logging
+import threading
+import uuid
 from datetime import datetime, date
-from typing import List, Dict, Any, Tuple, Optional
+from typing import Callable, List, Dict, Any, Tuple, Optional
 import yaml
 from pathlib import Path
 
 import boto3
 import requests
 
+from src.auth.auth_profiler import AuthProfiler
 from src.auth.naver_login import NaverAuthenticator
 from src.auth.session_manager import SessionManager
-from src.api.naver_booking import NaverBookingAPIClient, NaverAuthenticationError
-from src.config.settings import Settings, setup_logging_redaction, SLACK_ENABLED
+from src.auth.partner_warmup import PartnerWarmupPlanner, reset_warmup_cache
+from src.api.naver_booking import FetchCheckpoint, NaverBookingAPIClient, NaverAuthenticationError
+from src.config.settings import (
+    Settings,
+    setup_logging_redaction,
+    SLACK_ENABLED,
+    RUN_LOCK_ENABLED,
+    RUN_SHARD_COUNT,
+    RUN_LEASE_SECONDS,
+    RUN_LEASE_TABLE,
+    RULE_CONDITION_ORDER,
+    RULE_MATCHER,
+    RULE_BATCH_EVALUATION,
+    RULE_LOG_MODE,
+    RULE_WORKERS,
+    RULE_ACTION_LIMITS,
+    RULE_ACTION_SCHEDULING,
+    RULES_SOURCE,
+)
 from src.database.dynamodb_client import BookingRepository
+from src.database.run_lease import LeaseHeartbeat, RunLeaseRepository, shard_lease_id, shard_store_ids
 from src.domain.booking import Booking
 from src.notifications.sms_service import SensSmsClient
 from src.notifications.slack_service import SlackWebhookClient, SlackServiceError
 from src.notifications.telegram_service import TelegramBotClient
-from src.rules.engine import RuleEngine, ActionResult
+from src.rules.engine import BatchMatchError, RuleEngine, ActionResult
 from src.rules.conditions import register_conditions
+from src.rules.artifact import ARTIFACT_NAME
+from src.rules.cache import cached_engine, rules_source
+from src.rules.concurrent import ConcurrentExecutor, parse_action_limits
 from src.rules.actions import (
     register_actions,
+    ActionServices,
     ActionServicesBundle,
     SlackTemplateLoader,
     TelegramTemplateLoader,
@@ -40,6 +65,9 @@ logger = get_logger(__name__)
 # AWS resources (initialized on cold start)
 dynamodb = boto3.resource("dynamodb", region_name="ap-northeast-2")
 
+# Services used by the cached engine's action executors; rebound every invocation
+action_services = ActionServices()
+
 
 def lambda_handler(event, context):
     """
@@ -100,34 +128,75 @@ def lambda_handler(event, context):
         # ============================================================
         # AC 2: Authentication - Naver login with cookie reuse (with resource cleanup)
         # ============================================================
+        auth_profiler = AuthProfiler()
         session_mgr = SessionManager(dynamodb)
-        cached_cookies = session_mgr.get_cookies()
+        with auth_profiler.step("cookie_load"):
+            cached_cookies = session_mgr.get_cookies()
 
         logger.info(f"Cached cookies: {len(cached_cookies) if cached_cookies else 0} found")
 
+        # Re-authenticate up front when the cookies are about to expire (or
+        # in the off-peak window) rather than failing mid-fetch
+        refresh_reason = session_mgr.refresh_reason() if cached_cookies else None
+        auth_profiler.refresh_reason = refresh_reason
+
         authenticator = NaverAuthenticator(
             username=naver_creds["username"],
             password=naver_creds["password"],
             session_manager=session_mgr,
         )
 
+        # Claim a shard of stores so overlapping invocations never duplicate work
+        shard_claim = _claim_run_shard(event, context, store_ids)
+        if shard_claim is None:
+            return {
+                "statusCode": 200,
+                "body": json.dumps(
+                    {
+                        "message": "Skipped: all run shards are held by other invocations",
+                        "skipped": True,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                ),
+            }
+        store_ids, lease_heartbeat = shard_claim
+
+        def _lease_lost() -> bool:
+            # Another invocation may now own this shard; stop before overlapping it
+            return lease_heartbeat is not None and lease_heartbeat.lost
+
         try:
-            cookies = authenticator.login(cached_cookies=cached_cookies)
-            logger.info(f"Authentication successful: {len(cookies)} cookies")
+            probe_store_id = store_ids[0] if store_ids else None
 
-            # Proactively warm partner session for first store to establish
-            # service-scoped cookies before API calls (reduces 401 risk)
-            try:
-                if store_ids:
-                    authenticator.ensure_partner_session_for_store(store_ids[0])
-            except Exception as warm_exc:
-                logger.warning(
-                    "Partner session warmup skipped due to error",
-                    operation="naver_auth_partner_warm",
-                    error=str(warm_exc),
-                )
+            def _login() -> List[Dict[str, Any]]:
+                if not refresh_reason:
+                    return authenticator.login(
+                        cached_cookies=cached_cookies, probe_store_id=probe_store_id
+                    )
+                try:
+                    refreshed = authenticator.login(cached_cookies=None)
+                    logger.info(
+                        "Proactive cookie refresh completed",
+                        operation="naver_auth_refresh",
+                        context={"reason": refresh_reason},
+                    )
+                    return refreshed
+                except Exception as refresh_exc:
+                    # The cached cookies have not expired yet - keep going with them
+                    logger.warning(
+                        "Proactive cookie refresh failed; using cached cookies",
+                        operation="naver_auth_refresh",
+                        context={"reason": refresh_reason},
+                        error=str(refresh_exc),
+                    )
+                    return authenticator.login(
+                        cached_cookies=cached_cookies, probe_store_id=probe_store_id
+                    )
 
-            api_session = authenticator.get_session()
+            with auth_profiler.step("login"):
+                cookies = _login()
+            auth_profiler.sample_browser(authenticator.driver)
+            logger.info(f"Authentication successful: {len(cookies)} cookies")
 
             # ============================================================
             # AC 3: Booking retrieval orchestration
@@ -135,13 +204,39 @@ def lambda_handler(event, context):
             # Initialize repository first for RC08 date filtering
             booking_repo = BookingRepository(table_name="sms", dynamodb_resource=dynamodb)
 
+            # Pages fetched before a mid-run re-authentication are kept here,
+            # so the retry only downloads the remaining (store, status, page) units
+            fetch_checkpoint = FetchCheckpoint()
+
             def _create_booking_client(session: requests.Session) -> NaverBookingAPIClient:
                 return NaverBookingAPIClient(
                     session=session,
                     option_keywords=["네이버", "인스타", "원본"],
                     booking_repo=booking_repo,
+                    checkpoint=fetch_checkpoint,
+                    should_stop=_lease_lost,
                 )
 
+            # Establish partner service cookies only for stores that need them
+            # (HTTP probes first, at most one browser navigation; cached
+            # across warm invocations while the cookies stay valid)
+            warmup_planner = PartnerWarmupPlanner(authenticator, _create_booking_client)
+
+            def _prepare_session(session: requests.Session, force: bool = False) -> requests.Session:
+                try:
+                    return warmup_planner.ensure_ready(store_ids, session, force=force).session
+                except Exception as warm_exc:
+                    logger.warning(
+                        "Partner session warmup skipped due to error",
+                        operation="naver_auth_partner_warm",
+                        error=str(warm_exc),
+                    )
+                    return session
+
+            with auth_profiler.step("get_session"):
+                initial_session = authenticator.get_session()
+            with auth_profiler.step("partner_warmup"):
+                api_session = _prepare_session(initial_session)
             booking_api = _create_booking_client(api_session)
 
             def _fetch_all_bookings(client: NaverBookingAPIClient) -> Tuple[List[Booking], List[Booking]]:
@@ -162,56 +257,52 @@ def lambda_handler(event, context):
                     context={
                         "store_id": getattr(auth_err, "store_id", None),
                         "status_code": getattr(auth_err, "status_code", None),
+                        "completed_units": fetch_checkpoint.completed_units,
                     },
                     error=str(auth_err),
                 )
 
+                session_mgr.record_auth_failure()
                 session_mgr.clear_cookies()
-
-                cookies = authenticator.login(cached_cookies=None)
+                reset_warmup_cache()
+
+                auth_profiler.reauthenticated = True
+                with auth_profiler.step("reauth"):
+                    cookies = authenticator.login(cached_cookies=None)
+                    logger.info(
+                        f"Re-authentication successful: {len(cookies)} cookies",
+                        operation="naver_auth_retry",
+                    )
+                    refreshed_session = _prepare_session(authenticator.get_session(), force=True)
+                booking_api = _create_booking_client(refreshed_session)
+                confirmed_bookings, completed_bookings = _fetch_all_bookings(booking_api)
                 logger.info(
-                    f"Re-authentication successful: {len(cookies)} cookies",
+                    "Resumed booking fetch after re-authentication",
                     operation="naver_auth_retry",
+                    context={
+                        "resumed_units": fetch_checkpoint.resumed_units,
+                        "completed_units": fetch_checkpoint.completed_units,
+                    },
                 )
 
-                # Warm partner session again after re-auth
-                try:
-                    if store_ids:
-                        authenticator.ensure_partner_session_for_store(store_ids[0])
-                except Exception as warm_exc:
-                    logger.warning(
-                        "Partner session warmup skipped after re-auth",
-                        operation="naver_auth_partner_warm",
-                        error=str(warm_exc),
-                    )
+            _emit_auth_profile(auth_profiler, authenticator)
 
-                refreshed_session = authenticator.get_session()
-                booking_api = _create_booking_client(refreshed_session)
-                try:
-                    confirmed_bookings, completed_bookings = _fetch_all_bookings(booking_api)
-                except NaverAuthenticationError as second_err:
-                    # Final fallback: warm partner domain for the affected store and retry once
-                    fallback_store = (
-                        getattr(second_err, "store_id", None) or (store_ids[0] if store_ids else None)
-                    )
-                    if fallback_store:
-                        logger.info(
-                            "Warming partner session and retrying after second auth failure",
-                            operation="naver_auth_partner_warm",
-                            context={"store_id": fallback_store},
-                        )
-                        try:
-                            authenticator.ensure_partner_session_for_store(fallback_store)
-                        except Exception as warm_err:
-                            logger.warning(
-                                "Partner warmup encountered an error; proceeding to final retry",
-                                operation="naver_auth_partner_warm",
-                                error=str(warm_err),
-                            )
-
-                        warmed_session = authenticator.get_session()
-                        booking_api = _create_booking_client(warmed_session)
-                        confirmed_bookings, completed_bookings = _fetch_all_bookings(booking_api)
+            if _lease_lost():
+                logger.warning(
+                    "Run shard lease lost; stopping before processing bookings",
+                    operation="run_shard_lost",
+                    context={"stores": len(store_ids)},
+                )
+                return {
+                    "statusCode": 200,
+                    "body": json.dumps(
+                        {
+                            "message": "Stopped: run shard lease was lost",
+                            "lease_lost": True,
+                            "timestamp": datetime.now().isoformat(),
+                        }
+                    ),
+                }
 
             # Combine all bookings
             all_bookings = confirmed_bookings + completed_bookings
@@ -220,14 +311,7 @@ def lambda_handler(event, context):
             # ============================================================
             # AC 5: Rule engine setup and executor registration
             # ============================================================
-            # Initialize rule engine
-            rules_path = config_root / "rules.yaml"
-            engine = RuleEngine(str(rules_path))
-
-            # Register condition evaluators
-            register_conditions(engine, settings)
-
-            # Register action executors with services bundle
+            # Action services for this invocation
             sms_service = SensSmsClient(settings=settings, credentials=sens_creds)
 
             # Initialize Slack services if enabled (Story 6.2, 6.1)
@@ -308,7 +392,22 @@ def lambda_handler(event, context):
                 telegram_service=telegram_service,
             )
 
-            register_actions(engine, services_bundle)
+            # Executors registered on the cached engine use this run's services
+            action_services.bind(services_bundle)
+
+            # Initialize rule engine: parsed rules, registered evaluators/executors
+            # and compiled plans are reused across warm invocations until the
+            # rules document changes
+            engine = cached_engine(
+                rules_source(RULES_SOURCE, config_root / "rules.yaml"),
+                setup=lambda new_engine: _setup_engine(new_engine, settings),
+                build=RuleEngine,
+                artifact_path=config_root / ARTIFACT_NAME,
+                condition_order=RULE_CONDITION_ORDER,
+                matcher=RULE_MATCHER,
+                log_mode=RULE_LOG_MODE,
+                action_scheduling=RULE_ACTION_SCHEDULING,
+            )
 
             logger.info("Rule engine initialized with conditions and actions")
 
@@ -408,8 +507,12 @@ def lambda_handler(event, context):
             }
 
         finally:
+            # Auth failures still get their profile record (no-op if already logged)
+            _emit_auth_profile(auth_profiler, authenticator)
             # QA Fix: Always cleanup Selenium resources, even on errors
             authenticator.cleanup()
+            if lease_heartbeat is not None:
+                lease_heartbeat.stop(release=True)
 
     except Exception as e:
         # ============================================================
@@ -477,6 +580,79 @@ def lambda_handler(event, context):
         }
 
 
+def _emit_auth_profile(profiler: AuthProfiler, authenticator: NaverAuthenticator) -> None:
+    """Log the per-run auth profile record; diagnostics never fail the run."""
+    if profiler.emitted:
+        return
+    try:
+        profiler.sample_browser(authenticator.driver)
+        profiler.emit(authenticator.startup_summary())
+    except Exception as exc:
+        logger.warning(
+            "Failed to record auth profile",
+            operation="auth_profile",
+            error=str(exc),
+        )
+
+
+def _claim_run_shard(
+    event: Any, context: Any, store_ids: List[str]
+) -> Optional[Tuple[List[str], Optional[LeaseHeartbeat]]]:
+    """
+    Resolve which stores this invocation processes.
+
+    The event may pin a shard with ``shard_index``/``shard_count``; otherwise
+    RUN_SHARD_COUNT is used. With RUN_LOCK_ENABLED the shard is claimed
+    through the run_lease table and kept alive by a heartbeat thread.
+
+    Returns:
+        (store_ids, heartbeat) for the claimed shard, or None when every
+        shard is already held by another invocation
+    """
+    event = event if isinstance(event, dict) else {}
+    shard_count = int(event.get("shard_count", RUN_SHARD_COUNT))
+    pinned_index = event.get("shard_index")
+
+    if not RUN_LOCK_ENABLED:
+        if pinned_index is None:
+            return store_ids, None
+        return shard_store_ids(store_ids, int(pinned_index), shard_count), None
+
+    owner = getattr(context, "aws_request_id", None) if context else None
+    owner = owner or f"local-{uuid.uuid4()}"
+    lease_repo = RunLeaseRepository(
+        table_name=RUN_LEASE_TABLE,
+        dynamodb_resource=dynamodb,
+        lease_seconds=RUN_LEASE_SECONDS,
+    )
+
+    if pinned_index is not None:
+        shard_index: Optional[int] = int(pinned_index)
+        if not lease_repo.acquire(shard_lease_id(shard_index, shard_count), owner):
+            shard_index = None
+    else:
+        shard_index = lease_repo.claim_shard(shard_count, owner)
+
+    if shard_index is None:
+        logger.info(
+            "No free run shard; skipping invocation",
+            operation="run_shard_claim",
+            context={"shard_count": shard_count, "owner": owner},
+        )
+        return None
+
+    heartbeat = LeaseHeartbeat(lease_repo, shard_lease_id(shard_index, shard_count), owner)
+    heartbeat.start()
+
+    shard_stores = shard_store_ids(store_ids, shard_index, shard_count)
+    logger.info(
+        f"Claimed run shard {shard_index + 1}/{shard_count} with {len(shard_stores)} stores",
+        operation="run_shard_claim",
+        context={"shard_index": shard_index, "shard_count": shard_count, "owner": owner},
+    )
+    return shard_stores, heartbeat
+
+
 def _build_expert_correction_roster(bookings: List[Booking]) -> List[Dict[str, Any]]:
     """
     Build Slack digest roster for bookings that include expert correction requests.
@@ -654,6 +830,15 @@ def _build_store_context(
     return context
 
 
+def _setup_engine(engine: RuleEngine, settings: Settings) -> None:
+    """Register evaluators and executors on a newly built engine and compile it."""
+    register_conditions(engine, settings)
+    register_actions(engine, action_services)
+
+    # Bind evaluators/executors once; unknown rule types fail here
+    engine.compile()
+
+
 def process_all_bookings(
     bookings: List[Booking],
     engine: RuleEngine,
@@ -693,6 +878,41 @@ def process_all_bookings(
     expert_correction_roster = _build_expert_correction_roster(bookings)
     holiday_event_roster = _build_holiday_event_roster(bookings, engine)
 
+    def build_context(
+        booking: Booking, db_record: Any, db_repo: BookingRepository = booking_repo
+    ) -> Dict[str, Any]:
+        return {
+            "booking": booking,
+            "db_record": db_record,
+            "current_time": current_time,
+            "settings": settings,
+            "db_repo": db_repo,
+            "bookings_with_expert_correction": expert_correction_roster,
+            "bookings_in_date_range": holiday_event_roster,
+            "store": _build_store_context(booking, stores_config),
+        }
+
+    if RULE_BATCH_EVALUATION and engine.plans is not None:
+        for results in _process_bookings_batched(bookings, engine, booking_repo, build_context):
+            if results is None:
+                summary["actions_failed"] += 1
+                continue
+            all_results.extend(results)
+            _tally_results(summary, results)
+        engine.flush_log_summary()
+        return all_results, summary
+
+    if RULE_WORKERS > 1:
+        outcome = _process_bookings_concurrently(bookings, engine, booking_repo, build_context)
+        for results in outcome:
+            if results is None:
+                summary["actions_failed"] += 1
+                continue
+            all_results.extend(results)
+            _tally_results(summary, results)
+        engine.flush_log_summary()
+        return all_results, summary
+
     for booking in bookings:
         try:
             # ============================================================
@@ -702,18 +922,7 @@ def process_all_bookings(
             db_record = booking_repo.get_booking(booking.booking_num, booking.phone)
 
             # Build context dict
-            store_context = _build_store_context(booking, stores_config)
-
-            context = {
-                "booking": booking,
-                "db_record": db_record,
-                "current_time": current_time,
-                "settings": settings,
-                "db_repo": booking_repo,
-                "bookings_with_expert_correction": expert_correction_roster,
-                "bookings_in_date_range": holiday_event_roster,
-                "store": store_context,
-            }
+            context = build_context(booking, db_record)
 
             logger.debug(
                 f"Processing booking {booking.booking_num}",
@@ -727,24 +936,157 @@ def process_all_bookings(
             all_results.extend(results)
 
             # Update summary statistics
-            summary["bookings_processed"] += 1
-            summary["actions_executed"] += len(results)
-
-            for result in results:
-                if result.success:
-                    summary["actions_succeeded"] += 1
-                    if result.action_type == "send_sms":
-                        summary["sms_sent"] += 1
-                else:
-                    summary["actions_failed"] += 1
+            _tally_results(summary, results)
 
         except Exception as e:
             logger.error(f"Failed to process booking {booking.booking_num}: {e}", error=str(e))
             summary["actions_failed"] += 1
 
+    # One record with per-rule match / failed-condition counts for the run
+    engine.flush_log_summary()
     return all_results, summary
 
 
+def _tally_results(summary: Dict[str, Any], results: List[ActionResult]) -> None:
+    """Add one booking's action results to the run summary."""
+    summary["bookings_processed"] += 1
+    summary["actions_executed"] += len(results)
+
+    for result in results:
+        if result.success:
+            summary["actions_succeeded"] += 1
+            if result.action_type == "send_sms":
+                summary["sms_sent"] += 1
+        else:
+            summary["actions_failed"] += 1
+
+
+def _process_bookings_batched(
+    bookings: List[Booking],
+    engine: RuleEngine,
+    booking_repo: BookingRepository,
+    build_context: Callable[[Booking, Any], Dict[str, Any]],
+) -> List[Optional[List[ActionResult]]]:
+    """
+    Batch evaluation (RULE_BATCH_EVALUATION=true) for large replays.
+
+    DB records are prefetched with BatchGetItem and the engine evaluates each
+    wave of bookings at once. A booking that appears again in the list goes
+    into a later wave, after the earlier occurrence's actions have written
+    its record, which keeps per-booking results identical.
+
+    Returns:
+        Action results per booking in input order (None if the booking failed)
+    """
+    waves: List[List[int]] = []
+    seen: Dict[Tuple[str, str], int] = {}
+    for position, booking in enumerate(bookings):
+        key = (booking.booking_num, booking.phone)
+        wave = seen.get(key, -1) + 1
+        seen[key] = wave
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(position)
+
+    outcome: List[Optional[List[ActionResult]]] = [None] * len(bookings)
+    for wave in waves:
+        wave_bookings = [bookings[position] for position in wave]
+        keys = [(booking.booking_num, booking.phone) for booking in wave_bookings]
+        try:
+            records = booking_repo.batch_get_bookings(keys)
+        except Exception as e:
+            logger.error(
+                "Batch prefetch failed; processing wave per booking",
+                operation="process_bookings_batched",
+                error=str(e),
+            )
+            records = None
+
+        positions: List[int] = []
+        contexts: List[Dict[str, Any]] = []
+        for position, booking, key in zip(wave, wave_bookings, keys):
+            try:
+                db_record = (
+                    records.get(key)
+                    if records is not None
+                    else booking_repo.get_booking(booking.booking_num, booking.phone)
+                )
+                contexts.append(build_context(booking, db_record))
+                positions.append(position)
+            except Exception as e:
+                logger.error(f"Failed to process booking {booking.booking_num}: {e}", error=str(e))
+
+        try:
+            wave_results = engine.process_batch(contexts)
+        except BatchMatchError as e:
+            # Masks failed before any action ran, so each booking runs once here
+            logger.error(
+                "Batch evaluation failed; processing wave per booking",
+                operation="process_bookings_batched",
+                error=str(e),
+            )
+            for position, context in zip(positions, contexts):
+                try:
+                    outcome[position] = engine.process_booking(context)
+                except Exception as e:
+                    booking_num = context["booking"].booking_num
+                    logger.error(f"Failed to process booking {booking_num}: {e}", error=str(e))
+            continue
+        except Exception as e:
+            # Actions may already have run; re-running them would send twice
+            logger.error(
+                "Batch processing failed after actions started; wave not retried",
+                operation="process_bookings_batched",
+                error=str(e),
+            )
+            continue
+
+        for position, results in zip(positions, wave_results):
+            outcome[position] = results
+
+    return outcome
+
+
+def _process_bookings_concurrently(
+    bookings: List[Booking],
+    engine: RuleEngine,
+    booking_repo: BookingRepository,
+    build_context: Callable[..., Dict[str, Any]],
+) -> List[Optional[List[ActionResult]]]:
+    """
+    Process bookings on RULE_WORKERS threads (RULE_WORKERS > 1).
+
+    Each booking fetches its DB record and runs its actions in declared
+    order on one worker; a booking listed twice runs both times on the same
+    worker, in order. RULE_ACTION_LIMITS caps concurrent actions per type.
+    boto3 resources are not thread-safe, so every worker thread reads and
+    writes through its own copy of the repository.
+
+    Returns:
+        Action results per booking in input order (None if the booking failed)
+    """
+    executor = ConcurrentExecutor(
+        engine,
+        max_workers=RULE_WORKERS,
+        action_limits=parse_action_limits(RULE_ACTION_LIMITS),
+    )
+
+    worker = threading.local()
+
+    def process(booking: Booking) -> Optional[List[ActionResult]]:
+        try:
+            db_repo = getattr(worker, "db_repo", None)
+            if db_repo is None:
+                db_repo = worker.db_repo = booking_repo.for_worker_thread()
+            db_record = db_repo.get_booking(booking.booking_num, booking.phone)
+            return engine.process_booking(build_context(booking, db_record, db_repo))
+        except Exception as e:
+            logger.error(f"Failed to process booking {booking.booking_num}: {e}", error=str(e))
+            return None
+
+    return executor.map(bookings, process, key=lambda booking: (booking.booking_num, booking.phone))
+
+
 def send_telegram_summary(
     telegram_creds: Optional[Dict[str, str]],
     summary: Dict[str, Any],
@@ -4,6 +4,7 @@ from .engine import RuleEngine, RuleConfig, ConditionConfig, ActionConfig, Actio
 from .context import build_context
 from .actions import (
     ActionContext,
+    ActionServices,
     ActionServicesBundle,
     ActionExecutionError,
     send_sms,
@@ -25,6 +26,7 @@ __all__ = [
     "ActionResult",
     "build_context",
     "ActionContext",
+    "ActionServices",
     "ActionServicesBundle",
     "ActionExecutionError",
     "send_sms",
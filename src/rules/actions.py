@@ -19,9 +19,10 @@ Acceptance Criteria Coverage:
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Union, cast
 
 from src.database.dynamodb_client import BookingRepository
+from src.database.exceptions import DuplicateBookingError
 from src.domain.booking import Booking
 from src.utils.logger import StructuredLogger
 
@@ -455,6 +456,35 @@ class ActionServicesBundle:
     telegram_service: Optional[Any] = None
 
 
+class ActionServices:
+    """
+    Swappable holder for the current run's ActionServicesBundle.
+
+    Executors registered with a holder look the bundle up on every call, so
+    a cached engine keeps its registered executors and compiled plans across
+    warm invocations while each invocation binds its own services.
+    """
+
+    def __init__(self, bundle: Optional[ActionServicesBundle] = None):
+        self._bundle = bundle
+
+    def bind(self, bundle: ActionServicesBundle) -> None:
+        """Use `bundle` for every action executed from now on."""
+        self._bundle = bundle
+
+    @property
+    def current(self) -> ActionServicesBundle:
+        """
+        The bound bundle.
+
+        Raises:
+            RuntimeError: If no bundle has been bound yet
+        """
+        if self._bundle is None:
+            raise RuntimeError("No action services bound; call ActionServices.bind() first")
+        return self._bundle
+
+
 # ============================================================================
 # SMS Action Executor (AC2)
 # ============================================================================
@@ -589,6 +619,8 @@ def send_sms(
 def create_db_record(
     context: ActionContext,
     booking_data: Optional[Dict[str, Any]] = None,
+    flags: Optional[Dict[str, bool]] = None,
+    if_absent: bool = False,
 ) -> None:
     """
     Create a new booking record in DynamoDB.
@@ -605,14 +637,21 @@ def create_db_record(
     Args:
         context: ActionContext with booking and db_repo
         booking_data: Optional override dict (for testing). If None, uses context.booking
+        flags: Initial SMS flag values written with the record (e.g. {"confirm_sms": True})
+        if_absent: Use a conditional create so only one invocation can claim the booking
 
     Raises:
-        ActionExecutionError: Wraps DynamoDB exceptions with context
+        ActionExecutionError: Wraps DynamoDB exceptions with context. When
+            if_absent is set and the record already exists, wraps
+            DuplicateBookingError.
 
     Example:
         context = ActionContext(...)
         create_db_record(context)
         # Creates record with all booking fields persisted
+
+        create_db_record(context, flags={"confirm_sms": True}, if_absent=True)
+        # Single conditional put with the final flag state
     """
     booking = context.booking
     logger = context.logger
@@ -697,6 +736,16 @@ def create_db_record(
         else:
             record = dict(booking_data)
 
+        # Apply initial flag state so the record is written once in its final form
+        if flags:
+            valid_flags = {"confirm_sms", "remind_sms", "option_sms"}
+            for flag_key, flag_state in flags.items():
+                if flag_key not in valid_flags:
+                    raise ValueError(
+                        f"Invalid flag name '{flag_key}'. Must be one of: {valid_flags}"
+                    )
+                record[flag_key] = bool(flag_state)
+
         # Remove disallowed columns regardless of data source
         for disallowed in (
             "book_id",
@@ -716,8 +765,21 @@ def create_db_record(
             record = {key: value for key, value in record.items() if key != "booking_num"}
             record["booking_num"] = booking_num_value
 
-        # Create the record
-        db_repo.create_booking(record)
+        # Create the record (conditionally when claiming the booking)
+        if if_absent:
+            create_if_absent = getattr(db_repo, "create_booking_if_absent", None)
+            if create_if_absent is None:
+                # An unconditional create would drop the exactly-once guarantee
+                raise ValueError(
+                    "if_absent requires a repository with create_booking_if_absent(); "
+                    f"{type(db_repo).__name__} has none"
+                )
+            if create_if_absent(record) is False:
+                raise DuplicateBookingError(
+                    f"Booking {booking.booking_num} already exists; claimed by another run"
+                )
+        else:
+            db_repo.create_booking(record)
 
         logger.info(
             "Booking record created",
@@ -725,6 +787,20 @@ def create_db_record(
             context=log_context,
         )
 
+    except DuplicateBookingError as e:
+        logger.warning(
+            "Booking record already exists, skipping",
+            operation=operation,
+            context={**log_context, "status": "skipped", "reason": "already_exists"},
+            error=str(e),
+        )
+        raise ActionExecutionError(
+            executor_name="create_db_record",
+            booking_id=booking.booking_num,
+            original_error=e,
+            context_data={"booking_data_provided": booking_data is not None, "if_absent": True},
+        ) from e
+
     except Exception as e:
         logger.error(
             "Failed to create booking record",
@@ -747,6 +823,7 @@ def update_flag(
     *,
     flag_name: Optional[str] = None,
     flag_value: Optional[bool] = None,
+    known_flags: Optional[Dict[str, bool]] = None,
 ) -> None:
     """
     Update a single DynamoDB boolean flag on a booking.
@@ -761,6 +838,8 @@ def update_flag(
         value: New flag value (default True when omitted)
         flag_name: Backwards-compatible alias for `flag`
         flag_value: Backwards-compatible alias for `value`
+        known_flags: Flag state already written in this run (e.g. by
+            create_db_record). Used in place of the idempotency read when present.
 
     Raises:
         ActionExecutionError: Wraps DynamoDB exceptions with context
@@ -804,18 +883,24 @@ def update_flag(
             context=log_context,
         )
 
-        # Fetch current record to check idempotency
-        current = db_repo.get_booking(booking.booking_num, booking.phone)
+        if known_flags is not None and effective_flag in known_flags:
+            # State was written earlier in this run - no need to read it back
+            current_value = known_flags[effective_flag]
+        else:
+            # Fetch current record to check idempotency
+            current = db_repo.get_booking(booking.booking_num, booking.phone)
 
-        # If record doesn't exist, can't update - this is an error
-        if current is None:
-            raise ValueError(f"Cannot update flag on non-existent booking {booking.booking_num}")
+            # If record doesn't exist, can't update - this is an error
+            if current is None:
+                raise ValueError(
+                    f"Cannot update flag on non-existent booking {booking.booking_num}"
+                )
 
-        # Extract flag value from current record (handle both dict and Booking types)
-        if isinstance(current, dict):
-            current_value = current.get(effective_flag, False)
-        else:
-            current_value = getattr(current, effective_flag, False)
+            # Extract flag value from current record (handle both dict and Booking types)
+            if isinstance(current, dict):
+                current_value = current.get(effective_flag, False)
+            else:
+                current_value = getattr(current, effective_flag, False)
 
         # Idempotency check: if already set to desired value, skip update
         if current_value == desired_value:
@@ -1303,7 +1388,9 @@ def log_event(
 # ============================================================================
 
 
-def register_actions(engine: Any, services: ActionServicesBundle) -> None:
+def register_actions(
+    engine: Any, services: Union[ActionServicesBundle, ActionServices]
+) -> None:
     """
     Register all action executors with the rule engine.
 
@@ -1313,11 +1400,14 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
 
     Args:
         engine: RuleEngine instance (from src/rules/engine.py)
-        services: ActionServicesBundle with all required services
+        services: ActionServicesBundle with all required services, or an
+            ActionServices holder whose bound bundle is looked up per action
 
     Note:
         Uses partial function application to inject services into executors.
         This is done so executors don't need to know about service singletons.
+        With a holder, rebinding it swaps the services without registering
+        (and compiling) again.
 
     Example:
         from src.rules.engine import RuleEngine
@@ -1338,12 +1428,13 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
         )
         register_actions(engine, services)
     """
-    logger = services.logger
+    holder = services if isinstance(services, ActionServices) else ActionServices(services)
+    logger = holder.current.logger
 
     operation = "register_actions"
     log_context = {
         "action_count": 6,
-        "slack_enabled": services.settings_dict.get("slack_enabled", False),
+        "slack_enabled": holder.current.settings_dict.get("slack_enabled", False),
     }
 
     try:
@@ -1355,6 +1446,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
 
         # Create wrapper functions that bind services to context
         def send_sms_wrapper(rule_context: Dict[str, Any], **params: Any) -> None:
+            services = holder.current
             booking = rule_context.get("booking")
             if booking is None:
                 raise ValueError("Booking not found in rule context")
@@ -1362,7 +1454,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             action_context = ActionContext(
                 booking=booking,
                 settings_dict=services.settings_dict,
-                db_repo=services.db_repo,
+                db_repo=rule_context.get("db_repo") or services.db_repo,
                 sms_service=services.sms_service,
                 slack_service=services.slack_service,
                 slack_template_loader=services.slack_template_loader,
@@ -1373,6 +1465,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             send_sms(action_context, **params)
 
         def create_db_record_wrapper(rule_context: Dict[str, Any], **params: Any) -> None:
+            services = holder.current
             booking = rule_context.get("booking")
             if booking is None:
                 raise ValueError("Booking not found in rule context")
@@ -1380,7 +1473,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             action_context = ActionContext(
                 booking=booking,
                 settings_dict=services.settings_dict,
-                db_repo=services.db_repo,
+                db_repo=rule_context.get("db_repo") or services.db_repo,
                 sms_service=services.sms_service,
                 slack_service=services.slack_service,
                 slack_template_loader=services.slack_template_loader,
@@ -1390,7 +1483,19 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             )
             create_db_record(action_context, **params)
 
+            # Remember the flag state just written so update_flag can skip its read
+            if params.get("booking_data") is None:
+                written_flags = {
+                    flag: bool(getattr(booking, flag, False))
+                    for flag in ("confirm_sms", "remind_sms", "option_sms")
+                }
+                written_flags.update(
+                    {key: bool(value) for key, value in (params.get("flags") or {}).items()}
+                )
+                rule_context["created_record_flags"] = written_flags
+
         def update_flag_wrapper(rule_context: Dict[str, Any], **params: Any) -> None:
+            services = holder.current
             booking = rule_context.get("booking")
             if booking is None:
                 raise ValueError("Booking not found in rule context")
@@ -1398,7 +1503,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             action_context = ActionContext(
                 booking=booking,
                 settings_dict=services.settings_dict,
-                db_repo=services.db_repo,
+                db_repo=rule_context.get("db_repo") or services.db_repo,
                 sms_service=services.sms_service,
                 slack_service=services.slack_service,
                 slack_template_loader=services.slack_template_loader,
@@ -1406,9 +1511,19 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
                 telegram_service=services.telegram_service,
                 logger=services.logger,
             )
-            update_flag(action_context, **params)
+            known_flags = rule_context.get("created_record_flags")
+            update_flag(action_context, known_flags=known_flags, **params)
+
+            if known_flags is not None:
+                flag = params.get("flag_name") or params.get("flag")
+                if flag in known_flags:
+                    value = params.get("flag_value")
+                    if value is None:
+                        value = params.get("value")
+                    known_flags[flag] = True if value is None else bool(value)
 
         def send_telegram_wrapper(rule_context: Dict[str, Any], **params: Any) -> None:
+            services = holder.current
             booking = rule_context.get("booking")
             if booking is None:
                 raise ValueError("Booking not found in rule context")
@@ -1416,7 +1531,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             action_context = ActionContext(
                 booking=booking,
                 settings_dict=services.settings_dict,
-                db_repo=services.db_repo,
+                db_repo=rule_context.get("db_repo") or services.db_repo,
                 sms_service=services.sms_service,
                 slack_service=services.slack_service,
                 slack_template_loader=services.slack_template_loader,
@@ -1452,6 +1567,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             send_telegram(action_context, **resolved_params)
 
         def send_slack_wrapper(rule_context: Dict[str, Any], **params: Any) -> None:
+            services = holder.current
             booking = rule_context.get("booking")
             if booking is None:
                 raise ValueError("Booking not found in rule context")
@@ -1459,7 +1575,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             action_context = ActionContext(
                 booking=booking,
                 settings_dict=services.settings_dict,
-                db_repo=services.db_repo,
+                db_repo=rule_context.get("db_repo") or services.db_repo,
                 sms_service=services.sms_service,
                 slack_service=services.slack_service,
                 slack_template_loader=services.slack_template_loader,
@@ -1489,6 +1605,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             send_slack(action_context, **resolved_params)
 
         def log_event_wrapper(rule_context: Dict[str, Any], **params: Any) -> None:
+            services = holder.current
             booking = rule_context.get("booking")
             if booking is None:
                 raise ValueError("Booking not found in rule context")
@@ -1496,7 +1613,7 @@ def register_actions(engine: Any, services: ActionServicesBundle) -> None:
             action_context = ActionContext(
                 booking=booking,
                 settings_dict=services.settings_dict,
-                db_repo=services.db_repo,
+                db_repo=rule_context.get("db_repo") or services.db_repo,
                 sms_service=services.sms_service,
                 slack_service=services.slack_service,
                 slack_template_loader=services.slack_template_loader,
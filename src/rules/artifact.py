@@ -0,0 +1,187 @@
+"""
+Precompiled Rules Artifact - Validate once at build time, skip YAML at runtime
+
+Parsing rules.yaml with PyYAML's pure-Python loader (and validating it
+against rules.schema.json) costs cold-start time on every new Lambda
+container. build_rules_artifact() does that work once, at image build time
+(scripts/build_rules_artifact.py): it validates rules.yaml against the schema
+and through RuleEngine's own rule parser, checks the SMS/Telegram/Slack
+template YAMLs, and returns a compact JSON snapshot of the parsed rules
+tagged with the SHA-256 of each source file.
+
+At runtime cached_engine() (src/rules/cache.py) loads the snapshot and hands
+the parsed rules to RuleEngine when the snapshot's rules hash matches the
+rules document it just read. A missing, stale or unreadable artifact is
+ignored and the document is parsed as before, so editing rules.yaml (or
+serving rules from S3) never runs against outdated rules.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+import jsonschema
+import yaml
+
+from ..utils.logger import get_logger
+from .engine import RuleEngine
+
+logger = get_logger(__name__)
+
+ARTIFACT_VERSION = 1
+ARTIFACT_NAME = "rules.compiled.json"
+DEFAULT_SCHEMA_PATH = Path(__file__).resolve().parents[1] / "config" / "rules.schema.json"
+
+
+def document_hash(document: str) -> str:
+    """SHA-256 of a rules document."""
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+def _check_sms_templates(content: Dict[str, Any]) -> None:
+    templates = content.get("templates")
+    if not isinstance(templates, dict) or not templates:
+        raise ValueError("templates section missing in sms_templates.yaml")
+    for name, template in templates.items():
+        if not isinstance(template, dict):
+            raise ValueError(f"SMS template '{name}' must be a mapping")
+        missing = [key for key in ("type", "contentType", "subject") if key not in template]
+        if "content" not in template and "stores" not in template:
+            missing.append("content")
+        if missing:
+            raise ValueError(f"SMS template '{name}' missing: {', '.join(missing)}")
+
+
+def _check_telegram_templates(content: Dict[str, Any]) -> None:
+    for name, template in content.items():
+        if not isinstance(template, str) and not (
+            isinstance(template, dict) and "text" in template
+        ):
+            raise ValueError(
+                f"Telegram template '{name}' must be a string or a mapping with 'text'"
+            )
+
+
+def _check_slack_templates(content: Dict[str, Any]) -> None:
+    for name, template in content.items():
+        if not isinstance(template, str):
+            raise ValueError(f"Slack template '{name}' must be a string")
+
+
+# Template file -> structural check (files that do not exist are skipped)
+TEMPLATE_CHECKS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "sms_templates.yaml": _check_sms_templates,
+    "telegram_templates.yaml": _check_telegram_templates,
+    "slack_templates.yaml": _check_slack_templates,
+}
+
+
+def _load_yaml(path: Path) -> Any:
+    try:
+        return yaml.safe_load(path.read_text(encoding="utf-8"))
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in {path}: {e}") from e
+
+
+def build_rules_artifact(
+    config_root: Union[str, Path], schema_path: Union[str, Path] = DEFAULT_SCHEMA_PATH
+) -> Dict[str, Any]:
+    """
+    Validate rules.yaml and the template YAMLs under `config_root` and
+    snapshot the parsed rules.
+
+    Returns:
+        JSON-serializable artifact dict
+
+    Raises:
+        FileNotFoundError: If rules.yaml or the schema is missing
+        ValueError: If any file fails YAML parsing, the schema or the
+            rule/template checks
+    """
+    config_root = Path(config_root)
+    rules_path = config_root / "rules.yaml"
+    document = rules_path.read_text(encoding="utf-8")
+    try:
+        config = yaml.safe_load(document)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in {rules_path}: {e}") from e
+
+    schema = json.loads(Path(schema_path).read_text(encoding="utf-8"))
+    try:
+        jsonschema.validate(instance=config, schema=schema)
+    except jsonschema.ValidationError as e:
+        raise ValueError(f"Rules configuration validation failed: {e.message}") from e
+    except jsonschema.SchemaError as e:
+        raise ValueError(f"Rules schema is invalid: {e.message}") from e
+
+    # Engine-level checks the schema cannot express (depends_on, action ids)
+    RuleEngine(str(rules_path), rules_config=config)
+
+    templates: Dict[str, str] = {}
+    for filename, check in TEMPLATE_CHECKS.items():
+        path = config_root / filename
+        if not path.exists():
+            continue
+        content = _load_yaml(path) or {}
+        if not isinstance(content, dict):
+            raise ValueError(f"{path} must contain a mapping")
+        check(content)
+        templates[filename] = document_hash(path.read_text(encoding="utf-8"))
+
+    return {
+        "version": ARTIFACT_VERSION,
+        "rules_hash": document_hash(document),
+        "templates": templates,
+        "rules": config,
+    }
+
+
+def write_rules_artifact(artifact: Dict[str, Any], path: Union[str, Path]) -> Path:
+    """Write the artifact as compact JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(artifact, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+    )
+    return path
+
+
+def load_rules_artifact(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Read an artifact written by write_rules_artifact().
+
+    Returns:
+        Artifact dict, or None if it is missing, unreadable or from another
+        ARTIFACT_VERSION
+    """
+    path = Path(path)
+    if not path.is_file():
+        return None
+    try:
+        artifact = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(
+            "Ignoring unreadable rules artifact",
+            operation="rules_artifact",
+            context={"path": str(path)},
+            error=str(e),
+        )
+        return None
+    if not isinstance(artifact, dict) or artifact.get("version") != ARTIFACT_VERSION:
+        logger.warning(
+            "Ignoring rules artifact from another version",
+            operation="rules_artifact",
+            context={"path": str(path)},
+        )
+        return None
+    return artifact
+
+
+def precompiled_rules(
+    artifact: Optional[Dict[str, Any]], document: str
+) -> Optional[Dict[str, Any]]:
+    """Parsed rules from `artifact` if it was built from exactly `document`."""
+    if artifact is None or artifact.get("rules_hash") != document_hash(document):
+        return None
+    return artifact.get("rules")
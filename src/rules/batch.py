@@ -0,0 +1,156 @@
+"""
+Batch Rule Evaluation - Per-condition masks over a run's bookings
+
+process_booking() evaluates conditions one booking at a time, with an
+evaluator call, a memo lookup and log context per condition and rule. For
+replays over thousands of bookings (comparison and validation campaigns),
+RuleEngine.process_batch() instead extracts the fields conditions read
+(reservation time, status, store id, DB flags) into lists once, evaluates
+each distinct condition once over the whole batch into a list of booleans,
+and ANDs those masks into a per-rule match matrix. Actions then run only for
+matched (booking, rule) cells, in booking order.
+
+This is not vectorized: NumPy is not a dependency of this project, so each
+mask is a plain Python loop (a list comprehension) over the rows. The saving
+is in doing less work per row - one tight loop per distinct condition shared
+by every rule that uses it, no per-booking evaluator dispatch or log context
+- and is largest when engine logging is on (see
+tests/performance/rule_engine_benchmark.py).
+
+The batch evaluators below mirror the per-booking evaluators in
+conditions.py row for row. If one raises (e.g. naive vs aware datetimes), the
+engine falls back to the per-booking evaluator for that condition.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+Mask = List[bool]
+
+
+class BookingColumns:
+    """
+    Column view of a batch of rule contexts.
+
+    Columns are extracted once per batch; flag columns are built on first use.
+    """
+
+    def __init__(self, contexts: Sequence[Dict[str, Any]]):
+        self.contexts = list(contexts)
+        self.size = len(self.contexts)
+        bookings = [context.get("booking") for context in self.contexts]
+        self.current_time: List[Any] = [context.get("current_time") for context in self.contexts]
+        self.db_record: List[Any] = [context.get("db_record") for context in self.contexts]
+        # None for missing (falsy) bookings, like the evaluators' `if not booking`
+        self.reserve_at: List[Any] = [
+            getattr(booking, "reserve_at", None) if booking else None for booking in bookings
+        ]
+        self.status: List[Any] = [
+            getattr(booking, "status", None) if booking else None for booking in bookings
+        ]
+        self.biz_id: List[Any] = [
+            getattr(booking, "biz_id", None) if booking else None for booking in bookings
+        ]
+        self._flags: Dict[str, List[Any]] = {}
+
+    def flag(self, name: str) -> List[Any]:
+        """Flag values from db_record (None for bookings without a record)."""
+        column = self._flags.get(name)
+        if column is None:
+            column = self._flags[name] = [
+                None
+                if record is None
+                else (
+                    record.get(name, False)
+                    if isinstance(record, dict)
+                    else getattr(record, name, False)
+                )
+                for record in self.db_record
+            ]
+        return column
+
+
+def batch_booking_not_in_db(columns: BookingColumns, **params: Any) -> Mask:
+    return [record is None for record in columns.db_record]
+
+
+def batch_booking_in_db(columns: BookingColumns, **params: Any) -> Mask:
+    return [record is not None for record in columns.db_record]
+
+
+def batch_time_before_booking(columns: BookingColumns, hours: int = 2, **params: Any) -> Mask:
+    window = timedelta(hours=hours)
+    return [
+        bool(now) and bool(reserve_at) and reserve_at - window <= now < reserve_at
+        for now, reserve_at in zip(columns.current_time, columns.reserve_at)
+    ]
+
+
+def batch_flag_not_set(columns: BookingColumns, flag: str, **params: Any) -> Mask:
+    # New bookings (no record) have no flag set
+    return [
+        record is None or not value for record, value in zip(columns.db_record, columns.flag(flag))
+    ]
+
+
+def batch_current_hour(columns: BookingColumns, hour: int, **params: Any) -> Mask:
+    return [bool(now) and now.hour == hour for now in columns.current_time]
+
+
+def batch_date_is_today(columns: BookingColumns, **params: Any) -> Mask:
+    return [
+        bool(now) and bool(reserve_at) and reserve_at.date() == now.date()
+        for now, reserve_at in zip(columns.current_time, columns.reserve_at)
+    ]
+
+
+def batch_booking_status(columns: BookingColumns, status: str, **params: Any) -> Mask:
+    return [code is not None and code == status for code in columns.status]
+
+
+def batch_booking_status_any(columns: BookingColumns, statuses: List[str], **params: Any) -> Mask:
+    if not isinstance(statuses, list) or not statuses:
+        return [False] * columns.size
+    return [code is not None and code in statuses for code in columns.status]
+
+
+def batch_store_id_matches(columns: BookingColumns, store_ids: List[Any], **params: Any) -> Mask:
+    if not isinstance(store_ids, list) or not store_ids:
+        return [False] * columns.size
+    accepted = {str(store_id) for store_id in store_ids}
+    return [biz_id is not None and str(biz_id) in accepted for biz_id in columns.biz_id]
+
+
+def batch_date_range(
+    columns: BookingColumns, start_date: str, end_date: str, **params: Any
+) -> Mask:
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    except ValueError:
+        # The per-booking evaluator returns False for unparseable bounds
+        return [False] * columns.size
+    return [
+        bool(reserve_at) and hasattr(reserve_at, "date") and start <= reserve_at.date() <= end
+        for reserve_at in columns.reserve_at
+    ]
+
+
+# Condition type -> batch evaluator (conditions without one run per booking)
+BATCH_EVALUATORS: Dict[str, Callable[..., Mask]] = {
+    "booking_not_in_db": batch_booking_not_in_db,
+    "booking_in_db": batch_booking_in_db,
+    "time_before_booking": batch_time_before_booking,
+    "flag_not_set": batch_flag_not_set,
+    "current_hour": batch_current_hour,
+    "date_is_today": batch_date_is_today,
+    "booking_status": batch_booking_status,
+    "booking_status_any": batch_booking_status_any,
+    "store_id_matches": batch_store_id_matches,
+    "date_range": batch_date_range,
+}
+
+
+def batch_evaluator(name: str) -> Optional[Callable[..., Mask]]:
+    """Batch evaluator registered for a condition type, if any."""
+    return BATCH_EVALUATORS.get(name)
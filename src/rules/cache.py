@@ -0,0 +1,186 @@
+"""
+Rule Engine Cache - Reuse the parsed engine across warm invocations
+
+Every invocation used to parse rules.yaml, validate each rule and register
+every condition evaluator before processing a single booking. The engine is
+now cached in process memory, keyed by the rules source and engine options,
+and tagged with the SHA-256 of the rules document. Warm invocations re-read
+the document (a local file read, or a conditional S3 GET that returns 304
+when unchanged) and reuse the cached engine while the hash matches; a changed
+document builds a fresh engine, so rules can be updated in S3 without a
+redeploy. When the document matches the precompiled artifact built with the
+image (src/rules/artifact.py), the engine is built from its parsed rules and
+YAML parsing is skipped.
+
+Action executors close over per-invocation services (DB repository, SMS
+client with fresh credentials), so callers still register actions and call
+compile() on the returned engine every run; compile() only binds callables.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import boto3
+from botocore.exceptions import ClientError
+
+from ..utils.logger import get_logger
+from .artifact import document_hash, load_rules_artifact, precompiled_rules
+from .engine import RuleEngine
+
+logger = get_logger(__name__)
+
+
+class FileRulesSource:
+    """Rules document on the local filesystem (bundled config/rules.yaml)."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.label = str(self.path)
+
+    def read(self) -> str:
+        return self.path.read_text(encoding="utf-8")
+
+
+class S3RulesSource:
+    """
+    Rules document in S3, re-validated with a conditional GET (ETag).
+
+    Unchanged documents cost one 304 response and no download.
+    """
+
+    def __init__(self, bucket: str, key: str, s3_client: Optional[Any] = None):
+        self.bucket = bucket
+        self.key = key
+        self.label = f"s3://{bucket}/{key}"
+        self._client = s3_client
+        self._etag: Optional[str] = None
+        self._document: Optional[str] = None
+
+    def read(self) -> str:
+        if self._client is None:
+            self._client = boto3.client("s3")
+        kwargs: Dict[str, Any] = {"Bucket": self.bucket, "Key": self.key}
+        if self._etag is not None:
+            kwargs["IfNoneMatch"] = self._etag
+        try:
+            response = self._client.get_object(**kwargs)
+        except ClientError as e:
+            status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            code = str(e.response.get("Error", {}).get("Code", ""))
+            if self._document is not None and (status == 304 or code in ("304", "NotModified")):
+                return self._document
+            raise
+        self._document = response["Body"].read().decode("utf-8")
+        self._etag = response.get("ETag")
+        return self._document
+
+
+RulesSource = Union[FileRulesSource, S3RulesSource]
+
+# (source label, engine options) -> (document hash, engine); survives warm invocations
+_ENGINE_CACHE: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[str, RuleEngine]] = {}
+# S3 sources keep their ETag between invocations
+_SOURCES: Dict[str, S3RulesSource] = {}
+
+
+def reset_engine_cache() -> None:
+    """Drop cached engines and S3 sources (tests and forced reloads)."""
+    for _, engine in _ENGINE_CACHE.values():
+        engine.close()
+    _ENGINE_CACHE.clear()
+    _SOURCES.clear()
+
+
+def rules_source(uri: str, default_path: Union[str, Path]) -> RulesSource:
+    """
+    Resolve RULES_SOURCE: "" for the bundled file, "s3://bucket/key" for S3,
+    anything else is a local path.
+    """
+    if not uri:
+        return FileRulesSource(default_path)
+    if uri.startswith("s3://"):
+        bucket, _, key = uri[len("s3://") :].partition("/")
+        if not bucket or not key:
+            raise ValueError(f"RULES_SOURCE must look like s3://bucket/key, got '{uri}'")
+        source = _SOURCES.get(uri)
+        if source is None:
+            source = _SOURCES[uri] = S3RulesSource(bucket, key)
+        return source
+    return FileRulesSource(uri)
+
+
+def cached_engine(
+    source: RulesSource,
+    setup: Optional[Callable[[RuleEngine], None]] = None,
+    build: Callable[..., RuleEngine] = RuleEngine,
+    artifact_path: Optional[Union[str, Path]] = None,
+    **engine_options: Any,
+) -> RuleEngine:
+    """
+    Engine for the current rules document, built only when its hash changes.
+
+    Args:
+        source: FileRulesSource or S3RulesSource
+        setup: Called once on a newly built engine (e.g. register_conditions)
+        build: Engine factory, called as build(label, rules_document=..., **engine_options)
+            or build(label, rules_config=..., **engine_options) from the artifact
+        artifact_path: Precompiled rules artifact, used when built from this document
+        **engine_options: RuleEngine keyword arguments (part of the cache key)
+
+    Returns:
+        Cached or newly built RuleEngine
+
+    Raises:
+        Whatever the source or RuleEngine raise when no cached engine can be
+        used (a failed read falls back to the cached engine if there is one)
+    """
+    key = (source.label, tuple(sorted(engine_options.items())))
+    cached = _ENGINE_CACHE.get(key)
+
+    try:
+        document = source.read()
+    except Exception as e:
+        if cached is None:
+            raise
+        logger.warning(
+            "Rules source unavailable; reusing cached rule engine",
+            operation="rule_engine_cache",
+            context={"source": source.label, "rules_hash": cached[0][:12]},
+            error=str(e),
+        )
+        return cached[1]
+
+    digest = document_hash(document)
+    if cached is not None and cached[0] == digest:
+        logger.info(
+            "Reusing cached rule engine",
+            operation="rule_engine_cache",
+            context={"source": source.label, "rules_hash": digest[:12], "result": "hit"},
+        )
+        return cached[1]
+
+    config = None
+    if artifact_path is not None:
+        config = precompiled_rules(load_rules_artifact(artifact_path), document)
+    if config is not None:
+        engine = build(source.label, rules_config=config, **engine_options)
+    else:
+        engine = build(source.label, rules_document=document, **engine_options)
+    if setup is not None:
+        setup(engine)
+    _ENGINE_CACHE[key] = (digest, engine)
+    if cached is not None and cached[1] is not engine:
+        # The replaced engine's dag action pool would otherwise never stop
+        cached[1].close()
+    logger.info(
+        "Built rule engine" if cached is None else "Rules changed; rebuilt rule engine",
+        operation="rule_engine_cache",
+        context={
+            "source": source.label,
+            "rules_hash": digest[:12],
+            "result": "miss" if cached is None else "reload",
+            "precompiled": config is not None,
+            "rules": len(engine.rules),
+        },
+    )
+    return engine
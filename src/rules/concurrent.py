@@ -0,0 +1,160 @@
+"""
+Concurrent Rule Execution - Bookings on worker threads, actions in order
+
+process_all_bookings used to handle one booking at a time, so every SMS,
+Telegram message and DynamoDB write blocked the whole run. ConcurrentExecutor
+processes different bookings on a thread pool while each booking still runs
+its rules and actions in declared order on a single worker (create_db_record
+before update_flag). Bookings that share a key (the same booking listed twice)
+run one after another on the same worker, in input order.
+
+ActionLimiter caps how many actions of one type run at once across all
+workers, e.g. send_sms=4 for the SMS API or send_telegram=1 to keep Telegram
+serialized (its throttle sleep then still spaces messages out). Results are
+returned in input order, so callers see the same ActionResult sequence as the
+sequential loop.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, TypeVar
+
+from src.rules.engine import ActionResult, RuleEngine
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def parse_action_limits(spec: str) -> Dict[str, int]:
+    """
+    Parse "action_type=n" pairs (comma separated) into per-type limits.
+
+    Raises:
+        ValueError: If a pair is malformed or a limit is below 1
+    """
+    limits: Dict[str, int] = {}
+    for pair in spec.split(","):
+        pair = pair.strip()
+        if not pair:
+            continue
+        action_type, separator, value = pair.partition("=")
+        if not separator or not action_type.strip():
+            raise ValueError(f"Action limit must look like 'action_type=n', got '{pair}'")
+        limit = int(value)
+        if limit < 1:
+            raise ValueError(f"Action limit for '{action_type.strip()}' must be >= 1")
+        limits[action_type.strip()] = limit
+    return limits
+
+
+def booking_key(context: Dict[str, Any]) -> Hashable:
+    """(booking_num, phone) of a rule context; contexts without a booking never share a key."""
+    booking = context.get("booking")
+    if not booking:
+        return id(context)
+    return (getattr(booking, "booking_num", None), getattr(booking, "phone", None))
+
+
+class ActionLimiter:
+    """Per-action-type concurrency caps shared by all worker threads."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self.limits = dict(limits or {})
+        for action_type, limit in self.limits.items():
+            if limit < 1:
+                raise ValueError(f"Action limit for '{action_type}' must be >= 1")
+        self._semaphores = {
+            action_type: threading.BoundedSemaphore(limit)
+            for action_type, limit in self.limits.items()
+        }
+
+    @contextmanager
+    def slot(self, action_type: str) -> Iterator[None]:
+        """Hold one slot for `action_type` (no-op for uncapped types)."""
+        semaphore = self._semaphores.get(action_type)
+        if semaphore is None:
+            yield
+            return
+        with semaphore:
+            yield
+
+
+class ConcurrentExecutor:
+    """
+    Run rule processing for many bookings on a thread pool.
+
+    Usage:
+        executor = ConcurrentExecutor(engine, max_workers=4, action_limits={"send_sms": 4})
+        results = executor.process_bookings(contexts)
+    """
+
+    def __init__(
+        self,
+        engine: RuleEngine,
+        max_workers: int = 4,
+        action_limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            engine: RuleEngine with conditions/actions registered (compile() first)
+            max_workers: Worker threads; 1 processes everything on the calling thread
+            action_limits: Action type -> max concurrent executions
+
+        Raises:
+            ValueError: If max_workers or a limit is below 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        self.engine = engine
+        self.max_workers = max_workers
+        self.limiter = ActionLimiter(action_limits)
+
+    def map(
+        self,
+        items: Sequence[T],
+        work: Callable[[T], R],
+        key: Optional[Callable[[T], Hashable]] = None,
+    ) -> List[R]:
+        """
+        Apply `work` to every item on the pool.
+
+        Items with the same key run sequentially, in input order, on one
+        worker. An exception raised by `work` is re-raised here. The
+        engine's action limiter is this executor's only for the duration of
+        the call, so a cached engine does not keep it into the next run.
+
+        Returns:
+            work(item) per item, in input order
+        """
+        groups: Dict[Hashable, List[int]] = {}
+        for position, item in enumerate(items):
+            groups.setdefault(key(item) if key else position, []).append(position)
+
+        results: List[Any] = [None] * len(items)
+
+        def run_group(positions: List[int]) -> None:
+            for position in positions:
+                results[position] = work(items[position])
+
+        previous_limiter = self.engine.action_limiter
+        self.engine.action_limiter = self.limiter
+        try:
+            if self.max_workers == 1 or len(groups) <= 1:
+                for positions in groups.values():
+                    run_group(positions)
+                return results
+
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(groups)), thread_name_prefix="rule-worker"
+            ) as pool:
+                futures = [pool.submit(run_group, positions) for positions in groups.values()]
+                for future in futures:
+                    future.result()
+            return results
+        finally:
+            self.engine.action_limiter = previous_limiter
+
+    def process_bookings(self, contexts: Sequence[Dict[str, Any]]) -> List[List[ActionResult]]:
+        """process_booking() for every context; results in input order."""
+        return self.map(contexts, self.engine.process_booking, key=booking_key)
@@ -18,10 +18,13 @@ All evaluators are pure functions with no side effects.
 Reference: docs/brownfield-architecture.md:1070-1145
 """
 
-from typing import Any, Dict, List, Optional
-from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
 import logging
 
+from src.rules.batch import BATCH_EVALUATORS
+from src.rules.index import EqualityIndex, RangeIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -341,6 +344,48 @@ def booking_status_any(context: Dict[str, Any], statuses: List[str], **params) -
         return False
 
 
+def store_id_matches(context: Dict[str, Any], store_ids: List[Any], **params) -> bool:
+    """
+    Evaluate if the booking belongs to one of the given stores.
+
+    Compares booking.biz_id against store_ids as strings, so YAML integers
+    (store_ids: [1051707]) match the string biz_id from the Naver API.
+
+    Args:
+        context: Dict containing 'booking' with a 'biz_id' attribute
+        store_ids: List of store IDs (int or str)
+
+    Returns:
+        bool: True if booking.biz_id is in store_ids, False otherwise
+
+    Example:
+        >>> store_id_matches(context, store_ids=[1051707])
+        True
+    """
+    try:
+        booking = context.get("booking")
+        if not booking:
+            logger.debug("store_id_matches: Missing booking")
+            return False
+
+        biz_id = getattr(booking, "biz_id", None)
+        if biz_id is None:
+            logger.debug("store_id_matches: Booking has no biz_id")
+            return False
+
+        if not isinstance(store_ids, list) or not store_ids:
+            logger.debug("store_id_matches: Invalid or empty store_ids parameter")
+            return False
+
+        result = str(biz_id) in {str(store_id) for store_id in store_ids}
+        logger.debug(f"store_id_matches({store_ids}): biz_id={biz_id}, result={result}")
+        return result
+
+    except Exception as e:
+        logger.error(f"store_id_matches error: {e}", exc_info=True)
+        return False
+
+
 def has_option_keyword(context: Dict[str, Any], **params) -> bool:
     """
     Evaluate if booking has option keywords.
@@ -698,6 +743,81 @@ def sms_send_failed(
         return False
 
 
+# ---------------------------------------------------------------------------
+# Discrimination indexes
+#
+# Each spec mirrors its evaluator: extract() reads the one attribute the
+# condition compares, values()/bounds() return what the params accept (None
+# when the params cannot be indexed). Whenever extract() gives a value outside
+# them the evaluator returns False, which is what lets RuleIndex skip the rule.
+# ---------------------------------------------------------------------------
+
+
+def _booking_status_key(context: Dict[str, Any]) -> Optional[str]:
+    booking = context.get("booking")
+    return getattr(booking, "status", None) if booking else None
+
+
+def _store_id_key(context: Dict[str, Any]) -> Optional[str]:
+    booking = context.get("booking")
+    biz_id = getattr(booking, "biz_id", None) if booking else None
+    return str(biz_id) if biz_id is not None else None
+
+
+def _current_hour_key(context: Dict[str, Any]) -> Optional[int]:
+    current_time = context.get("current_time")
+    return current_time.hour if current_time else None
+
+
+def _reserve_date_key(context: Dict[str, Any]) -> Optional[date]:
+    booking = context.get("booking")
+    reserve_at = getattr(booking, "reserve_at", None) if booking else None
+    if not reserve_at or not hasattr(reserve_at, "date"):
+        return None
+    return reserve_at.date()
+
+
+def _listed_values(values: Any, as_str: bool = False) -> List[Any]:
+    # Evaluators reject anything but a non-empty list, so nothing is accepted
+    if not isinstance(values, list) or not values:
+        return []
+    return [str(value) for value in values] if as_str else values
+
+
+def _date_bounds(params: Dict[str, Any]) -> Tuple[date, date]:
+    return (
+        datetime.strptime(params["start_date"], "%Y-%m-%d").date(),
+        datetime.strptime(params["end_date"], "%Y-%m-%d").date(),
+    )
+
+
+BOOKING_STATUS_INDEX = EqualityIndex(
+    key="booking.status",
+    extract=_booking_status_key,
+    values=lambda params: [params["status"]],
+)
+BOOKING_STATUS_ANY_INDEX = EqualityIndex(
+    key="booking.status",
+    extract=_booking_status_key,
+    values=lambda params: _listed_values(params["statuses"]),
+)
+STORE_ID_INDEX = EqualityIndex(
+    key="booking.biz_id",
+    extract=_store_id_key,
+    values=lambda params: _listed_values(params["store_ids"], as_str=True),
+)
+CURRENT_HOUR_INDEX = EqualityIndex(
+    key="current_time.hour",
+    extract=_current_hour_key,
+    values=lambda params: [params["hour"]],
+)
+DATE_RANGE_INDEX = RangeIndex(
+    key="booking.reserve_date",
+    extract=_reserve_date_key,
+    bounds=_date_bounds,
+)
+
+
 def register_conditions(engine: Any, settings: Optional[Any] = None) -> None:
     """
     Register all condition evaluators with the rule engine.
@@ -726,6 +846,8 @@ def register_conditions(engine: Any, settings: Optional[Any] = None) -> None:
         - flag_not_set: True if SMS flag not sent
         - current_hour: True if current hour matches
         - booking_status: True if booking status matches code
+        - booking_status_any: True if booking status is one of the codes
+        - store_id_matches: True if booking belongs to one of the stores
         - date_is_today: True if booking date equals current date (KST)
         - has_option_keyword: True if booking has option keywords
         - has_multiple_options: True if booking has minimum matching option keywords
@@ -733,29 +855,84 @@ def register_conditions(engine: Any, settings: Optional[Any] = None) -> None:
         - has_pro_edit_option: True if booking has professional edit option
         - sms_send_failed: True if SMS delivery failed or raised errors
 
+    Cost classes: field/flag/time comparisons are "cheap"; option-list
+    scans and date parsing are "moderate". The engine uses them to order
+    compiled AND-chains. All conditions except sms_send_failed are memoized
+    per booking. Status, store, hour and date-range conditions also carry an
+    index spec so the indexed matcher can skip rules that cannot match.
+    Conditions with a mask evaluator in batch.py register it for
+    RuleEngine.process_batch(); option scans run per booking.
+
     Reference:
         Integration pattern: docs/brownfield-architecture.md:1070-1145
     """
-    engine.register_condition("booking_not_in_db", booking_not_in_db)
-    engine.register_condition("booking_in_db", booking_in_db)
-    engine.register_condition("time_before_booking", time_before_booking)
-    engine.register_condition("flag_not_set", flag_not_set)
-    engine.register_condition("current_hour", current_hour)
-    engine.register_condition("booking_status", booking_status)
+    batch = BATCH_EVALUATORS
+    engine.register_condition(
+        "booking_not_in_db", booking_not_in_db, cost="cheap", batch=batch["booking_not_in_db"]
+    )
+    engine.register_condition(
+        "booking_in_db", booking_in_db, cost="cheap", batch=batch["booking_in_db"]
+    )
+    engine.register_condition(
+        "time_before_booking",
+        time_before_booking,
+        cost="cheap",
+        batch=batch["time_before_booking"],
+    )
+    engine.register_condition(
+        "flag_not_set", flag_not_set, cost="cheap", batch=batch["flag_not_set"]
+    )
+    engine.register_condition(
+        "current_hour",
+        current_hour,
+        cost="cheap",
+        index=CURRENT_HOUR_INDEX,
+        batch=batch["current_hour"],
+    )
+    engine.register_condition(
+        "booking_status",
+        booking_status,
+        cost="cheap",
+        index=BOOKING_STATUS_INDEX,
+        batch=batch["booking_status"],
+    )
     # New: allow multiple statuses in a single condition (e.g., RC03 or RC08)
-    engine.register_condition("booking_status_any", booking_status_any)
-    engine.register_condition("date_is_today", date_is_today)
-    engine.register_condition("has_option_keyword", has_option_keyword)
-    engine.register_condition("has_multiple_options", has_multiple_options)
-    engine.register_condition("date_range", date_range)
-    engine.register_condition("has_pro_edit_option", has_pro_edit_option)
-    engine.register_condition("sms_send_failed", sms_send_failed)
+    engine.register_condition(
+        "booking_status_any",
+        booking_status_any,
+        cost="cheap",
+        index=BOOKING_STATUS_ANY_INDEX,
+        batch=batch["booking_status_any"],
+    )
+    engine.register_condition(
+        "store_id_matches",
+        store_id_matches,
+        cost="cheap",
+        index=STORE_ID_INDEX,
+        batch=batch["store_id_matches"],
+    )
+    engine.register_condition(
+        "date_is_today", date_is_today, cost="cheap", batch=batch["date_is_today"]
+    )
+    engine.register_condition("has_option_keyword", has_option_keyword, cost="moderate")
+    engine.register_condition("has_multiple_options", has_multiple_options, cost="moderate")
+    engine.register_condition(
+        "date_range",
+        date_range,
+        cost="moderate",
+        index=DATE_RANGE_INDEX,
+        batch=batch["date_range"],
+    )
+    engine.register_condition("has_pro_edit_option", has_pro_edit_option, cost="moderate")
+    # Reads send failures recorded during the run, so never shared across rules
+    engine.register_condition("sms_send_failed", sms_send_failed, cost="cheap", memoize=False)
 
     logger.info(
-        "Registered 12 condition evaluators with RuleEngine: "
+        "Registered 14 condition evaluators with RuleEngine: "
         "booking_not_in_db, booking_in_db, time_before_booking, flag_not_set, "
-        "current_hour, booking_status, date_is_today, has_option_keyword, "
-        "has_multiple_options, date_range, has_pro_edit_option, sms_send_failed"
+        "current_hour, booking_status, booking_status_any, store_id_matches, "
+        "date_is_today, has_option_keyword, has_multiple_options, date_range, "
+        "has_pro_edit_option, sms_send_failed"
     )
 
 
@@ -18,16 +18,162 @@ Acceptance Criteria Coverage:
 - AC7: Context provides all data for evaluation
 - AC8: Returns structured results
 - AC9: Performance <100ms per rule
+
+After all evaluators and executors are registered, ``compile()`` turns each
+enabled rule into a RulePlan of bound callables (params frozen with
+functools.partial). ``process_booking`` then runs the plans directly instead
+of resolving evaluators by name and rebuilding params for every booking.
+
+With condition_order="cost" (default), each plan's AND-chain is ordered by
+the registered cost class of its conditions and their observed pass rate, so
+cheap, selective predicates short-circuit first. Conditions only read the
+context, so the match result is the same as in declared order; "declared"
+keeps the YAML order for debugging.
+
+Within one booking, compiled conditions with the same type and params share a
+result: ``time_before_booking(hours=2)`` used by three rules is evaluated
+once. That assumes the condition's inputs stay fixed while the booking's
+actions run. Conditions that read state actions can change mid-booking (e.g.
+``sms_send_failed``, which reads ``context["sms_failure"]``) opt out with
+``memoize=False`` at registration and are re-evaluated every time.
+
+With matcher="indexed" (default), compile() also builds a RuleIndex from the
+conditions registered with an ``index`` spec (status, store id, current hour,
+reservation date), and each booking is only checked against the plans that
+can still match. matcher="linear" checks every plan.
+
+``process_batch`` evaluates a whole run's bookings at once: each distinct
+condition registered with a ``batch`` evaluator (see batch.py) is evaluated
+once into a per-booking boolean mask (a plain Python loop, not vectorized),
+the masks are ANDed into a per-rule match matrix, and actions run only for
+matched cells in booking order.
+
+With log_mode="summary", the per-booking, per-rule and per-condition INFO
+lines are not built at all; "condition not met" and "rule matched" events
+only bump counters, and ``flush_log_summary()`` logs them as one record per
+run. Action outcomes, warnings and errors are still logged individually.
+
+One engine may be shared by the worker threads of ConcurrentExecutor
+(concurrent.py): per-booking state lives in locals, the run summary is
+locked, and ``action_limiter`` caps concurrent actions per type. Selectivity
+counters are not locked; a lost increment only nudges condition order.
+
+With action_scheduling="dag", a rule's actions run as a dependency graph:
+actions whose dependencies (``depends_on``, or the implicit defaults of
+``action_dependencies``) have succeeded run concurrently on a shared pool,
+and an action whose dependency failed is skipped.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Callable, Any, Optional
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
+from typing import List, Dict, Callable, Any, Optional, Sequence, Set, Tuple
 import yaml
 
+from src.rules.batch import BookingColumns
+from src.rules.index import EqualityIndex, RangeIndex, RuleIndex
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Relative evaluation cost per condition cost class
+CONDITION_COST_WEIGHTS = {"cheap": 1.0, "moderate": 4.0, "expensive": 16.0}
+DEFAULT_CONDITION_COST = "moderate"
+CONDITION_ORDERS = ("cost", "declared")
+MATCHERS = ("indexed", "linear")
+LOG_MODES = ("verbose", "summary")
+ACTION_SCHEDULINGS = ("sequential", "dag")
+# Action types with implicit dependencies under action_scheduling="dag":
+# record writes wait for earlier SMS sends and earlier record writes
+DB_WRITE_ACTIONS = frozenset({"create_db_record", "update_flag"})
+DELIVERY_ACTIONS = frozenset({"send_sms"})
+# Threads shared by all rules for dag scheduling
+ACTION_DAG_WORKERS = 4
+# Observations needed before a condition's pass rate replaces the 0.5 prior
+SELECTIVITY_MIN_SAMPLES = 20
+# Compiled bookings between re-orderings with fresh selectivity
+REORDER_INTERVAL = 256
+
+
+@dataclass
+class RunLogSummary:
+    """Counters behind the per-run engine summary (see RuleEngine.flush_log_summary)."""
+
+    bookings: int = 0
+    rules_matched: Dict[str, int] = field(default_factory=dict)
+    conditions_not_met: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    actions_succeeded: int = 0
+    actions_failed: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def booking(self, count: int = 1) -> None:
+        with self._lock:
+            self.bookings += count
+
+    def matched(self, rule_name: str) -> None:
+        with self._lock:
+            self.rules_matched[rule_name] = self.rules_matched.get(rule_name, 0) + 1
+
+    def not_met(self, rule_name: str, condition_type: str, count: int = 1) -> None:
+        with self._lock:
+            counts = self.conditions_not_met.setdefault(rule_name, {})
+            counts[condition_type] = counts.get(condition_type, 0) + count
+
+    def actions(self, succeeded: int, failed: int) -> None:
+        with self._lock:
+            self.actions_succeeded += succeeded
+            self.actions_failed += failed
+
+    def as_context(self) -> Dict[str, Any]:
+        return {
+            "bookings": self.bookings,
+            "rules_matched": dict(self.rules_matched),
+            "conditions_not_met": {
+                rule_name: dict(counts) for rule_name, counts in self.conditions_not_met.items()
+            },
+            "actions_succeeded": self.actions_succeeded,
+            "actions_failed": self.actions_failed,
+        }
+
+
+@dataclass
+class ConditionStats:
+    """Observed outcomes of one condition (type + params) across bookings."""
+
+    evaluated: int = 0
+    passed: int = 0
+
+    def pass_rate(self) -> float:
+        if self.evaluated < SELECTIVITY_MIN_SAMPLES:
+            return 0.5
+        return self.passed / self.evaluated
+
+
+# (condition type, params) -> stats; survives warm invocations so later runs
+# start from the selectivity already observed in this container
+_CONDITION_STATS: Dict[Tuple[str, str], ConditionStats] = {}
+
+
+def condition_key(condition_type: str, params: Dict[str, Any]) -> Tuple[str, str]:
+    """Hashable identity of a condition: type plus frozen params."""
+    return (condition_type, repr(sorted(params.items())))
+
+
+def reset_condition_stats() -> None:
+    """Forget observed selectivity (tests)."""
+    _CONDITION_STATS.clear()
+
+
+def _condition_stats(condition_type: str, params: Dict[str, Any]) -> ConditionStats:
+    key = condition_key(condition_type, params)
+    stats = _CONDITION_STATS.get(key)
+    if stats is None:
+        stats = _CONDITION_STATS[key] = ConditionStats()
+    return stats
+
 
 @dataclass
 class ConditionConfig:
@@ -43,6 +189,10 @@ class ActionConfig:
 
     type: str
     params: Dict[str, Any] = field(default_factory=dict)
+    halt_on_failure: bool = False
+    id: Optional[str] = None
+    # None: implicit dependencies (see action_dependencies)
+    depends_on: Optional[List[str]] = None
 
 
 @dataclass
@@ -56,6 +206,83 @@ class RuleConfig:
     description: Optional[str] = None
 
 
+def action_dependencies(actions: Sequence[ActionConfig]) -> List[Tuple[int, ...]]:
+    """
+    Indices of the earlier actions each action depends on.
+
+    An explicit ``depends_on`` names earlier actions by id or type (a type
+    matches every earlier action of that type). Without it, DB writes depend
+    on earlier SMS sends and DB writes. Every action also depends on the
+    earlier halt_on_failure actions.
+
+    Raises:
+        ValueError: If a depends_on entry matches no earlier action
+    """
+    resolved: List[Tuple[int, ...]] = []
+    for index, action in enumerate(actions):
+        earlier = list(enumerate(actions[:index]))
+        deps = {i for i, other in earlier if other.halt_on_failure}
+        if action.depends_on is None:
+            if action.type in DB_WRITE_ACTIONS:
+                deps.update(
+                    i
+                    for i, other in earlier
+                    if other.type in DELIVERY_ACTIONS or other.type in DB_WRITE_ACTIONS
+                )
+        else:
+            for name in action.depends_on:
+                matches = [i for i, other in earlier if name in (other.id, other.type)]
+                if not matches:
+                    raise ValueError(
+                        f"action [{index}] '{action.type}' depends_on '{name}', "
+                        "which is not an earlier action"
+                    )
+                deps.update(matches)
+        resolved.append(tuple(sorted(deps)))
+    return resolved
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    """Condition bound to its evaluator; check(context) -> bool."""
+
+    type: str
+    params: Dict[str, Any]
+    check: Optional[Callable[[Dict[str, Any]], Any]]
+    cost: str = DEFAULT_CONDITION_COST
+    stats: Optional[ConditionStats] = field(default=None, compare=False)
+    # Per-booking memo key; None when the condition opted out of memoization
+    memo_key: Optional[Tuple[str, str]] = None
+    # Column evaluator for process_batch(): batch(columns) -> mask
+    batch: Optional[Callable[[BookingColumns], List[bool]]] = field(default=None, compare=False)
+
+    def rank(self) -> float:
+        """Expected cost per rejection; lower runs earlier in an AND-chain."""
+        pass_rate = self.stats.pass_rate() if self.stats is not None else 0.5
+        return CONDITION_COST_WEIGHTS[self.cost] / max(1.0 - pass_rate, 0.01)
+
+
+@dataclass(frozen=True)
+class CompiledAction:
+    """Action bound to its executor; run(context) -> None."""
+
+    type: str
+    params: Dict[str, Any]
+    run: Optional[Callable[[Dict[str, Any]], Any]]
+    halt_on_failure: bool = False
+    # Indices of earlier actions in the same plan this one waits for
+    depends_on: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """Executable form of an enabled rule, produced by RuleEngine.compile()."""
+
+    rule: RuleConfig
+    conditions: Tuple[CompiledCondition, ...]
+    actions: Tuple[CompiledAction, ...]
+
+
 @dataclass
 class ActionResult:
     """Result of executing an action."""
@@ -68,6 +295,10 @@ class ActionResult:
     params: Dict[str, Any] = field(default_factory=dict)
 
 
+class BatchMatchError(RuntimeError):
+    """process_batch() failed while building match masks, before any action ran."""
+
+
 class RuleEngine:
     """
     Core rule engine that evaluates conditions and executes actions.
@@ -81,21 +312,83 @@ class RuleEngine:
     - Structured result tracking
     """
 
-    def __init__(self, rules_config_path: str):
+    def __init__(
+        self,
+        rules_config_path: str,
+        condition_order: str = "cost",
+        matcher: str = "indexed",
+        log_mode: str = "verbose",
+        action_scheduling: str = "sequential",
+        rules_document: Optional[str] = None,
+        rules_config: Optional[Dict[str, Any]] = None,
+    ):
         """
         Initialize rule engine and load rules.
 
         Args:
             rules_config_path: Path to rules.yaml configuration file
+            condition_order: "cost" to reorder compiled AND-chains by cost and
+                selectivity, "declared" to keep YAML order
+            matcher: "indexed" to skip compiled plans that cannot match a
+                booking, "linear" to check every plan
+            log_mode: "verbose" to log every booking, rule and failed
+                condition, "summary" to count them for flush_log_summary()
+            action_scheduling: "sequential" to run a rule's actions in declared
+                order, "dag" to run independent actions concurrently
+            rules_document: YAML text to load instead of reading
+                rules_config_path (which then only labels the source)
+            rules_config: Already-parsed rules document (e.g. from the
+                precompiled artifact); takes precedence over rules_document
 
         Raises:
             FileNotFoundError: If config file not found
-            ValueError: If rule schema is invalid
+            ValueError: If rule schema is invalid or condition_order/matcher/log_mode/
+                action_scheduling is unknown
         """
+        if condition_order not in CONDITION_ORDERS:
+            raise ValueError(
+                f"condition_order must be one of {CONDITION_ORDERS}, got '{condition_order}'"
+            )
+        if matcher not in MATCHERS:
+            raise ValueError(f"matcher must be one of {MATCHERS}, got '{matcher}'")
+        if log_mode not in LOG_MODES:
+            raise ValueError(f"log_mode must be one of {LOG_MODES}, got '{log_mode}'")
+        if action_scheduling not in ACTION_SCHEDULINGS:
+            raise ValueError(
+                f"action_scheduling must be one of {ACTION_SCHEDULINGS}, "
+                f"got '{action_scheduling}'"
+            )
         self.rules: List[RuleConfig] = []
         self.condition_evaluators: Dict[str, Callable] = {}
+        self.condition_costs: Dict[str, str] = {}
+        self.unmemoized_conditions: Set[str] = set()
+        self.condition_indexes: Dict[str, Any] = {}
+        self.batch_evaluators: Dict[str, Callable] = {}
         self.action_executors: Dict[str, Callable] = {}
-        self.load_rules(rules_config_path)
+        self.condition_order = condition_order
+        self.matcher = matcher
+        self.log_mode = log_mode
+        self._verbose = log_mode == "verbose"
+        self.run_summary = RunLogSummary()
+        # Set by ConcurrentExecutor: slot(action_type) context manager per action
+        self.action_limiter: Optional[Any] = None
+        self.action_scheduling = action_scheduling
+        # Threads start on first use
+        self._action_pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=ACTION_DAG_WORKERS, thread_name_prefix="rule-action")
+            if action_scheduling == "dag"
+            else None
+        )
+        self._bookings_since_reorder = 0
+        # Set by compile(); any registry or rule change drops them again
+        self.plans: Optional[List[RulePlan]] = None
+        self.index: Optional[RuleIndex] = None
+        if rules_config is not None:
+            self.load_rules_config(rules_config, source=rules_config_path)
+        elif rules_document is not None:
+            self.load_rules_document(rules_document, source=rules_config_path)
+        else:
+            self.load_rules(rules_config_path)
 
     def load_rules(self, config_path: str) -> None:
         """
@@ -111,18 +404,49 @@ class RuleEngine:
         """
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+                document = f.read()
         except FileNotFoundError:
             logger.error(f"Rules configuration file not found: {config_path}")
             raise
+        self.load_rules_document(document, source=config_path)
+
+    def load_rules_document(self, document: str, source: str = "<document>") -> None:
+        """
+        Load rules from YAML text (e.g. a document fetched from S3).
+
+        Args:
+            document: rules.yaml content
+            source: Label used in log and error messages
+
+        Raises:
+            ValueError: If the YAML or the rule schema is invalid
+        """
+        try:
+            config = yaml.safe_load(document)
         except yaml.YAMLError as e:
             logger.error(f"Invalid YAML in rules configuration: {e}")
-            raise ValueError(f"Invalid YAML in {config_path}: {e}") from e
+            raise ValueError(f"Invalid YAML in {source}: {e}") from e
+
+        self.load_rules_config(config, source=source)
 
+    def load_rules_config(self, config: Optional[Dict[str, Any]], source: str = "<config>") -> None:
+        """
+        Load rules from an already-parsed rules document.
+
+        Args:
+            config: Parsed rules.yaml ({"rules": [...]})
+            source: Label used in log and error messages
+
+        Raises:
+            ValueError: If the rule schema is invalid
+        """
         if not config or "rules" not in config:
-            logger.warning(f"No rules found in configuration: {config_path}")
+            logger.warning(f"No rules found in configuration: {source}")
             return
 
+        self.plans = None
+        self.index = None
+
         # Parse and validate each rule
         for rule_idx, rule_data in enumerate(config.get("rules", [])):
             try:
@@ -133,7 +457,7 @@ class RuleEngine:
                 logger.error(f"Failed to parse rule [{rule_idx}]: {e}")
                 raise
 
-        logger.info(f"Successfully loaded {len(self.rules)} rules from {config_path}")
+        logger.info(f"Successfully loaded {len(self.rules)} rules from {source}")
 
     def _parse_rule(self, rule_data: Dict[str, Any]) -> RuleConfig:
         """
@@ -189,13 +513,33 @@ class RuleEngine:
             if "type" not in action_data:
                 raise ValueError(f"Rule '{name}': action [{action_idx}] missing 'type' field")
 
+            depends_on = action_data.get("depends_on")
+            if depends_on is not None and (
+                not isinstance(depends_on, list)
+                or not all(isinstance(dep, str) for dep in depends_on)
+            ):
+                raise ValueError(
+                    f"Rule '{name}': action [{action_idx}] 'depends_on' must be a list of strings"
+                )
+
             actions.append(
                 ActionConfig(
                     type=action_data["type"],
                     params=action_data.get("params", {}),
+                    halt_on_failure=bool(action_data.get("halt_on_failure", False)),
+                    id=action_data.get("id"),
+                    depends_on=depends_on,
                 )
             )
 
+        action_ids = [action.id for action in actions if action.id is not None]
+        if len(action_ids) != len(set(action_ids)):
+            raise ValueError(f"Rule '{name}': action ids must be unique")
+        try:
+            action_dependencies(actions)
+        except ValueError as e:
+            raise ValueError(f"Rule '{name}': {e}") from e
+
         return RuleConfig(
             name=name,
             enabled=rule_data.get("enabled", True),
@@ -204,21 +548,66 @@ class RuleEngine:
             description=rule_data.get("description"),
         )
 
-    def register_condition(self, name: str, evaluator: Callable) -> None:
+    def register_condition(
+        self,
+        name: str,
+        evaluator: Callable,
+        cost: str = DEFAULT_CONDITION_COST,
+        memoize: bool = True,
+        index: Optional[Any] = None,
+        batch: Optional[Callable] = None,
+    ) -> None:
         """
         Register a condition evaluator function.
 
         Args:
             name: Condition type name (e.g., "booking_not_in_db")
             evaluator: Callable that takes (context, **params) -> bool
+            cost: Cost class ("cheap", "moderate", "expensive") used to order
+                compiled AND-chains
+            memoize: Share one result per booking across rules. Pass False
+                for conditions whose inputs actions can change mid-booking
+            index: EqualityIndex/RangeIndex describing the booking attribute
+                the condition tests, so the indexed matcher can skip rules
+            batch: Column evaluator (columns, **params) -> list of bools used
+                by process_batch(); must agree with evaluator row for row
 
         Raises:
             TypeError: If evaluator is not callable
+            ValueError: If cost is not a known cost class
+            TypeError: If index is not an EqualityIndex or RangeIndex, or
+                batch is not callable
         """
         if not callable(evaluator):
             raise TypeError(f"Condition evaluator must be callable, got {type(evaluator)}")
+        if cost not in CONDITION_COST_WEIGHTS:
+            raise ValueError(
+                f"Unknown cost class '{cost}' for condition '{name}'; "
+                f"expected one of {sorted(CONDITION_COST_WEIGHTS)}"
+            )
+        if index is not None and not isinstance(index, (EqualityIndex, RangeIndex)):
+            raise TypeError(
+                f"Condition index must be EqualityIndex or RangeIndex, got {type(index)}"
+            )
+        if batch is not None and not callable(batch):
+            raise TypeError(f"Condition batch evaluator must be callable, got {type(batch)}")
 
         self.condition_evaluators[name] = evaluator
+        self.condition_costs[name] = cost
+        if memoize:
+            self.unmemoized_conditions.discard(name)
+        else:
+            self.unmemoized_conditions.add(name)
+        if index is not None:
+            self.condition_indexes[name] = index
+        else:
+            self.condition_indexes.pop(name, None)
+        if batch is not None:
+            self.batch_evaluators[name] = batch
+        else:
+            self.batch_evaluators.pop(name, None)
+        self.plans = None
+        self.index = None
         logger.debug(f"Registered condition evaluator: {name}")
 
     def register_action(self, name: str, executor: Callable) -> None:
@@ -236,6 +625,8 @@ class RuleEngine:
             raise TypeError(f"Action executor must be callable, got {type(executor)}")
 
         self.action_executors[name] = executor
+        self.plans = None
+        self.index = None
         logger.debug(f"Registered action executor: {name}")
 
     def evaluate_rule(self, rule: RuleConfig, context: Dict[str, Any]) -> bool:
@@ -251,86 +642,256 @@ class RuleEngine:
         Returns:
             True if rule is enabled and all conditions met, False otherwise
         """
-        # Extract booking info for logging context
-        booking = context.get("booking")
-        booking_num = str(getattr(booking, "booking_num", "unknown")) if booking else "unknown"
-        phone_masked = str(getattr(booking, "phone_masked", "unknown")) if booking else "unknown"
-        log_context = {
-            "rule_name": rule.name,
-            "booking_num": booking_num,
-            "phone_masked": phone_masked,
-        }
-
-        # Log rule evaluation start
-        logger.debug(
-            f"Evaluating rule '{rule.name}'",
-            operation="evaluate_rule_start",
-            context=log_context,
-        )
+        debug = self._debug_enabled()
+        if debug:
+            log_context = self._booking_log_context(rule.name, context)
+            logger.debug(
+                f"Evaluating rule '{rule.name}'",
+                operation="evaluate_rule_start",
+                context=log_context,
+            )
 
         # Disabled rules never match
         if not rule.enabled:
-            logger.debug(
-                f"Rule '{rule.name}' is disabled, skipping",
-                operation="evaluate_rule",
-                context={**log_context, "result": "skipped", "reason": "disabled"},
-            )
+            if debug:
+                logger.debug(
+                    f"Rule '{rule.name}' is disabled, skipping",
+                    operation="evaluate_rule",
+                    context={**log_context, "result": "skipped", "reason": "disabled"},
+                )
             return False
 
-        # Evaluate each condition (AND logic)
+        return self._check_conditions(rule, self._bind_conditions(rule), context)
+
+    def compile(self) -> List[RulePlan]:
+        """
+        Build RulePlans for all enabled rules.
+
+        Call after register_conditions()/register_actions(). Registering
+        another evaluator or executor afterwards discards the plans, and
+        process_booking() falls back to name lookups until compile() runs again.
+
+        Returns:
+            Compiled plans in rule order
+
+        Raises:
+            ValueError: If an enabled rule uses an unregistered condition or action type
+        """
+        plans: List[RulePlan] = []
+        unknown: List[str] = []
+
+        for rule in self.rules:
+            if not rule.enabled:
+                continue
+            conditions = self._bind_conditions(rule, track_stats=True)
+            actions = self._bind_actions(rule)
+            unknown.extend(
+                f"rule '{rule.name}': unknown condition type '{c.type}'"
+                for c in conditions
+                if c.check is None
+            )
+            unknown.extend(
+                f"rule '{rule.name}': unknown action type '{a.type}'"
+                for a in actions
+                if a.run is None
+            )
+            plans.append(RulePlan(rule=rule, conditions=conditions, actions=actions))
+
+        if unknown:
+            raise ValueError("Cannot compile rules - " + "; ".join(unknown))
+
+        self.plans = plans
+        self.reorder_plans()
+        # Plan positions never change after compile(), so reordering keeps the index valid
+        self.index = RuleIndex(plans, self.condition_indexes) if self.matcher == "indexed" else None
+        logger.info(
+            f"Compiled {len(plans)} rule plan(s)",
+            operation="compile_rules",
+            context={
+                "rules_total": len(self.rules),
+                "plans": len(plans),
+                "condition_order": self.condition_order,
+                "matcher": self.matcher,
+                **({"index": self.index.describe()} if self.index is not None else {}),
+            },
+        )
+        return self.plans
+
+    def reorder_plans(self) -> Optional[List[RulePlan]]:
+        """
+        Re-sort each compiled AND-chain by rank (cost / rejection rate).
+
+        The sort is stable, so conditions of equal rank keep their declared
+        order. No-op with condition_order="declared" or before compile().
+        """
+        self._bookings_since_reorder = 0
+        if self.plans is None or self.condition_order != "cost":
+            return self.plans
+
+        reordered = []
+        for plan in self.plans:
+            conditions = tuple(sorted(plan.conditions, key=CompiledCondition.rank))
+            if conditions != plan.conditions:
+                logger.debug(
+                    f"Reordered conditions for rule '{plan.rule.name}'",
+                    operation="reorder_plans",
+                    context={"order": [c.type for c in conditions]},
+                )
+                plan = replace(plan, conditions=conditions)
+            reordered.append(plan)
+        self.plans = reordered
+        return self.plans
+
+    def _bind_conditions(
+        self, rule: RuleConfig, track_stats: bool = False
+    ) -> Tuple[CompiledCondition, ...]:
+        """Resolve condition evaluators (check=None for unknown types)."""
+        bound = []
         for condition in rule.conditions:
+            params = dict(condition.params or {})
             evaluator = self.condition_evaluators.get(condition.type)
+            batch = self.batch_evaluators.get(condition.type)
+            bound.append(
+                CompiledCondition(
+                    type=condition.type,
+                    params=params,
+                    check=partial(evaluator, **params) if evaluator else None,
+                    cost=self.condition_costs.get(condition.type, DEFAULT_CONDITION_COST),
+                    stats=_condition_stats(condition.type, params) if track_stats else None,
+                    memo_key=(
+                        condition_key(condition.type, params)
+                        if condition.type not in self.unmemoized_conditions
+                        else None
+                    ),
+                    batch=partial(batch, **params) if batch else None,
+                )
+            )
+        return tuple(bound)
+
+    def _bind_actions(self, rule: RuleConfig) -> Tuple[CompiledAction, ...]:
+        """Resolve action executors (run=None for unknown types)."""
+        bound = []
+        for action, depends_on in zip(rule.actions, action_dependencies(rule.actions)):
+            params = action.params or {}
+            executor = self.action_executors.get(action.type)
+            bound.append(
+                CompiledAction(
+                    type=action.type,
+                    params=params,
+                    run=partial(executor, **params) if executor else None,
+                    halt_on_failure=action.halt_on_failure,
+                    depends_on=depends_on,
+                )
+            )
+        return tuple(bound)
+
+    def _debug_enabled(self) -> bool:
+        """Per-booking DEBUG lines are built only in verbose mode with DEBUG enabled."""
+        return self._verbose and logger.is_enabled_for(logging.DEBUG)
+
+    @staticmethod
+    def _booking_log_context(rule_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        booking = context.get("booking")
+        if not booking:
+            return {"rule_name": rule_name, "booking_num": "unknown", "phone_masked": "unknown"}
+        return {
+            "rule_name": rule_name,
+            "booking_num": str(getattr(booking, "booking_num", "unknown")),
+            "phone_masked": str(getattr(booking, "phone_masked", "unknown")),
+        }
+
+    def _check_conditions(
+        self,
+        rule: RuleConfig,
+        conditions: Tuple[CompiledCondition, ...],
+        context: Dict[str, Any],
+        memo: Optional[Dict[Tuple[str, str], Any]] = None,
+    ) -> bool:
+        """
+        AND-evaluate bound conditions, short-circuiting on the first failure.
 
+        Log context is only built on the branch that logs it; in summary
+        mode failed conditions and matches are only counted. With a memo
+        (one dict per booking), memoizable results are reused across rules.
+        """
+        for condition in conditions:
             # Unknown condition type fails the rule
-            if not evaluator:
+            if condition.check is None:
                 logger.error(
                     f"Unknown condition type '{condition.type}' in rule '{rule.name}'",
                     operation="evaluate_rule",
-                    context={**log_context, "condition_type": condition.type, "result": False},
+                    context={
+                        **self._booking_log_context(rule.name, context),
+                        "condition_type": condition.type,
+                        "result": False,
+                    },
                     error=f"No evaluator registered for '{condition.type}'",
                 )
                 return False
 
             try:
-                params = condition.params or {}
-                result = evaluator(context, **params)
+                key = condition.memo_key if memo is not None else None
+                if key is not None and key in memo:
+                    passed = memo[key]
+                else:
+                    passed = condition.check(context)
+                    if key is not None:
+                        memo[key] = passed
+                stats = condition.stats
+                if stats is not None:
+                    stats.evaluated += 1
+                    if passed:
+                        stats.passed += 1
 
                 # Short-circuit on first failing condition
-                if not result:
-                    logger.info(
-                        f"Rule '{rule.name}' condition '{condition.type}' not met",
-                        operation="evaluate_rule",
-                        context={
-                            **log_context,
-                            "condition_type": condition.type,
-                            "result": False,
-                            "params": params,
-                        },
-                    )
+                if not passed:
+                    self.run_summary.not_met(rule.name, condition.type)
+                    if self._verbose:
+                        logger.info(
+                            f"Rule '{rule.name}' condition '{condition.type}' not met",
+                            operation="evaluate_rule",
+                            context={
+                                **self._booking_log_context(rule.name, context),
+                                "condition_type": condition.type,
+                                "result": False,
+                                "params": condition.params,
+                            },
+                        )
                     return False
 
             except Exception as e:
                 logger.error(
                     f"Error evaluating condition '{condition.type}' in rule '{rule.name}'",
                     operation="evaluate_rule",
-                    context={**log_context, "condition_type": condition.type},
+                    context={
+                        **self._booking_log_context(rule.name, context),
+                        "condition_type": condition.type,
+                    },
                     error=str(e),
                 )
                 return False
 
         # All conditions passed
-        logger.info(
-            f"Rule '{rule.name}' matched - all conditions met",
-            operation="evaluate_rule",
-            context={**log_context, "result": True, "conditions_count": len(rule.conditions)},
-        )
+        self.run_summary.matched(rule.name)
+        if self._verbose:
+            logger.info(
+                f"Rule '{rule.name}' matched - all conditions met",
+                operation="evaluate_rule",
+                context={
+                    **self._booking_log_context(rule.name, context),
+                    "result": True,
+                    "conditions_count": len(conditions),
+                },
+            )
         return True
 
     def execute_rule(self, rule: RuleConfig, context: Dict[str, Any]) -> List[ActionResult]:
         """
         Execute all actions for a rule in sequence.
 
-        Errors in individual actions don't prevent subsequent actions from running.
+        Errors in individual actions don't prevent subsequent actions from running,
+        unless the failing action sets ``halt_on_failure`` (e.g. a conditional
+        create that lost the race to another invocation).
 
         Args:
             rule: RuleConfig to execute
@@ -339,114 +900,216 @@ class RuleEngine:
         Returns:
             List of ActionResult objects
         """
-        results: List[ActionResult] = []
-
-        # Extract booking info for logging context
-        booking = context.get("booking")
-        booking_num = str(getattr(booking, "booking_num", "unknown")) if booking else "unknown"
-        phone_masked = str(getattr(booking, "phone_masked", "unknown")) if booking else "unknown"
+        return self._run_actions(rule, self._bind_actions(rule), context)
+
+    def _run_actions(
+        self,
+        rule: RuleConfig,
+        actions: Tuple[CompiledAction, ...],
+        context: Dict[str, Any],
+    ) -> List[ActionResult]:
+        """Run bound actions in sequence, or as a dependency graph (see execute_rule)."""
         log_context = {
-            "rule_name": rule.name,
-            "booking_num": booking_num,
-            "phone_masked": phone_masked,
-            "actions_count": len(rule.actions),
+            **self._booking_log_context(rule.name, context),
+            "actions_count": len(actions),
         }
 
-        logger.info(
-            f"Executing {len(rule.actions)} action(s) for rule '{rule.name}'",
-            operation="execute_rule_start",
-            context=log_context,
-        )
-
-        for action_idx, action in enumerate(rule.actions, 1):
-            executor = self.action_executors.get(action.type)
+        if self._verbose:
+            logger.info(
+                f"Executing {len(actions)} action(s) for rule '{rule.name}'",
+                operation="execute_rule_start",
+                context=log_context,
+            )
 
-            action_log_context = {
-                **log_context,
-                "action_type": action.type,
-                "action_index": action_idx,
-            }
+        if self._action_pool is not None and len(actions) > 1:
+            results = self._run_action_graph(rule, actions, context, log_context)
+        else:
+            results = self._run_action_sequence(rule, actions, context, log_context)
 
-            # Unknown action type is recorded as failure
-            if not executor:
-                logger.error(
-                    f"Unknown action type '{action.type}' in rule '{rule.name}'",
-                    operation="execute_action",
-                    context=action_log_context,
-                    error=f"No executor registered for '{action.type}'",
-                )
-                results.append(
-                    ActionResult(
-                        rule_name=rule.name,
-                        action_type=action.type,
-                        success=False,
-                        message=f"Unknown action type: {action.type}",
-                        error=f"No executor registered for '{action.type}'",
-                    )
-                )
-                continue
+        # Log execution summary
+        success_count = sum(1 for r in results if r.success)
+        self.run_summary.actions(success_count, len(results) - success_count)
+        if self._verbose:
+            logger.info(
+                f"Completed {len(results)} action(s) for rule '{rule.name}': "
+                f"{success_count} succeeded, {len(results) - success_count} failed",
+                operation="execute_rule_complete",
+                context={
+                    **log_context,
+                    "actions_executed": len(results),
+                    "actions_succeeded": success_count,
+                    "actions_failed": len(results) - success_count,
+                },
+            )
 
-            try:
-                params = action.params or {}
+        return results
 
-                logger.debug(
-                    f"Executing action '{action.type}' [{action_idx}/{len(rule.actions)}]",
-                    operation="execute_action_start",
-                    context={**action_log_context, "params": params},
+    def _run_action_sequence(
+        self,
+        rule: RuleConfig,
+        actions: Tuple[CompiledAction, ...],
+        context: Dict[str, Any],
+        log_context: Dict[str, Any],
+    ) -> List[ActionResult]:
+        """Declared order; a failed halt_on_failure action skips the rest."""
+        results: List[ActionResult] = []
+        for action_idx, action in enumerate(actions, 1):
+            result = self._run_action(rule, action, action_idx, len(actions), context, log_context)
+            results.append(result)
+
+            if not result.success and action.halt_on_failure and action.run is not None:
+                logger.warning(
+                    f"Halting rule '{rule.name}' after failed action '{action.type}'",
+                    operation="execute_rule_halted",
+                    context={
+                        **log_context,
+                        "action_type": action.type,
+                        "action_index": action_idx,
+                        "actions_skipped": len(actions) - action_idx,
+                    },
                 )
+                break
+        return results
 
-                executor(context, **params)
+    def _run_action_graph(
+        self,
+        rule: RuleConfig,
+        actions: Tuple[CompiledAction, ...],
+        context: Dict[str, Any],
+        log_context: Dict[str, Any],
+    ) -> List[ActionResult]:
+        """
+        action_scheduling="dag": run actions level by level on the action pool.
 
-                results.append(
-                    ActionResult(
-                        rule_name=rule.name,
-                        action_type=action.type,
-                        success=True,
-                        message=f"Action '{action.type}' executed successfully",
-                        params=params,
-                    )
+        An action's level is one past its deepest dependency, so actions in
+        one level are independent and run concurrently. An action whose
+        dependency failed or was skipped is skipped (no ActionResult).
+        Results keep declared order.
+        """
+        levels: List[List[int]] = []
+        level_of: List[int] = []
+        for index, action in enumerate(actions):
+            level = 1 + max((level_of[dep] for dep in action.depends_on), default=-1)
+            level_of.append(level)
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(index)
+
+        outcome: Dict[int, Optional[ActionResult]] = {}
+        for level in levels:
+            runnable = []
+            for index in level:
+                action = actions[index]
+                failed = [
+                    actions[dep].type
+                    for dep in action.depends_on
+                    if outcome[dep] is None or not outcome[dep].success
+                ]
+                if not failed:
+                    runnable.append(index)
+                    continue
+                outcome[index] = None
+                logger.warning(
+                    f"Skipping action '{action.type}' in rule '{rule.name}': dependency failed",
+                    operation="execute_action_skipped",
+                    context={
+                        **log_context,
+                        "action_type": action.type,
+                        "action_index": index + 1,
+                        "failed_dependencies": failed,
+                    },
                 )
 
-                logger.info(
-                    f"Action '{action.type}' completed successfully",
-                    operation="execute_action",
-                    context={**action_log_context, "status": "success", "params": params},
+            def run(index: int) -> ActionResult:
+                return self._run_action(
+                    rule, actions[index], index + 1, len(actions), context, log_context
                 )
 
-            except Exception as e:
-                logger.error(
-                    f"Action '{action.type}' failed in rule '{rule.name}'",
-                    operation="execute_action",
-                    context=action_log_context,
-                    error=str(e),
-                )
+            if len(runnable) == 1:
+                outcome[runnable[0]] = run(runnable[0])
+            elif runnable:
+                futures = [(index, self._action_pool.submit(run, index)) for index in runnable]
+                for index, future in futures:
+                    outcome[index] = future.result()
+
+        return [result for _, result in sorted(outcome.items()) if result is not None]
+
+    def _run_action(
+        self,
+        rule: RuleConfig,
+        action: CompiledAction,
+        action_idx: int,
+        actions_count: int,
+        context: Dict[str, Any],
+        log_context: Dict[str, Any],
+    ) -> ActionResult:
+        """Run one bound action; failures (and unknown types) become failed results."""
+        action_log_context = {
+            **log_context,
+            "action_type": action.type,
+            "action_index": action_idx,
+        }
 
-                results.append(
-                    ActionResult(
-                        rule_name=rule.name,
-                        action_type=action.type,
-                        success=False,
-                        message=f"Action '{action.type}' failed",
-                        error=str(e),
-                        params=params,
-                    )
+        # Unknown action type is recorded as failure
+        executor = action.run
+        if not executor:
+            logger.error(
+                f"Unknown action type '{action.type}' in rule '{rule.name}'",
+                operation="execute_action",
+                context=action_log_context,
+                error=f"No executor registered for '{action.type}'",
+            )
+            return ActionResult(
+                rule_name=rule.name,
+                action_type=action.type,
+                success=False,
+                message=f"Unknown action type: {action.type}",
+                error=f"No executor registered for '{action.type}'",
+            )
+
+        params = action.params
+        try:
+            if self._debug_enabled():
+                logger.debug(
+                    f"Executing action '{action.type}' [{action_idx}/{actions_count}]",
+                    operation="execute_action_start",
+                    context={**action_log_context, "params": params},
                 )
 
-        # Log execution summary
-        success_count = sum(1 for r in results if r.success)
+            if self.action_limiter is not None:
+                with self.action_limiter.slot(action.type):
+                    executor(context)
+            else:
+                executor(context)
+
+        except Exception as e:
+            logger.error(
+                f"Action '{action.type}' failed in rule '{rule.name}'",
+                operation="execute_action",
+                context=action_log_context,
+                error=str(e),
+            )
+            return ActionResult(
+                rule_name=rule.name,
+                action_type=action.type,
+                success=False,
+                message=f"Action '{action.type}' failed",
+                error=str(e),
+                params=params,
+            )
+
         logger.info(
-            f"Completed {len(results)} action(s) for rule '{rule.name}': "
-            f"{success_count} succeeded, {len(results) - success_count} failed",
-            operation="execute_rule_complete",
-            context={
-                **log_context,
-                "actions_executed": len(results),
-                "actions_succeeded": success_count,
-                "actions_failed": len(results) - success_count,
-            },
+            f"Action '{action.type}' completed successfully",
+            operation="execute_action",
+            context={**action_log_context, "status": "success", "params": params},
+        )
+        return ActionResult(
+            rule_name=rule.name,
+            action_type=action.type,
+            success=True,
+            message=f"Action '{action.type}' executed successfully",
+            params=params,
         )
-
-        return results
 
     def process_booking(self, context: Dict[str, Any]) -> List[ActionResult]:
         """
@@ -462,55 +1125,261 @@ class RuleEngine:
             List of ActionResult objects from all matched rules
         """
         all_results: List[ActionResult] = []
+        self.run_summary.booking()
 
-        # Extract booking info for logging
-        booking = context.get("booking")
-        booking_num = str(getattr(booking, "booking_num", "unknown")) if booking else "unknown"
-        phone_masked = str(getattr(booking, "phone_masked", "unknown")) if booking else "unknown"
-        log_context = {
-            "booking_num": booking_num,
-            "phone_masked": phone_masked,
-            "total_rules": len(self.rules),
-        }
-
-        logger.info(
-            f"Processing booking through {len(self.rules)} rule(s)",
-            operation="process_booking_start",
-            context=log_context,
-        )
+        if self._verbose:
+            logger.info(
+                f"Processing booking through {len(self.rules)} rule(s)",
+                operation="process_booking_start",
+                context=self._process_log_context(context),
+            )
 
         matched_rules_count = 0
 
-        for rule in self.rules:
+        # Compiled plans have evaluators and params already bound; without
+        # compile() each rule is resolved by name as before
+        plans = self.plans
+        if plans is not None and self.index is not None:
+            # Only the plans whose indexed conditions can pass for this booking
+            plans = [self.plans[plan_id] for plan_id in self.index.candidates(context)]
+        # Condition results shared by the rules of this booking only
+        memo: Optional[Dict[Tuple[str, str], Any]] = {} if plans is not None else None
+        for item in plans if plans is not None else self.rules:
+            rule = item.rule if plans is not None else item
             try:
                 # Evaluate rule conditions
-                if self.evaluate_rule(rule, context):
+                if plans is not None:
+                    matched = self._check_conditions(rule, item.conditions, context, memo)
+                else:
+                    matched = self.evaluate_rule(rule, context)
+
+                if matched:
                     matched_rules_count += 1
                     # Execute rule actions
-                    results = self.execute_rule(rule, context)
+                    if plans is not None:
+                        results = self._run_actions(rule, item.actions, context)
+                    else:
+                        results = self.execute_rule(rule, context)
                     all_results.extend(results)
 
             except Exception as e:
                 logger.error(
                     f"Unexpected error processing rule '{rule.name}'",
                     operation="process_booking",
-                    context={**log_context, "rule_name": rule.name},
+                    context={**self._process_log_context(context), "rule_name": rule.name},
                     error=str(e),
                 )
 
+        if plans is not None and self.condition_order == "cost":
+            # Fold newly observed selectivity into the order periodically
+            self._bookings_since_reorder += 1
+            if self._bookings_since_reorder >= REORDER_INTERVAL:
+                self.reorder_plans()
+
         # Summary log
-        success_count = sum(1 for r in all_results if r.success)
+        if self._verbose:
+            success_count = sum(1 for r in all_results if r.success)
+            logger.info(
+                f"Booking processing complete: {matched_rules_count} rules matched, "
+                f"{len(all_results)} actions executed ({success_count} succeeded, "
+                f"{len(all_results) - success_count} failed)",
+                operation="process_booking_complete",
+                context={
+                    **self._process_log_context(context),
+                    "rules_matched": matched_rules_count,
+                    "actions_executed": len(all_results),
+                    "actions_succeeded": success_count,
+                    "actions_failed": len(all_results) - success_count,
+                },
+            )
+        return all_results
+
+    def _process_log_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        log_context = self._booking_log_context("", context)
+        del log_context["rule_name"]
+        return {**log_context, "total_rules": len(self.rules)}
+
+    def close(self) -> None:
+        """
+        Shut down the action pool of action_scheduling="dag" (no-op otherwise).
+
+        Called when the engine cache drops this engine. Rules processed after
+        close() run their actions sequentially.
+        """
+        pool, self._action_pool = self._action_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def flush_log_summary(self) -> Dict[str, Any]:
+        """
+        Log the counters collected since the last flush as one record, then reset them.
+
+        Returns:
+            The summary context (bookings, rules_matched, conditions_not_met,
+            actions_succeeded, actions_failed)
+        """
+        summary = self.run_summary.as_context()
+        self.run_summary = RunLogSummary()
+        if summary["bookings"]:
+            logger.info(
+                f"Rule engine summary: {summary['bookings']} bookings, "
+                f"{sum(summary['rules_matched'].values())} rule matches, "
+                f"{summary['actions_succeeded']} actions succeeded, "
+                f"{summary['actions_failed']} failed",
+                operation="rule_engine_summary",
+                context={**summary, "log_mode": self.log_mode},
+            )
+        return summary
+
+    def process_batch(self, contexts: Sequence[Dict[str, Any]]) -> List[List[ActionResult]]:
+        """
+        Process many bookings, evaluating each condition once over the batch.
+
+        Conditions are evaluated for all bookings before any action runs, so
+        they must not depend on earlier bookings' actions; callers split
+        repeated bookings into separate batches. Conditions registered with
+        memoize=False are still checked per booking, right before its actions.
+        Without compile(), falls back to process_booking() per context.
+
+        Args:
+            contexts: Rule contexts (booking, db_record, current_time, ...)
+
+        Returns:
+            ActionResults per context, in input order
+
+        Raises:
+            BatchMatchError: If the match masks could not be built; no action
+                has run, so the caller may retry the contexts one by one
+        """
+        plans = self.plans
+        if plans is None:
+            return [self.process_booking(context) for context in contexts]
+
+        started = time.perf_counter()
+        try:
+            columns = BookingColumns(contexts)
+            matrix = self.match_matrix(columns)
+        except Exception as e:
+            raise BatchMatchError(str(e)) from e
+        self.run_summary.booking(columns.size)
+        deferred = [
+            tuple(condition for condition in plan.conditions if condition.memo_key is None)
+            for plan in plans
+        ]
+
+        batch_results: List[List[ActionResult]] = []
+        matched_cells = 0
+        for row, context in enumerate(columns.contexts):
+            results: List[ActionResult] = []
+            for plan, mask, volatile in zip(plans, matrix, deferred):
+                if not mask[row]:
+                    continue
+                rule = plan.rule
+                try:
+                    if volatile and not self._check_conditions(rule, volatile, context):
+                        continue
+                    if not volatile:
+                        self.run_summary.matched(rule.name)
+                    matched_cells += 1
+                    results.extend(self._run_actions(rule, plan.actions, context))
+                except Exception as e:
+                    logger.error(
+                        f"Unexpected error processing rule '{rule.name}'",
+                        operation="process_batch",
+                        context=self._booking_log_context(rule.name, context),
+                        error=str(e),
+                    )
+            batch_results.append(results)
+
+        actions = [result for results in batch_results for result in results]
+        success_count = sum(1 for result in actions if result.success)
         logger.info(
-            f"Booking processing complete: {matched_rules_count} rules matched, "
-            f"{len(all_results)} actions executed ({success_count} succeeded, "
-            f"{len(all_results) - success_count} failed)",
-            operation="process_booking_complete",
+            f"Batch processing complete: {columns.size} bookings x {len(plans)} rules, "
+            f"{matched_cells} matched, {len(actions)} actions executed",
+            operation="process_batch_complete",
             context={
-                **log_context,
-                "rules_matched": matched_rules_count,
-                "actions_executed": len(all_results),
+                "bookings": columns.size,
+                "rules": len(plans),
+                "matched_cells": matched_cells,
+                "actions_executed": len(actions),
                 "actions_succeeded": success_count,
-                "actions_failed": len(all_results) - success_count,
+                "actions_failed": len(actions) - success_count,
             },
+            duration_ms=(time.perf_counter() - started) * 1000,
         )
-        return all_results
+        return batch_results
+
+    def match_matrix(self, columns: BookingColumns) -> List[List[bool]]:
+        """
+        Per-plan match masks over a batch (memoizable conditions only).
+
+        Masks of conditions shared by several rules are computed once.
+        Conditions without a batch evaluator, or whose batch evaluator
+        raises, are evaluated per booking for rows still matching. Rows a
+        condition rules out are counted as not met for that rule in the run
+        summary, once the whole matrix is built.
+        """
+        if self.plans is None:
+            raise ValueError("match_matrix() requires compile()")
+
+        masks: Dict[Tuple[str, str], List[bool]] = {}
+        row_results: Dict[Tuple[str, str], Dict[int, bool]] = {}
+        matrix: List[List[bool]] = []
+        not_met: List[Tuple[str, str, int]] = []
+        for plan in self.plans:
+            alive = [True] * columns.size
+            for condition in plan.conditions:
+                key = condition.memo_key
+                if key is None:
+                    continue  # checked per booking at dispatch time
+
+                mask = masks.get(key)
+                if mask is None and condition.batch is not None and key not in row_results:
+                    try:
+                        mask = masks[key] = condition.batch(columns)
+                    except Exception as e:
+                        logger.warning(
+                            f"Batch evaluator for '{condition.type}' failed; "
+                            "evaluating per booking",
+                            operation="process_batch",
+                            context={"condition_type": condition.type},
+                            error=str(e),
+                        )
+                if mask is None:
+                    cache = row_results.setdefault(key, {})
+                    for row, is_alive in enumerate(alive):
+                        if is_alive and row not in cache:
+                            context = columns.contexts[row]
+                            cache[row] = self._check_row(plan.rule, condition, context)
+                    mask = [cache.get(row, False) for row in range(columns.size)]
+
+                still_alive = [a and bool(m) for a, m in zip(alive, mask)]
+                failed = sum(alive) - sum(still_alive)
+                if failed:
+                    not_met.append((plan.rule.name, condition.type, failed))
+                alive = still_alive
+                if not any(alive):
+                    break
+            matrix.append(alive)
+
+        for rule_name, condition_type, count in not_met:
+            self.run_summary.not_met(rule_name, condition_type, count)
+        return matrix
+
+    def _check_row(
+        self, rule: RuleConfig, condition: CompiledCondition, context: Dict[str, Any]
+    ) -> bool:
+        """One condition for one booking; errors count as not met (logged)."""
+        try:
+            return bool(condition.check(context))
+        except Exception as e:
+            logger.error(
+                f"Error evaluating condition '{condition.type}' in rule '{rule.name}'",
+                operation="evaluate_rule",
+                context={
+                    **self._booking_log_context(rule.name, context),
+                    "condition_type": condition.type,
+                },
+                error=str(e),
+            )
+            return False
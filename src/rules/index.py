@@ -0,0 +1,223 @@
+"""
+Rule Index - Discrimination network over compiled rule plans
+
+The linear matcher runs every compiled rule's AND-chain for every booking.
+Many conditions only compare one booking attribute against values fixed in
+the rule params (booking status, store id, reservation date, current hour).
+RuleIndex groups those conditions by attribute, reads each attribute once per
+booking and drops the plans whose indexed conditions cannot pass. Surviving
+plans go through the normal AND evaluation, so results are identical to the
+linear matcher.
+
+Soundness rule: an index may only drop a plan when the condition would return
+False for that booking. Conditions whose params cannot be indexed, and
+attributes that cannot be read, never drop anything. Specs that share a
+``key`` must extract the same attribute: they are merged into one index.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Distinct attribute-key combinations whose candidate lists are kept
+CANDIDATE_CACHE_SIZE = 4096
+# Marker for an attribute that could not be read for a booking
+_UNREADABLE = object()
+
+
+@dataclass(frozen=True)
+class EqualityIndex:
+    """
+    Condition passes only if extract(context) is one of values(params).
+
+    values() returns None when the params cannot be indexed.
+    """
+
+    key: str
+    extract: Callable[[Dict[str, Any]], Optional[Hashable]]
+    values: Callable[[Dict[str, Any]], Optional[Iterable[Hashable]]]
+
+
+@dataclass(frozen=True)
+class RangeIndex:
+    """
+    Condition passes only if low <= extract(context) <= high for
+    (low, high) = bounds(params). A missing attribute (None) never passes.
+
+    bounds() returns None when the params cannot be indexed.
+    """
+
+    key: str
+    extract: Callable[[Dict[str, Any]], Any]
+    bounds: Callable[[Dict[str, Any]], Optional[Tuple[Any, Any]]]
+
+
+class _EqualityGroup:
+    """Plans constrained by equality conditions on one attribute."""
+
+    def __init__(self, extract: Callable[[Dict[str, Any]], Any]):
+        self.extract = extract
+        self.accepted: Dict[int, FrozenSet[Hashable]] = {}
+        self.rejected_by_value: Dict[Hashable, FrozenSet[int]] = {}
+        self.constrained: FrozenSet[int] = frozenset()
+
+    def add(self, plan_id: int, values: Iterable[Hashable]) -> None:
+        values = frozenset(values)
+        previous = self.accepted.get(plan_id)
+        # Several conditions on the same attribute in one AND-chain
+        self.accepted[plan_id] = values if previous is None else previous & values
+
+    def freeze(self) -> None:
+        by_value: Dict[Hashable, set] = {}
+        for plan_id, values in self.accepted.items():
+            for value in values:
+                by_value.setdefault(value, set()).add(plan_id)
+        self.constrained = frozenset(self.accepted)
+        self.rejected_by_value = {
+            value: self.constrained - frozenset(ids) for value, ids in by_value.items()
+        }
+
+    def rejected(self, key: Any) -> FrozenSet[int]:
+        # Values no plan accepts reject every constrained plan
+        return self.rejected_by_value.get(key, self.constrained)
+
+
+class _RangeGroup:
+    """Plans constrained by inclusive range conditions on one attribute."""
+
+    def __init__(self, extract: Callable[[Dict[str, Any]], Any]):
+        self.extract = extract
+        self.bounds: Dict[int, Tuple[Any, Any]] = {}
+        self.lows: List[Any] = []
+        self.entries: List[Tuple[Any, Any, int]] = []
+        self.constrained: FrozenSet[int] = frozenset()
+
+    def add(self, plan_id: int, bounds: Tuple[Any, Any]) -> None:
+        low, high = bounds
+        previous = self.bounds.get(plan_id)
+        if previous is not None:
+            low, high = max(low, previous[0]), min(high, previous[1])
+        self.bounds[plan_id] = (low, high)
+
+    def freeze(self) -> None:
+        self.entries = sorted(
+            ((low, high, plan_id) for plan_id, (low, high) in self.bounds.items()),
+            key=lambda entry: entry[0],
+        )
+        self.lows = [entry[0] for entry in self.entries]
+        self.constrained = frozenset(self.bounds)
+
+    def rejected(self, key: Any) -> FrozenSet[int]:
+        if key is None:
+            return self.constrained
+        # Ranges starting after key are out; of the rest, those ending before key
+        cut = bisect_right(self.lows, key)
+        rejected = {plan_id for _, _, plan_id in self.entries[cut:]}
+        rejected.update(plan_id for _, high, plan_id in self.entries[:cut] if high < key)
+        return frozenset(rejected)
+
+
+class RuleIndex:
+    """
+    Candidate plans per booking.
+
+    Usage:
+        index = RuleIndex(plans, engine.condition_indexes)
+        for plan_id in index.candidates(context):
+            plan = plans[plan_id]
+    """
+
+    def __init__(self, plans: Sequence[Any], specs: Dict[str, Any]):
+        """
+        Args:
+            plans: Compiled RulePlans (positions are the plan ids)
+            specs: Condition type -> EqualityIndex/RangeIndex
+        """
+        self.size = len(plans)
+        self._all = list(range(self.size))
+        self._cache: Dict[Tuple[Any, ...], List[int]] = {}
+        groups: Dict[Tuple[str, type], Any] = {}
+
+        for plan_id, plan in enumerate(plans):
+            for condition in plan.conditions:
+                spec = specs.get(condition.type)
+                if spec is None:
+                    continue
+                try:
+                    if isinstance(spec, RangeIndex):
+                        accepted = spec.bounds(condition.params)
+                    else:
+                        accepted = spec.values(condition.params)
+                except Exception:
+                    accepted = None
+                if accepted is None:
+                    continue
+
+                group_key = (spec.key, type(spec))
+                group = groups.get(group_key)
+                if group is None:
+                    group_cls = _RangeGroup if isinstance(spec, RangeIndex) else _EqualityGroup
+                    group = groups[group_key] = group_cls(spec.extract)
+                try:
+                    group.add(plan_id, accepted)
+                except TypeError:
+                    # Unhashable values / incomparable bounds: leave unindexed
+                    continue
+
+        self.groups = list(groups.values())
+        for group in self.groups:
+            group.freeze()
+        self.indexed_plans = len(frozenset().union(*(g.constrained for g in self.groups)))
+
+    def candidates(self, context: Dict[str, Any]) -> List[int]:
+        """Plan ids (in rule order) whose indexed conditions can all pass."""
+        keys = []
+        for group in self.groups:
+            try:
+                keys.append(group.extract(context))
+            except Exception:
+                keys.append(_UNREADABLE)
+        cache_key: Optional[Tuple[Any, ...]] = tuple(keys)
+        try:
+            cached = self._cache.get(cache_key)
+        except TypeError:
+            cached = cache_key = None
+        if cached is not None:
+            return cached
+
+        rejected: set = set()
+        for group, key in zip(self.groups, keys):
+            if key is _UNREADABLE:
+                continue
+            try:
+                rejected |= group.rejected(key)
+            except Exception:
+                # Incomparable key: prune nothing for this attribute
+                continue
+        result = (
+            [plan_id for plan_id in self._all if plan_id not in rejected]
+            if rejected
+            else self._all
+        )
+        if cache_key is not None and len(self._cache) < CANDIDATE_CACHE_SIZE:
+            self._cache[cache_key] = result
+        return result
+
+    def describe(self) -> Dict[str, Any]:
+        """Summary for the compile log."""
+        return {
+            "plans": self.size,
+            "indexed_plans": self.indexed_plans,
+            "indexes": len(self.groups),
+        }
@@ -130,6 +130,10 @@ class StructuredLogger:
 
         return json.dumps(log_entry, ensure_ascii=False)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether a record at `level` would be emitted (check before building costly context)."""
+        return self.logger.isEnabledFor(level)
+
     def debug(
         self,
         message: str,
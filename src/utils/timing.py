@@ -0,0 +1,46 @@
+"""
+Phase timing helpers.
+
+Collects wall-clock durations for named startup phases (imports, browser
+launch, cookie validation) so a single structured log line can show where
+cold-start time went.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class PhaseTimer:
+    """
+    Accumulate durations (milliseconds) per named phase.
+
+    Usage:
+        timer = PhaseTimer()
+        with timer.phase("chrome_launch"):
+            ...
+        logger.info("Startup", context=timer.as_context())
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and add it to phase name."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def record(self, name: str, duration_ms: float) -> None:
+        """Add an externally measured duration to phase name."""
+        self.phases[name] = self.phases.get(name, 0.0) + duration_ms
+
+    def total_ms(self) -> float:
+        return sum(self.phases.values())
+
+    def as_context(self) -> Dict[str, float]:
+        """Rounded `<phase>_ms` mapping for structured log context."""
+        return {f"{name}_ms": round(duration, 2) for name, duration in self.phases.items()}
@@ -1,4 +1,39 @@
 import os
 
+import pytest
+
 
 os.environ.setdefault("STRUCTURED_LOGGER_PROPAGATE", "true")
+
+
+@pytest.fixture(autouse=True)
+def _reset_cookie_warm_cache():
+    """Keep the process-wide warm cookie/warmup caches from leaking between tests."""
+    from src.auth.cookie_store import reset_warm_cache
+    from src.auth.partner_warmup import reset_warmup_cache
+
+    reset_warm_cache()
+    reset_warmup_cache()
+    yield
+    reset_warm_cache()
+    reset_warmup_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_condition_stats():
+    """Observed condition selectivity is process-wide; start each test fresh."""
+    from src.rules.engine import reset_condition_stats
+
+    reset_condition_stats()
+    yield
+    reset_condition_stats()
+
+
+@pytest.fixture(autouse=True)
+def _reset_engine_cache():
+    """The parsed rule engine is cached per process; build a fresh one per test."""
+    from src.rules.cache import reset_engine_cache
+
+    reset_engine_cache()
+    yield
+    reset_engine_cache()
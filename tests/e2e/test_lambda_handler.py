@@ -6,6 +6,7 @@ Implements AC 9 requirements for automated coverage.
 """
 
 import json
+import threading
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 import pytest
@@ -13,7 +14,7 @@ import pytest
 # Import the main module to ensure coverage tracking
 from src.main import lambda_handler, process_all_bookings
 from src.domain.booking import Booking
-from src.rules.engine import ActionResult
+from src.rules.engine import ActionResult, BatchMatchError
 
 
 class MockContext:
@@ -76,6 +77,7 @@ def mock_authenticator():
         mock_auth.login.return_value = [{"name": "test_cookie", "value": "test_value"}]
         mock_auth.get_session.return_value = Mock()
         mock_auth.cleanup.return_value = None
+        mock_auth.startup_summary.return_value = {"browser_started": False}
         mock_auth_class.return_value = mock_auth
         yield mock_auth
 
@@ -108,7 +110,11 @@ def mock_booking_api():
 @pytest.fixture
 def mock_rule_engine():
     """Mock RuleEngine for processing."""
-    with patch("src.main.RuleEngine") as mock_engine_class:
+    rules = Mock(label="config/rules.yaml")
+    rules.read.return_value = "rules: []\n"
+    with patch("src.main.RuleEngine") as mock_engine_class, patch(
+        "src.main.rules_source", return_value=rules
+    ):
         mock_engine = MagicMock()
         mock_engine.process_booking.return_value = [
             ActionResult(
@@ -242,6 +248,65 @@ def test_lambda_handler_success(
     assert mock_telegram.called
 
 
+def test_lambda_handler_warm_invocation_reuses_compiled_engine(
+    mock_settings,
+    mock_dynamodb,
+    mock_session_manager,
+    mock_authenticator,
+    mock_booking_api,
+    mock_rule_engine,
+    mock_stores_yaml,
+    mock_register_conditions,
+    mock_register_actions,
+    mock_booking_repo,
+    mock_sms_service,
+    mock_telegram,
+):
+    """A warm invocation binds its own services without registering or compiling again."""
+    from src.main import RuleEngine, action_services
+
+    with patch("src.main.setup_logging_redaction"):
+        lambda_handler({}, MockContext())
+        first_services = action_services.current
+        result = lambda_handler({}, MockContext())
+
+    assert result["statusCode"] == 200
+    RuleEngine.assert_called_once()
+    mock_register_actions.assert_called_once_with(mock_rule_engine, action_services)
+    mock_rule_engine.compile.assert_called_once()
+    assert action_services.current is not first_services
+    assert mock_rule_engine.process_booking.call_count == 2
+
+
+def test_lambda_handler_stops_when_shard_lease_lost(
+    mock_settings,
+    mock_dynamodb,
+    mock_session_manager,
+    mock_authenticator,
+    mock_booking_api,
+    mock_rule_engine,
+    mock_stores_yaml,
+    mock_register_conditions,
+    mock_register_actions,
+    mock_booking_repo,
+    mock_sms_service,
+    mock_telegram,
+):
+    """A run whose shard lease was lost stops before processing any booking."""
+    heartbeat = Mock(lost=True)
+
+    with patch("src.main.setup_logging_redaction"), patch(
+        "src.main._claim_run_shard", return_value=(["1051707"], heartbeat)
+    ):
+        result = lambda_handler({}, MockContext())
+
+    body = json.loads(result["body"])
+    assert result["statusCode"] == 200
+    assert body["lease_lost"] is True
+    assert not mock_rule_engine.process_booking.called
+    heartbeat.stop.assert_called_once_with(release=True)
+
+
 def test_lambda_handler_error_handling(
     mock_settings, mock_dynamodb, mock_session_manager, mock_stores_yaml
 ):
@@ -494,5 +559,229 @@ def test_process_all_bookings_handles_exceptions():
     assert summary["actions_succeeded"] == 1  # Second booking success
 
 
+def test_process_all_bookings_batched_prefetches_and_splits_repeats():
+    """
+    Test RULE_BATCH_EVALUATION path.
+
+    Verifies:
+    - DB records are prefetched with one batch read per wave
+    - A repeated booking is evaluated in a later wave, after its first occurrence
+    - Results and summary are returned in booking order
+    """
+
+    def make_booking(number):
+        return Booking(
+            booking_num=f"1051707_{number}",
+            phone=f"010-0000-000{number}",
+            name=f"Test {number}",
+            booking_time="2025-10-19 20:30:00",
+            book_id=number,
+            biz_id="1051707",
+            option=False,
+            reserve_at=datetime(2025, 10, 19, 20, 30),
+            status="RC03",
+        )
+
+    first, second = make_booking(1), make_booking(2)
+
+    def process_batch(contexts):
+        return [
+            [
+                ActionResult(
+                    rule_name=f"Rule {ctx['booking'].book_id}",
+                    action_type="send_sms",
+                    success=True,
+                    message="SMS sent",
+                )
+            ]
+            for ctx in contexts
+        ]
+
+    mock_engine = MagicMock()
+    mock_engine.rules = []
+    mock_engine.process_batch.side_effect = process_batch
+
+    mock_repo = MagicMock()
+    mock_repo.batch_get_bookings.side_effect = [
+        {("1051707_1", "010-0000-0001"): {"confirm_sms": True}},
+        {("1051707_1", "010-0000-0001"): {"confirm_sms": True, "remind_sms": True}},
+    ]
+
+    with patch("src.main.RULE_BATCH_EVALUATION", True):
+        results, summary = process_all_bookings(
+            bookings=[first, second, first],
+            engine=mock_engine,
+            booking_repo=mock_repo,
+            settings=MagicMock(),
+            stores_config={"stores": {}},
+        )
+
+    waves = [call.args[0] for call in mock_repo.batch_get_bookings.call_args_list]
+    assert waves == [
+        [("1051707_1", "010-0000-0001"), ("1051707_2", "010-0000-0002")],
+        [("1051707_1", "010-0000-0001")],
+    ]
+    second_wave = mock_engine.process_batch.call_args_list[1].args[0]
+    assert second_wave[0]["db_record"] == {"confirm_sms": True, "remind_sms": True}
+    mock_repo.get_booking.assert_not_called()
+    mock_engine.process_booking.assert_not_called()
+
+    assert [r.rule_name for r in results] == ["Rule 1", "Rule 2", "Rule 1"]
+    assert summary["bookings_processed"] == 3
+    assert summary["sms_sent"] == 3
+
+
+def test_process_all_bookings_batched_fallback_never_resends():
+    """
+    Test RULE_BATCH_EVALUATION failure handling.
+
+    Verifies:
+    - A wave whose masks failed runs per booking, one failing booking at a time
+    - A wave that failed after actions started is not run again
+    """
+
+    def make_booking(number):
+        return Booking(
+            booking_num=f"1051707_{number}",
+            phone=f"010-0000-000{number}",
+            name=f"Test {number}",
+            booking_time="2025-10-19 20:30:00",
+            book_id=number,
+            biz_id="1051707",
+            option=False,
+            reserve_at=datetime(2025, 10, 19, 20, 30),
+            status="RC03",
+        )
+
+    def process_booking(context):
+        booking = context["booking"]
+        if booking.book_id == 2:
+            raise RuntimeError("rule failure")
+        return [
+            ActionResult(
+                rule_name=f"Rule {booking.book_id}",
+                action_type="send_sms",
+                success=True,
+                message="SMS sent",
+            )
+        ]
+
+    bookings = [make_booking(number) for number in range(1, 4)]
+    mock_repo = MagicMock()
+    mock_repo.batch_get_bookings.return_value = {}
+
+    mock_engine = MagicMock()
+    mock_engine.rules = []
+    mock_engine.process_batch.side_effect = BatchMatchError("mask failed")
+    mock_engine.process_booking.side_effect = process_booking
+
+    with patch("src.main.RULE_BATCH_EVALUATION", True):
+        results, summary = process_all_bookings(
+            bookings=bookings,
+            engine=mock_engine,
+            booking_repo=mock_repo,
+            settings=MagicMock(),
+            stores_config={"stores": {}},
+        )
+
+    assert mock_engine.process_booking.call_count == 3
+    assert [r.rule_name for r in results] == ["Rule 1", "Rule 3"]
+    assert summary["bookings_processed"] == 2
+    assert summary["actions_failed"] == 1
+
+    mock_engine.reset_mock()
+    mock_engine.process_batch.side_effect = RuntimeError("failed mid-wave")
+
+    with patch("src.main.RULE_BATCH_EVALUATION", True):
+        results, summary = process_all_bookings(
+            bookings=bookings,
+            engine=mock_engine,
+            booking_repo=mock_repo,
+            settings=MagicMock(),
+            stores_config={"stores": {}},
+        )
+
+    mock_engine.process_booking.assert_not_called()
+    assert results == []
+    assert summary["actions_failed"] == 3
+
+
+def test_process_all_bookings_concurrent_keeps_booking_order():
+    """
+    Test RULE_WORKERS > 1 path.
+
+    Verifies:
+    - Every booking fetches its DB record and is processed once per occurrence
+    - Each worker thread reads and writes through its own repository
+    - A failing booking is counted without stopping the others
+    - Results are returned in booking order
+    """
+
+    def make_booking(number):
+        return Booking(
+            booking_num=f"1051707_{number}",
+            phone=f"010-0000-000{number}",
+            name=f"Test {number}",
+            booking_time="2025-10-19 20:30:00",
+            book_id=number,
+            biz_id="1051707",
+            option=False,
+            reserve_at=datetime(2025, 10, 19, 20, 30),
+            status="RC03",
+        )
+
+    bookings = [make_booking(number) for number in range(1, 6)] + [make_booking(1)]
+
+    def process_booking(context):
+        booking = context["booking"]
+        if booking.book_id == 3:
+            raise RuntimeError("rule failure")
+        return [
+            ActionResult(
+                rule_name=f"Rule {booking.book_id}",
+                action_type="send_sms",
+                success=True,
+                message="SMS sent",
+            )
+        ]
+
+    mock_engine = MagicMock()
+    mock_engine.rules = []
+    mock_engine.process_booking.side_effect = process_booking
+
+    worker_repos = []
+
+    def for_worker_thread():
+        repo = MagicMock()
+        repo.get_booking.return_value = None
+        worker_repos.append((threading.get_ident(), repo))
+        return repo
+
+    mock_repo = MagicMock()
+    mock_repo.for_worker_thread.side_effect = for_worker_thread
+
+    with patch("src.main.RULE_WORKERS", 3):
+        results, summary = process_all_bookings(
+            bookings=bookings,
+            engine=mock_engine,
+            booking_repo=mock_repo,
+            settings=MagicMock(),
+            stores_config={"stores": {}},
+        )
+
+    mock_repo.get_booking.assert_not_called()
+    assert len({ident for ident, _ in worker_repos}) == len(worker_repos)
+    assert sum(repo.get_booking.call_count for _, repo in worker_repos) == 6
+    context_repos = {
+        id(call.args[0]["db_repo"]) for call in mock_engine.process_booking.call_args_list
+    }
+    assert context_repos <= {id(repo) for _, repo in worker_repos}
+    assert mock_engine.process_booking.call_count == 6
+    assert [r.rule_name for r in results] == ["Rule 1", "Rule 2", "Rule 4", "Rule 5", "Rule 1"]
+    assert summary["bookings_processed"] == 5
+    assert summary["actions_failed"] == 1
+    assert summary["sms_sent"] == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
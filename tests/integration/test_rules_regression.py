@@ -96,6 +96,12 @@ class InMemoryBookingRepository:
         self.seed_record(booking_num, phone, record)
         return True
 
+    def create_booking_if_absent(self, record: Dict[str, Any]) -> bool:
+        """Create the record unless it already exists."""
+        if (record["booking_num"], record["phone"]) in self.records:
+            return False
+        return self.create_booking(record)
+
     def get_booking(self, prefix: str, phone: str) -> Dict[str, Any] | None:
         """Fetch booking if it exists."""
         return self.records.get((prefix, phone))
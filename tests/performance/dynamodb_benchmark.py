@@ -0,0 +1,304 @@
+"""
+DynamoDB Repository Benchmark Harness
+
+Seeds an `sms` table with synthetic booking records and drives
+BookingRepository operations under configurable concurrency:
+- get_booking (point reads)
+- batch_get_bookings (BatchGetItem, 100 keys per request)
+- scan_unnotified_options (full paginated scan)
+- update_flag (point writes)
+
+Runs against moto's in-memory DynamoDB by default, or against a local
+DynamoDB-compatible endpoint (DynamoDB Local, LocalStack) via --endpoint-url.
+Results are written as JSON so runs before and after a repository change
+can be diffed directly.
+
+Usage:
+    python -m tests.performance.dynamodb_benchmark --records 10000 --concurrency 8
+    python -m tests.performance.dynamodb_benchmark --records 1000000 \\
+        --endpoint-url http://localhost:8000 --output results.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import boto3
+
+from src.database import dynamodb_client
+from src.database.dynamodb_client import BookingRepository
+
+logger = logging.getLogger(__name__)
+
+REGION = "ap-northeast-2"
+TABLE_NAME = "sms"
+STORE_IDS = ["1051707", "951291", "1120125", "1285716", "1462519"]
+DEFAULT_RESULTS_DIR = Path(__file__).parent.parent / "fixtures" / "performance"
+
+Key = Tuple[str, str]
+
+
+def build_record(index: int, rng: random.Random) -> Dict[str, Any]:
+    """Build a deterministic synthetic `sms` record."""
+    store_id = STORE_IDS[index % len(STORE_IDS)]
+    booking_time = datetime(2025, 1, 1, 9, 0) + timedelta(minutes=30 * index)
+    return {
+        "booking_num": f"{store_id}_{index:08d}",
+        "phone": f"010-{(index // 10000) % 10000:04d}-{index % 10000:04d}",
+        "name": f"고객{index}",
+        "booking_time": booking_time.strftime("%Y-%m-%d %H:%M:%S"),
+        "confirm_sms": True,
+        "remind_sms": rng.random() < 0.8,
+        "option_sms": rng.random() < 0.9,
+    }
+
+
+@contextmanager
+def benchmark_backend(endpoint_url: Optional[str] = None) -> Iterator[Any]:
+    """Yield a DynamoDB resource backed by moto or a local endpoint."""
+    if endpoint_url:
+        yield boto3.resource(
+            "dynamodb",
+            region_name=REGION,
+            endpoint_url=endpoint_url,
+            aws_access_key_id="benchmark",
+            aws_secret_access_key="benchmark",  # nosec B106
+        )
+        return
+
+    from moto import mock_aws
+
+    with mock_aws():
+        yield boto3.resource("dynamodb", region_name=REGION)
+
+
+def create_table(dynamodb: Any, table_name: str = TABLE_NAME) -> Any:
+    """Create the `sms` table (dropping any existing benchmark table)."""
+    existing = [table.name for table in dynamodb.tables.all()]
+    if table_name in existing:
+        dynamodb.Table(table_name).delete()
+        dynamodb.meta.client.get_waiter("table_not_exists").wait(TableName=table_name)
+
+    table = dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[
+            {"AttributeName": "booking_num", "KeyType": "HASH"},
+            {"AttributeName": "phone", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "booking_num", "AttributeType": "S"},
+            {"AttributeName": "phone", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    table.wait_until_exists()
+    return table
+
+
+def seed_table(table: Any, record_count: int, seed: int = 42) -> Tuple[List[Key], float]:
+    """
+    Seed the table with synthetic records via batch_writer.
+
+    Returns:
+        (keys, duration_ms)
+    """
+    rng = random.Random(seed)
+    keys: List[Key] = []
+    start = time.perf_counter()
+    with table.batch_writer() as writer:
+        for index in range(record_count):
+            record = build_record(index, rng)
+            writer.put_item(Item=record)
+            keys.append((record["booking_num"], record["phone"]))
+    return keys, (time.perf_counter() - start) * 1000
+
+
+def summarize(latencies_ms: Sequence[float], wall_ms: float, errors: int) -> Dict[str, Any]:
+    """Aggregate per-call latencies into comparable statistics."""
+    ordered = sorted(latencies_ms)
+    count = len(ordered)
+
+    def percentile(p: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(count - 1, max(0, int(round(p / 100.0 * count)) - 1))
+        return round(ordered[index], 3)
+
+    return {
+        "count": count,
+        "errors": errors,
+        "wall_ms": round(wall_ms, 3),
+        "ops_per_sec": round(count / (wall_ms / 1000), 2) if wall_ms > 0 else 0.0,
+        "mean_ms": round(sum(ordered) / count, 3) if count else 0.0,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def run_concurrently(
+    func: Callable[[Any], Any], items: Sequence[Any], concurrency: int
+) -> Dict[str, Any]:
+    """Run func over items on a thread pool and time every call."""
+
+    def timed(item: Any) -> Tuple[float, bool]:
+        start = time.perf_counter()
+        try:
+            func(item)
+            return (time.perf_counter() - start) * 1000, True
+        except Exception as exc:  # noqa: BLE001 - counted and reported
+            logger.warning("Benchmark call failed: %s", exc)
+            return (time.perf_counter() - start) * 1000, False
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        outcomes = list(pool.map(timed, items))
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+
+    latencies = [latency for latency, ok in outcomes if ok]
+    errors = sum(1 for _, ok in outcomes if not ok)
+    return summarize(latencies, wall_ms, errors)
+
+
+def run_benchmark(
+    record_count: int = 10_000,
+    concurrency: int = 4,
+    operations: int = 1_000,
+    batch_size: int = 100,
+    scan_repeats: int = 1,
+    endpoint_url: Optional[str] = None,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Seed the table and benchmark repository operations.
+
+    Args:
+        record_count: Number of `sms` records to seed (10k–1M)
+        concurrency: Worker threads per operation
+        operations: Point reads / flag updates to issue
+        batch_size: Keys per batch_get_bookings call
+        scan_repeats: Number of full scan_unnotified_options runs
+        endpoint_url: Local DynamoDB endpoint (default: moto in-memory)
+        seed: RNG seed for record contents and key sampling
+
+    Returns:
+        JSON-serializable results dict
+    """
+    # Repository logs every call at INFO - silence it so logging is not measured
+    repo_logger = dynamodb_client.logger.logger
+    previous_level = repo_logger.level
+    repo_logger.setLevel(logging.WARNING)
+
+    try:
+        results, seed_ms = _run_operations(
+            record_count, concurrency, operations, batch_size, scan_repeats, endpoint_url, seed
+        )
+    finally:
+        repo_logger.setLevel(previous_level)
+
+    return {
+        "metadata": {
+            "timestamp": datetime.now().isoformat(),
+            "backend": endpoint_url or "moto",
+            "record_count": record_count,
+            "concurrency": concurrency,
+            "operations": operations,
+            "batch_size": batch_size,
+            "scan_repeats": scan_repeats,
+            "seed": seed,
+            "seed_duration_ms": round(seed_ms, 3),
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+
+
+def _run_operations(
+    record_count: int,
+    concurrency: int,
+    operations: int,
+    batch_size: int,
+    scan_repeats: int,
+    endpoint_url: Optional[str],
+    seed: int,
+) -> Tuple[Dict[str, Any], float]:
+    with benchmark_backend(endpoint_url) as dynamodb:
+        table = create_table(dynamodb)
+        keys, seed_ms = seed_table(table, record_count, seed=seed)
+        repo = BookingRepository(table_name=TABLE_NAME, dynamodb_resource=dynamodb)
+
+        rng = random.Random(seed)
+        sample = [rng.choice(keys) for _ in range(operations)]
+        batches = [sample[i : i + batch_size] for i in range(0, len(sample), batch_size)]
+
+        results = {
+            "get_booking": run_concurrently(
+                lambda key: repo.get_booking(*key), sample, concurrency
+            ),
+            "batch_get_bookings": run_concurrently(
+                repo.batch_get_bookings, batches, concurrency
+            ),
+            "scan_unnotified_options": run_concurrently(
+                lambda _: repo.scan_unnotified_options(), range(scan_repeats), 1
+            ),
+            "update_flag": run_concurrently(
+                lambda key: repo.update_flag(key[0], key[1], "remind_sms", True),
+                sample,
+                concurrency,
+            ),
+        }
+
+    return results, seed_ms
+
+
+def save_results(results: Dict[str, Any], output_file: Optional[Path] = None) -> Path:
+    """Write results JSON (default: tests/fixtures/performance/)."""
+    if output_file is None:
+        DEFAULT_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = DEFAULT_RESULTS_DIR / f"dynamodb_benchmark_{stamp}.json"
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    return output_file
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark BookingRepository operations")
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--operations", type=int, default=1_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--scan-repeats", type=int, default=1)
+    parser.add_argument("--endpoint-url", default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        record_count=args.records,
+        concurrency=args.concurrency,
+        operations=args.operations,
+        batch_size=args.batch_size,
+        scan_repeats=args.scan_repeats,
+        endpoint_url=args.endpoint_url,
+        seed=args.seed,
+    )
+    output_file = save_results(results, args.output)
+    print(json.dumps(results["results"], indent=2))
+    print(f"Results written to {output_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,290 @@
+"""
+Rule Engine Benchmark Harness
+
+Runs synthetic bookings through RuleEngine.process_booking() with the
+production rules (config/rules.yaml) and real condition evaluators, once
+resolving evaluators by name per booking (uncompiled), once through the
+compiled RulePlans checked linearly, once through the indexed matcher and
+once through process_batch() (per-condition masks over all bookings).
+Action executors are no-ops so only rule evaluation and dispatch are measured.
+
+--extra-rules N appends N synthetic store-specific date-range promotions to
+the production rules, to see how each mode scales with the rule count.
+
+Engine logging is replaced by a no-op logger by default so the comparison is
+not dominated by JSON log formatting; pass --with-logging to include it, and
+--log-mode summary to measure the engine's per-run summary logging instead.
+
+Usage:
+    python -m tests.performance.rule_engine_benchmark --bookings 5000 --repeats 3
+    python -m tests.performance.rule_engine_benchmark --extra-rules 200
+    python -m tests.performance.rule_engine_benchmark --with-logging --log-mode summary
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import yaml
+
+from src.domain.booking import Booking
+from src.rules import engine as engine_module
+from src.rules.conditions import register_conditions
+from src.rules.engine import RuleEngine
+
+RULES_PATH = Path(__file__).resolve().parents[2] / "config" / "rules.yaml"
+DEFAULT_RESULTS_DIR = Path(__file__).parent.parent / "fixtures" / "performance"
+STORE_IDS = ["1051707", "951291", "1120125", "1285716", "1462519"]
+ACTION_TYPES = ("send_sms", "create_db_record", "update_flag", "send_telegram", "send_slack", "log_event")
+NOW = datetime(2025, 11, 15, 20, 0)
+
+
+class _SilentLogger:
+    """Stand-in for the engine's StructuredLogger that drops every call."""
+
+    def _drop(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    debug = info = warning = error = _drop
+
+    def is_enabled_for(self, level: int) -> bool:
+        return False
+
+
+@contextmanager
+def engine_logging(enabled: bool) -> Iterator[None]:
+    """Swap the engine logger for a no-op unless logging is being measured."""
+    if enabled:
+        yield
+        return
+    original = engine_module.logger
+    engine_module.logger = _SilentLogger()  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        engine_module.logger = original
+
+
+def build_contexts(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Deterministic booking contexts with a realistic mix of new/known bookings."""
+    rng = random.Random(seed)
+    contexts = []
+    for index in range(count):
+        store_id = STORE_IDS[index % len(STORE_IDS)]
+        reserve_at = NOW + timedelta(minutes=rng.randint(-600, 2880))
+        booking = Booking(
+            booking_num=f"{store_id}_{index:08d}",
+            phone=f"010-{index // 10000 % 10000:04d}-{index % 10000:04d}",
+            name=f"고객{index}",
+            booking_time=reserve_at.strftime("%Y-%m-%d %H:%M:%S"),
+            book_id=index,
+            biz_id=store_id,
+            option=rng.random() < 0.3,
+            reserve_at=reserve_at,
+            status=rng.choice(["RC03", "RC03", "RC03", "RC08"]),
+        )
+        db_record = None
+        if rng.random() < 0.7:
+            db_record = {
+                "booking_num": booking.booking_num,
+                "phone": booking.phone,
+                "confirm_sms": True,
+                "remind_sms": rng.random() < 0.5,
+                "option_sms": rng.random() < 0.8,
+            }
+        contexts.append(
+            {
+                "booking": booking,
+                "db_record": db_record,
+                "current_time": NOW,
+                "settings": None,
+                "db_client": None,
+            }
+        )
+    return contexts
+
+
+def build_rules_file(extra_rules: int, directory: Path, seed: int = 42) -> Path:
+    """Production rules plus `extra_rules` store-specific date-range promotions."""
+    if extra_rules <= 0:
+        return RULES_PATH
+    rng = random.Random(seed)
+    with open(RULES_PATH, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    for index in range(extra_rules):
+        store_id = int(rng.choice(STORE_IDS))
+        start = NOW.date() + timedelta(days=rng.randint(-30, 30))
+        config["rules"].append(
+            {
+                "name": f"Promotion {index}",
+                "enabled": True,
+                "conditions": [
+                    {"type": "booking_status", "params": {"status": "RC03"}},
+                    {"type": "store_id_matches", "params": {"store_ids": [store_id]}},
+                    {
+                        "type": "date_range",
+                        "params": {
+                            "start_date": start.isoformat(),
+                            "end_date": (start + timedelta(days=rng.randint(0, 3))).isoformat(),
+                        },
+                    },
+                    {"type": "flag_not_set", "params": {"flag": "option_sms"}},
+                ],
+                "actions": [{"type": "log_event", "params": {"event_type": "promotion"}}],
+            }
+        )
+    rules_file = directory / "rules_with_promotions.yaml"
+    with open(rules_file, "w", encoding="utf-8") as f:
+        yaml.safe_dump(config, f, allow_unicode=True)
+    return rules_file
+
+
+def build_engine(
+    rules_path: Path = RULES_PATH,
+    compiled: bool = True,
+    matcher: str = "linear",
+    log_mode: str = "verbose",
+) -> RuleEngine:
+    """Rules with real conditions and no-op actions."""
+    engine = RuleEngine(str(rules_path), matcher=matcher, log_mode=log_mode)
+    register_conditions(engine)
+    for action_type in ACTION_TYPES:
+        engine.register_action(action_type, lambda context, **params: None)
+    if compiled:
+        engine.compile()
+    return engine
+
+
+def time_engine(
+    engine: RuleEngine, contexts: List[Dict[str, Any]], repeats: int, batch: bool = False
+) -> Dict[str, Any]:
+    """Process every context `repeats` times; report per-pass and per-booking cost."""
+    passes_ms = []
+    matched = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        if batch:
+            matched = sum(len(results) for results in engine.process_batch(contexts))
+        else:
+            matched = sum(len(engine.process_booking(context)) for context in contexts)
+        passes_ms.append((time.perf_counter() - start) * 1000)
+
+    best_ms = min(passes_ms)
+    return {
+        "passes": repeats,
+        "best_ms": round(best_ms, 3),
+        "median_ms": round(statistics.median(passes_ms), 3),
+        "per_booking_us": round(best_ms * 1000 / max(len(contexts), 1), 3),
+        "actions_dispatched": matched,
+    }
+
+
+def run_benchmark(
+    booking_count: int = 5_000,
+    repeats: int = 3,
+    with_logging: bool = False,
+    seed: int = 42,
+    extra_rules: int = 0,
+    log_mode: str = "verbose",
+) -> Dict[str, Any]:
+    """
+    Compare uncompiled, compiled and indexed rule evaluation over the same bookings.
+
+    Returns:
+        JSON-serializable results dict
+    """
+    contexts = build_contexts(booking_count, seed=seed)
+    with tempfile.TemporaryDirectory() as tmp, engine_logging(with_logging):
+        rules_path = build_rules_file(extra_rules, Path(tmp), seed=seed)
+        uncompiled = time_engine(
+            build_engine(rules_path, compiled=False, log_mode=log_mode), contexts, repeats
+        )
+        compiled = time_engine(build_engine(rules_path, log_mode=log_mode), contexts, repeats)
+        indexed = time_engine(
+            build_engine(rules_path, matcher="indexed", log_mode=log_mode), contexts, repeats
+        )
+        batched = time_engine(
+            build_engine(rules_path, log_mode=log_mode), contexts, repeats, batch=True
+        )
+
+    return {
+        "metadata": {
+            "timestamp": datetime.now().isoformat(),
+            "bookings": booking_count,
+            "repeats": repeats,
+            "with_logging": with_logging,
+            "seed": seed,
+            "extra_rules": extra_rules,
+            "log_mode": log_mode,
+            "python": platform.python_version(),
+        },
+        "results": {
+            "uncompiled": uncompiled,
+            "compiled": compiled,
+            "indexed": indexed,
+            "batch": batched,
+            "speedup": round(uncompiled["best_ms"] / compiled["best_ms"], 3)
+            if compiled["best_ms"]
+            else None,
+            "indexed_speedup": round(compiled["best_ms"] / indexed["best_ms"], 3)
+            if indexed["best_ms"]
+            else None,
+            "batch_speedup": round(compiled["best_ms"] / batched["best_ms"], 3)
+            if batched["best_ms"]
+            else None,
+            # Against the default sequential path (indexed matcher)
+            "batch_vs_indexed_speedup": round(indexed["best_ms"] / batched["best_ms"], 3)
+            if batched["best_ms"]
+            else None,
+        },
+    }
+
+
+def save_results(results: Dict[str, Any], output_file: Optional[Path] = None) -> Path:
+    """Write results JSON (default: tests/fixtures/performance/)."""
+    if output_file is None:
+        DEFAULT_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = DEFAULT_RESULTS_DIR / f"rule_engine_benchmark_{stamp}.json"
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    return output_file
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark RuleEngine evaluation")
+    parser.add_argument("--bookings", type=int, default=5_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--with-logging", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--extra-rules", type=int, default=0)
+    parser.add_argument("--log-mode", choices=("verbose", "summary"), default="verbose")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        booking_count=args.bookings,
+        repeats=args.repeats,
+        with_logging=args.with_logging,
+        seed=args.seed,
+        extra_rules=args.extra_rules,
+        log_mode=args.log_mode,
+    )
+    output_file = save_results(results, args.output)
+    print(json.dumps(results["results"], indent=2))
+    print(f"Results written to {output_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
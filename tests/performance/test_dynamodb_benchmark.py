@@ -0,0 +1,85 @@
+"""
+DynamoDB repository benchmark smoke tests.
+
+Runs the benchmark harness at a small scale to keep it working; full-volume
+runs (10k–1M records) are done from the command line:
+
+    python -m tests.performance.dynamodb_benchmark --records 100000 --concurrency 8
+"""
+
+import json
+
+import pytest
+from moto import mock_aws
+import boto3
+
+from src.database.dynamodb_client import BookingRepository
+from tests.performance.dynamodb_benchmark import (
+    create_table,
+    run_benchmark,
+    save_results,
+    seed_table,
+    summarize,
+)
+
+OPERATIONS = ("get_booking", "batch_get_bookings", "scan_unnotified_options", "update_flag")
+
+
+@pytest.mark.performance
+def test_benchmark_produces_comparable_json(tmp_path):
+    """Every operation is measured and the results round-trip through JSON."""
+    results = run_benchmark(record_count=300, concurrency=4, operations=50, batch_size=25)
+
+    assert results["metadata"]["record_count"] == 300
+    assert results["metadata"]["backend"] == "moto"
+    for operation in OPERATIONS:
+        stats = results["results"][operation]
+        assert stats["errors"] == 0
+        assert stats["count"] > 0
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["max_ms"]
+
+    assert results["results"]["get_booking"]["count"] == 50
+    assert results["results"]["batch_get_bookings"]["count"] == 2
+
+    output_file = save_results(results, tmp_path / "benchmark.json")
+    assert json.loads(output_file.read_text(encoding="utf-8"))["results"].keys() == set(
+        OPERATIONS
+    )
+
+
+@pytest.mark.performance
+def test_batch_get_and_paginated_scan_cover_all_records():
+    """Batch reads span multiple chunks and the scan follows LastEvaluatedKey."""
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="ap-northeast-2")
+        table = create_table(dynamodb)
+        keys, _ = seed_table(table, 250)
+        repo = BookingRepository(dynamodb_resource=dynamodb)
+
+        fetched = repo.batch_get_bookings(keys + [("0_missing", "010-0000-0000")])
+        assert len(fetched) == 250
+
+        pages = []
+        original_scan = table.scan
+
+        def tracking_scan(**kwargs):
+            response = original_scan(Limit=100, **kwargs)
+            pages.append(response)
+            return response
+
+        repo.table.scan = tracking_scan
+        windows = repo.scan_unnotified_options()
+
+        assert len(pages) > 1
+        assert windows
+
+
+def test_summarize_percentiles():
+    """Percentiles are ordered and throughput uses wall time."""
+    stats = summarize([float(value) for value in range(1, 101)], wall_ms=1000.0, errors=1)
+
+    assert stats["count"] == 100
+    assert stats["p50_ms"] == 50.0
+    assert stats["p99_ms"] == 99.0
+    assert stats["ops_per_sec"] == 100.0
+    assert stats["errors"] == 1
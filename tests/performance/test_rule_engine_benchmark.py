@@ -0,0 +1,66 @@
+"""
+Rule engine benchmark smoke tests.
+
+Runs the harness at a small scale to keep it working; full runs over
+thousands of bookings are done from the command line:
+
+    python -m tests.performance.rule_engine_benchmark --bookings 5000 --repeats 3
+"""
+
+import json
+
+import pytest
+
+from tests.performance.rule_engine_benchmark import (
+    build_contexts,
+    build_engine,
+    build_rules_file,
+    run_benchmark,
+    save_results,
+)
+
+
+@pytest.mark.performance
+def test_benchmark_produces_comparable_json(tmp_path):
+    """Both engine modes are measured and the results round-trip through JSON."""
+    results = run_benchmark(booking_count=200, repeats=1)
+
+    uncompiled = results["results"]["uncompiled"]
+    compiled = results["results"]["compiled"]
+    assert results["metadata"]["bookings"] == 200
+    assert uncompiled["actions_dispatched"] == compiled["actions_dispatched"] > 0
+    assert results["results"]["batch"]["actions_dispatched"] == compiled["actions_dispatched"]
+    assert compiled["best_ms"] > 0
+
+    output_file = save_results(results, tmp_path / "benchmark.json")
+    assert json.loads(output_file.read_text(encoding="utf-8"))["results"]["speedup"] > 0
+
+
+@pytest.mark.performance
+def test_compiled_plans_match_production_rules():
+    """Compiled plans dispatch exactly the same actions as name lookups."""
+    contexts = build_contexts(300)
+    uncompiled = build_engine(compiled=False)
+    compiled = build_engine(compiled=True)
+
+    for context in contexts:
+        expected = [(r.rule_name, r.action_type) for r in uncompiled.process_booking(context)]
+        actual = [(r.rule_name, r.action_type) for r in compiled.process_booking(context)]
+        assert actual == expected
+
+
+@pytest.mark.performance
+def test_indexed_matcher_matches_linear_with_promotions(tmp_path):
+    """Indexed matching dispatches the same actions with many store/date rules."""
+    contexts = build_contexts(300)
+    rules_path = build_rules_file(100, tmp_path)
+    linear = build_engine(rules_path, compiled=True, matcher="linear")
+    indexed = build_engine(rules_path, compiled=True, matcher="indexed")
+
+    dispatched = 0
+    for context in contexts:
+        expected = [(r.rule_name, r.action_type) for r in linear.process_booking(context)]
+        actual = [(r.rule_name, r.action_type) for r in indexed.process_booking(context)]
+        assert actual == expected
+        dispatched += len(actual)
+    assert dispatched > 0
@@ -11,6 +11,7 @@ import pytest
 from unittest.mock import Mock
 from src.rules.actions import (
     ActionContext,
+    ActionServices,
     ActionServicesBundle,
     ActionExecutionError,
     send_sms,
@@ -21,6 +22,7 @@ from src.rules.actions import (
     log_event,
     register_actions,
 )
+from src.database.exceptions import DuplicateBookingError
 from src.domain.booking import Booking
 from src.notifications.sms_service import SmsServiceError
 
@@ -334,6 +336,46 @@ class TestCreateDbRecord:
         assert "option_keyword_names" not in saved_record
         assert "option_keyword_counts" not in saved_record
 
+    def test_create_db_record_if_absent_writes_final_flags(self, action_context, mock_db_repo):
+        """Conditional create writes the final flag state in one call."""
+        mock_db_repo.create_booking_if_absent.return_value = True
+
+        create_db_record(action_context, flags={"confirm_sms": True}, if_absent=True)
+
+        mock_db_repo.create_booking_if_absent.assert_called_once()
+        mock_db_repo.create_booking.assert_not_called()
+        saved_record = mock_db_repo.create_booking_if_absent.call_args[0][0]
+        assert saved_record["confirm_sms"] is True
+        assert saved_record["remind_sms"] is False
+
+    def test_create_db_record_if_absent_lost_race(self, action_context, mock_db_repo):
+        """Losing the conditional create raises DuplicateBookingError."""
+        mock_db_repo.create_booking_if_absent.return_value = False
+
+        with pytest.raises(ActionExecutionError) as exc_info:
+            create_db_record(action_context, if_absent=True)
+
+        assert isinstance(exc_info.value.original_error, DuplicateBookingError)
+
+    def test_create_db_record_if_absent_requires_conditional_create(
+        self, action_context, mock_db_repo
+    ):
+        """Repositories without the conditional create fail instead of creating blindly."""
+        del mock_db_repo.create_booking_if_absent
+
+        with pytest.raises(ActionExecutionError) as exc_info:
+            create_db_record(action_context, if_absent=True)
+
+        assert isinstance(exc_info.value.original_error, ValueError)
+        mock_db_repo.create_booking.assert_not_called()
+
+    def test_create_db_record_invalid_flag(self, action_context):
+        """Unknown flag names are rejected."""
+        with pytest.raises(ActionExecutionError) as exc_info:
+            create_db_record(action_context, flags={"unknown_sms": True})
+
+        assert isinstance(exc_info.value.original_error, ValueError)
+
 
 # ============================================================================
 # Tests: update_flag
@@ -821,3 +863,50 @@ class TestRegisterActions:
 
         # Verify SMS service was called
         services_bundle.sms_service.send_confirm_sms.assert_called_once()
+
+    def test_rebinding_holder_swaps_services_without_reregistering(
+        self, services_bundle, mock_booking
+    ):
+        """Executors registered with a holder use the bundle bound at call time."""
+        mock_engine = Mock()
+        holder = ActionServices(services_bundle)
+        register_actions(mock_engine, holder)
+        send_sms_wrapper = mock_engine.register_action.call_args_list[0][0][1]
+
+        next_run = ActionServicesBundle(
+            db_repo=Mock(),
+            sms_service=Mock(),
+            logger=services_bundle.logger,
+            settings_dict=services_bundle.settings_dict,
+        )
+        holder.bind(next_run)
+        send_sms_wrapper({"booking": mock_booking}, template="confirm")
+
+        next_run.sms_service.send_confirm_sms.assert_called_once()
+        services_bundle.sms_service.send_confirm_sms.assert_not_called()
+        assert mock_engine.register_action.call_count == 6
+
+    def test_unbound_holder_fails(self):
+        """Actions cannot run before a bundle is bound."""
+        with pytest.raises(RuntimeError, match="No action services bound"):
+            ActionServices().current
+
+    def test_update_flag_wrapper_skips_read_after_conditional_create(
+        self, services_bundle, mock_booking, mock_db_repo
+    ):
+        """update_flag reuses the flag state written by create_db_record."""
+        mock_engine = Mock()
+        mock_db_repo.create_booking_if_absent.return_value = True
+
+        register_actions(mock_engine, services_bundle)
+        wrappers = {
+            call_args[0][0]: call_args[0][1]
+            for call_args in mock_engine.register_action.call_args_list
+        }
+
+        rule_context = {"booking": mock_booking}
+        wrappers["create_db_record"](rule_context, if_absent=True, flags={"confirm_sms": True})
+        wrappers["update_flag"](rule_context, flag="confirm_sms", value=True)
+
+        mock_db_repo.get_booking.assert_not_called()
+        mock_db_repo.update_flag.assert_not_called()
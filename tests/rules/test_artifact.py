@@ -0,0 +1,110 @@
+"""
+Precompiled rules artifact tests
+
+The build step validates rules.yaml and the template YAMLs and snapshots the
+parsed rules; the engine cache uses the snapshot only when it was built from
+the exact rules document being loaded.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.rules import engine as engine_module
+from src.rules.artifact import (
+    ARTIFACT_NAME,
+    ARTIFACT_VERSION,
+    build_rules_artifact,
+    load_rules_artifact,
+    precompiled_rules,
+    write_rules_artifact,
+)
+from src.rules.cache import FileRulesSource, cached_engine
+
+CONFIG_ROOT = Path(__file__).resolve().parents[2] / "config"
+
+
+@pytest.fixture
+def config_root(tmp_path):
+    for name in ("rules.yaml", "sms_templates.yaml", "telegram_templates.yaml"):
+        shutil.copy(CONFIG_ROOT / name, tmp_path / name)
+    return tmp_path
+
+
+def test_build_snapshots_production_rules(config_root):
+    artifact = build_rules_artifact(config_root)
+    document = (config_root / "rules.yaml").read_text(encoding="utf-8")
+
+    assert artifact["version"] == ARTIFACT_VERSION
+    assert sorted(artifact["templates"]) == ["sms_templates.yaml", "telegram_templates.yaml"]
+    assert precompiled_rules(artifact, document) == artifact["rules"]
+    assert precompiled_rules(artifact, document + "\n") is None
+    assert len(artifact["rules"]["rules"]) > 0
+
+
+def test_write_and_load_round_trip(config_root):
+    artifact = build_rules_artifact(config_root)
+    path = write_rules_artifact(artifact, config_root / ARTIFACT_NAME)
+
+    assert load_rules_artifact(path) == artifact
+    assert load_rules_artifact(config_root / "missing.json") is None
+
+    path.write_text(json.dumps({**artifact, "version": ARTIFACT_VERSION + 1}))
+    assert load_rules_artifact(path) is None
+
+    path.write_text("{not json")
+    assert load_rules_artifact(path) is None
+
+
+def test_schema_violation_fails_build(config_root):
+    (config_root / "rules.yaml").write_text(
+        'rules:\n  - name: "No actions"\n    enabled: true\n    conditions: []\n'
+    )
+
+    with pytest.raises(ValueError, match="validation failed"):
+        build_rules_artifact(config_root)
+
+
+def test_invalid_template_fails_build(config_root):
+    (config_root / "telegram_templates.yaml").write_text("alert:\n  parse_mode: Markdown\n")
+
+    with pytest.raises(ValueError, match="Telegram template 'alert'"):
+        build_rules_artifact(config_root)
+
+    (config_root / "telegram_templates.yaml").unlink()
+    (config_root / "sms_templates.yaml").write_text("templates:\n  confirm:\n    type: SMS\n")
+
+    with pytest.raises(ValueError, match="SMS template 'confirm' missing"):
+        build_rules_artifact(config_root)
+
+
+def test_cached_engine_skips_yaml_when_artifact_matches(config_root, monkeypatch):
+    artifact_path = write_rules_artifact(
+        build_rules_artifact(config_root), config_root / ARTIFACT_NAME
+    )
+    rules_path = config_root / "rules.yaml"
+    expected = [rule.name for rule in engine_module.RuleEngine(str(rules_path)).rules]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("rules.yaml should not be parsed")
+
+    monkeypatch.setattr(engine_module.yaml, "safe_load", fail)
+    engine = cached_engine(FileRulesSource(rules_path), artifact_path=artifact_path)
+
+    assert [rule.name for rule in engine.rules] == expected
+
+
+def test_stale_artifact_falls_back_to_yaml(config_root):
+    artifact_path = write_rules_artifact(
+        build_rules_artifact(config_root), config_root / ARTIFACT_NAME
+    )
+    (config_root / "rules.yaml").write_text(
+        'rules:\n  - name: "Edited"\n    enabled: true\n'
+        '    conditions: []\n    actions: []\n'
+    )
+
+    engine = cached_engine(FileRulesSource(config_root / "rules.yaml"), artifact_path=artifact_path)
+
+    assert [rule.name for rule in engine.rules] == ["Edited"]
@@ -0,0 +1,90 @@
+"""
+Batch evaluator parity tests
+
+Every column evaluator in src/rules/batch.py must agree, row for row, with
+the per-booking evaluator in src/rules/conditions.py - including the edge
+cases (missing booking, missing record, missing reserve_at, bad params).
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+import pytz
+
+from src.rules import conditions
+from src.rules.batch import BATCH_EVALUATORS, BookingColumns
+
+KST = pytz.timezone("Asia/Seoul")
+NOW = KST.localize(datetime(2025, 11, 15, 20, 0))
+
+
+def _booking(**overrides):
+    fields = {
+        "booking_num": "1051707_1",
+        "biz_id": "1051707",
+        "status": "RC03",
+        "reserve_at": NOW + timedelta(hours=1),
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+CONTEXTS = [
+    {"booking": _booking(), "db_record": None, "current_time": NOW},
+    {"booking": _booking(status="RC08"), "db_record": {"remind_sms": True}, "current_time": NOW},
+    {"booking": _booking(status=None), "db_record": {"remind_sms": False}, "current_time": NOW},
+    {"booking": _booking(biz_id=None, reserve_at=None), "db_record": {}, "current_time": NOW},
+    {"booking": _booking(reserve_at=NOW - timedelta(days=1)), "current_time": NOW},
+    {"booking": _booking(reserve_at=NOW + timedelta(hours=3)), "current_time": NOW},
+    {"booking": _booking(biz_id=951291), "db_record": SimpleNamespace(remind_sms=True)},
+    {"booking": None, "db_record": None, "current_time": NOW},
+    {"db_record": {"option_sms": True}, "current_time": NOW.replace(hour=9)},
+]
+
+CASES = [
+    ("booking_not_in_db", {}),
+    ("booking_in_db", {}),
+    ("time_before_booking", {"hours": 2}),
+    ("time_before_booking", {"hours": 24}),
+    ("flag_not_set", {"flag": "remind_sms"}),
+    ("flag_not_set", {"flag": "option_sms"}),
+    ("current_hour", {"hour": 20}),
+    ("current_hour", {"hour": 9}),
+    ("date_is_today", {}),
+    ("booking_status", {"status": "RC03"}),
+    ("booking_status_any", {"statuses": ["RC03", "RC08"]}),
+    ("booking_status_any", {"statuses": []}),
+    ("store_id_matches", {"store_ids": [1051707]}),
+    ("store_id_matches", {"store_ids": ["951291"]}),
+    ("date_range", {"start_date": "2025-11-15", "end_date": "2025-11-15"}),
+    ("date_range", {"start_date": "2025-11-01", "end_date": "2025-11-30"}),
+    ("date_range", {"start_date": "not-a-date", "end_date": "2025-11-30"}),
+]
+
+
+@pytest.mark.parametrize("condition_type,params", CASES)
+def test_batch_evaluator_matches_row_evaluator(condition_type, params):
+    evaluator = getattr(conditions, condition_type)
+    expected = [bool(evaluator(context, **params)) for context in CONTEXTS]
+
+    mask = BATCH_EVALUATORS[condition_type](BookingColumns(CONTEXTS), **params)
+
+    assert [bool(value) for value in mask] == expected
+
+
+def test_flag_column_is_built_once():
+    columns = BookingColumns(CONTEXTS)
+
+    assert columns.flag("remind_sms") is columns.flag("remind_sms")
+    assert columns.flag("remind_sms")[0] is None
+    assert columns.flag("remind_sms")[1] is True
+
+
+def test_incomparable_datetimes_raise_for_fallback():
+    """Naive vs aware times raise so the engine falls back to per-booking checks."""
+    naive = [{"booking": _booking(reserve_at=datetime(2025, 11, 15, 21, 0)), "current_time": NOW}]
+
+    with pytest.raises(TypeError):
+        BATCH_EVALUATORS["time_before_booking"](BookingColumns(naive), hours=2)
+    assert conditions.time_before_booking(naive[0], hours=2) is False
@@ -0,0 +1,186 @@
+"""
+Rule engine cache tests
+
+The parsed engine is reused while the rules document's hash is unchanged,
+rebuilt when it changes, falls back to the cached engine when the source is
+unreachable, and S3 sources revalidate with a conditional GET.
+"""
+
+import io
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.rules.cache import (
+    FileRulesSource,
+    S3RulesSource,
+    cached_engine,
+    document_hash,
+    rules_source,
+)
+from src.rules.engine import RuleEngine
+
+RULES = """
+rules:
+  - name: "Confirm"
+    enabled: true
+    conditions:
+      - type: "always"
+    actions:
+      - type: "send_sms"
+"""
+
+
+class _FakeS3:
+    """get_object that answers 304 when IfNoneMatch matches the current ETag."""
+
+    def __init__(self, document):
+        self.document = document
+        self.etag = '"v1"'
+        self.calls = []
+
+    def get_object(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get("IfNoneMatch") == self.etag:
+            raise ClientError(
+                {
+                    "Error": {"Code": "304", "Message": "Not Modified"},
+                    "ResponseMetadata": {"HTTPStatusCode": 304},
+                },
+                "GetObject",
+            )
+        return {"Body": io.BytesIO(self.document.encode("utf-8")), "ETag": self.etag}
+
+
+class _BrokenSource:
+    label = "broken"
+
+    def read(self):
+        raise OSError("unreachable")
+
+
+def _setup_counter():
+    built = []
+
+    def setup(engine):
+        engine.register_condition("always", lambda ctx: True)
+        built.append(engine)
+
+    return setup, built
+
+
+def test_same_document_reuses_engine(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(RULES)
+    setup, built = _setup_counter()
+
+    first = cached_engine(FileRulesSource(rules_file), setup=setup)
+    second = cached_engine(FileRulesSource(rules_file), setup=setup)
+
+    assert first is second
+    assert len(built) == 1
+    assert [rule.name for rule in first.rules] == ["Confirm"]
+
+
+def test_changed_document_rebuilds_engine(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(RULES)
+    setup, built = _setup_counter()
+
+    first = cached_engine(FileRulesSource(rules_file), setup=setup)
+    rules_file.write_text(RULES.replace("Confirm", "Confirm v2"))
+    second = cached_engine(FileRulesSource(rules_file), setup=setup)
+
+    assert second is not first
+    assert len(built) == 2
+    assert [rule.name for rule in second.rules] == ["Confirm v2"]
+    assert cached_engine(FileRulesSource(rules_file), setup=setup) is second
+
+
+def test_replaced_engine_action_pool_is_shut_down(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(RULES)
+
+    first = cached_engine(FileRulesSource(rules_file), action_scheduling="dag")
+    pool = first._action_pool
+    rules_file.write_text(RULES.replace("Confirm", "Confirm v2"))
+    second = cached_engine(FileRulesSource(rules_file), action_scheduling="dag")
+
+    assert first._action_pool is None
+    assert pool._shutdown
+    assert second._action_pool is not None
+
+
+def test_engine_options_are_part_of_the_key(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(RULES)
+
+    linear = cached_engine(FileRulesSource(rules_file), matcher="linear")
+    indexed = cached_engine(FileRulesSource(rules_file), matcher="indexed")
+
+    assert linear is not indexed
+    assert indexed.matcher == "indexed"
+    assert cached_engine(FileRulesSource(rules_file), matcher="linear") is linear
+
+
+def test_build_factory_receives_document(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(RULES)
+    calls = []
+
+    def build(label, **kwargs):
+        calls.append((label, kwargs))
+        return RuleEngine(label, **kwargs)
+
+    cached_engine(FileRulesSource(rules_file), build=build, log_mode="summary")
+
+    assert calls == [(str(rules_file), {"rules_document": RULES, "log_mode": "summary"})]
+
+
+def test_unreadable_source_falls_back_to_cached_engine(tmp_path):
+    source = FileRulesSource(tmp_path / "rules.yaml")
+    source.path.write_text(RULES)
+    engine = cached_engine(source)
+
+    source.path.unlink()
+
+    assert cached_engine(source) is engine
+    with pytest.raises(OSError):
+        cached_engine(_BrokenSource())
+
+
+def test_s3_source_revalidates_with_etag():
+    client = _FakeS3(RULES)
+    source = S3RulesSource("bucket", "rules.yaml", s3_client=client)
+
+    first = cached_engine(source)
+    second = cached_engine(source)
+
+    assert first is second
+    assert "IfNoneMatch" not in client.calls[0]
+    assert client.calls[1]["IfNoneMatch"] == '"v1"'
+
+    client.document = RULES.replace("Confirm", "Confirm v2")
+    client.etag = '"v2"'
+
+    assert [rule.name for rule in cached_engine(source).rules] == ["Confirm v2"]
+
+
+def test_rules_source_resolution(tmp_path):
+    default = tmp_path / "rules.yaml"
+
+    assert rules_source("", default).label == str(default)
+    assert rules_source("/opt/rules.yaml", default).label == "/opt/rules.yaml"
+
+    s3 = rules_source("s3://bucket/path/rules.yaml", default)
+    assert (s3.bucket, s3.key) == ("bucket", "path/rules.yaml")
+    # S3 sources are kept so their ETag survives between invocations
+    assert rules_source("s3://bucket/path/rules.yaml", default) is s3
+
+    with pytest.raises(ValueError):
+        rules_source("s3://bucket", default)
+
+
+def test_document_hash_is_content_based():
+    assert document_hash(RULES) == document_hash(str(RULES))
+    assert document_hash(RULES) != document_hash(RULES + "\n")
@@ -0,0 +1,205 @@
+"""
+Concurrent executor tests
+
+Bookings run in parallel, but each booking's actions keep their declared
+order, repeated bookings stay sequential, per-type action limits hold, and
+results come back in input order.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.rules.concurrent import (
+    ActionLimiter,
+    ConcurrentExecutor,
+    booking_key,
+    parse_action_limits,
+)
+from src.rules.engine import RuleEngine
+
+RULES = """
+rules:
+  - name: "Confirm"
+    enabled: true
+    conditions:
+      - type: "always"
+    actions:
+      - type: "create_db_record"
+      - type: "send_sms"
+      - type: "update_flag"
+  - name: "Alert"
+    enabled: true
+    conditions:
+      - type: "even"
+    actions:
+      - type: "send_telegram"
+"""
+
+
+class _Recorder:
+    """Action executors that record order and peak concurrency per type."""
+
+    def __init__(self, delay=0.005):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.calls = []
+        self.active = {}
+        self.peak = {}
+
+    def executor(self, action_type):
+        def run(context, **params):
+            with self.lock:
+                self.active[action_type] = self.active.get(action_type, 0) + 1
+                self.peak[action_type] = max(
+                    self.peak.get(action_type, 0), self.active[action_type]
+                )
+            time.sleep(self.delay)
+            with self.lock:
+                self.active[action_type] -= 1
+                self.calls.append((context["booking"].booking_num, action_type))
+
+        return run
+
+
+def _engine(tmp_path, recorder):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(RULES)
+    engine = RuleEngine(str(rules_file))
+    engine.register_condition("always", lambda ctx: True)
+    engine.register_condition("even", lambda ctx: ctx["booking"].book_id % 2 == 0)
+    for action_type in ("create_db_record", "send_sms", "update_flag", "send_telegram"):
+        engine.register_action(action_type, recorder.executor(action_type))
+    engine.compile()
+    return engine
+
+
+def _contexts(count):
+    return [
+        {"booking": SimpleNamespace(booking_num=f"B{n}", phone=f"010-{n:04d}", book_id=n)}
+        for n in range(count)
+    ]
+
+
+def _summaries(results):
+    return [[(r.rule_name, r.action_type, r.success) for r in booking] for booking in results]
+
+
+def test_results_match_sequential_processing(tmp_path):
+    contexts = _contexts(12)
+    expected = _summaries(
+        [_engine(tmp_path, _Recorder(0)).process_booking(ctx) for ctx in contexts]
+    )
+
+    executor = ConcurrentExecutor(_engine(tmp_path, _Recorder()), max_workers=4)
+
+    assert _summaries(executor.process_bookings(contexts)) == expected
+
+
+def test_actions_keep_declared_order_per_booking(tmp_path):
+    recorder = _Recorder()
+    executor = ConcurrentExecutor(_engine(tmp_path, recorder), max_workers=6)
+
+    executor.process_bookings(_contexts(12))
+
+    for n in range(12):
+        actions = [action for booking, action in recorder.calls if booking == f"B{n}"]
+        expected = ["create_db_record", "send_sms", "update_flag"]
+        assert actions == expected + (["send_telegram"] if n % 2 == 0 else [])
+
+
+def test_action_limits_cap_concurrency(tmp_path):
+    recorder = _Recorder(delay=0.01)
+    executor = ConcurrentExecutor(
+        _engine(tmp_path, recorder),
+        max_workers=6,
+        action_limits={"send_sms": 2, "send_telegram": 1},
+    )
+
+    executor.process_bookings(_contexts(12))
+
+    assert recorder.peak["send_sms"] <= 2
+    assert recorder.peak["send_telegram"] == 1
+    # Uncapped actions do overlap across workers
+    assert recorder.peak["create_db_record"] > 1
+
+
+def test_same_key_runs_sequentially_in_input_order():
+    engine = SimpleNamespace(action_limiter=None)
+    executor = ConcurrentExecutor(engine, max_workers=4)
+    running = set()
+    order = []
+    lock = threading.Lock()
+
+    def work(item):
+        key, index = item
+        with lock:
+            assert key not in running
+            running.add(key)
+        time.sleep(0.005)
+        with lock:
+            running.discard(key)
+            order.append(item)
+        return index
+
+    items = [("a", 0), ("b", 1), ("a", 2), ("c", 3), ("a", 4), ("b", 5)]
+
+    assert executor.map(items, work, key=lambda item: item[0]) == [0, 1, 2, 3, 4, 5]
+    assert [item for item in order if item[0] == "a"] == [("a", 0), ("a", 2), ("a", 4)]
+
+
+def test_work_exception_is_raised():
+    executor = ConcurrentExecutor(SimpleNamespace(action_limiter=None), max_workers=2)
+
+    def work(item):
+        if item == 3:
+            raise RuntimeError("boom")
+        return item
+
+    with pytest.raises(RuntimeError, match="boom"):
+        executor.map(list(range(5)), work)
+
+
+def test_action_limiter_is_scoped_to_map():
+    engine = SimpleNamespace(action_limiter=None)
+    executor = ConcurrentExecutor(engine, max_workers=2, action_limits={"send_sms": 1})
+    seen = []
+
+    def work(item):
+        seen.append(engine.action_limiter)
+        if item == 1:
+            raise RuntimeError("boom")
+        return item
+
+    assert engine.action_limiter is None
+    with pytest.raises(RuntimeError, match="boom"):
+        executor.map([0, 1], work)
+
+    assert seen == [executor.limiter, executor.limiter]
+    assert engine.action_limiter is None
+
+
+def test_booking_key():
+    booking = SimpleNamespace(booking_num="B1", phone="010-0001")
+    context = {}
+
+    assert booking_key({"booking": booking}) == ("B1", "010-0001")
+    assert booking_key(context) == id(context)
+
+
+def test_parse_action_limits():
+    assert parse_action_limits("send_telegram=1, send_sms=4,") == {
+        "send_telegram": 1,
+        "send_sms": 4,
+    }
+    assert parse_action_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_action_limits("send_sms")
+    with pytest.raises(ValueError):
+        parse_action_limits("send_sms=0")
+    with pytest.raises(ValueError):
+        ActionLimiter({"send_sms": 0})
+    with pytest.raises(ValueError):
+        ConcurrentExecutor(SimpleNamespace(action_limiter=None), max_workers=0)
@@ -28,6 +28,7 @@ from src.rules.conditions import (
     flag_not_set,
     current_hour,
     booking_status,
+    store_id_matches,
     has_option_keyword,
     has_multiple_options,
     date_range,
@@ -408,6 +409,32 @@ class TestBookingStatus:
         assert set(context.keys()) == original_keys
 
 
+class TestStoreIdMatches:
+    """store_id_matches - Store filtering"""
+
+    def test_matches_integer_store_ids_from_yaml(self):
+        """Test: YAML integers match the string biz_id from the API"""
+        context = {"booking": Mock(biz_id="1051707")}
+        assert store_id_matches(context, store_ids=[1051707]) is True
+        assert store_id_matches(context, store_ids=["951291", 1051707]) is True
+
+    def test_non_matching_store(self):
+        """Test: Returns False for other stores"""
+        context = {"booking": Mock(biz_id="951291")}
+        assert store_id_matches(context, store_ids=[1051707]) is False
+
+    def test_missing_booking_or_biz_id(self):
+        """Test: Handles missing booking and biz_id"""
+        assert store_id_matches({}, store_ids=[1051707]) is False
+        assert store_id_matches({"booking": Mock(biz_id=None)}, store_ids=[1051707]) is False
+
+    def test_invalid_store_ids(self):
+        """Test: Empty or non-list store_ids never match"""
+        context = {"booking": Mock(biz_id="1051707")}
+        assert store_id_matches(context, store_ids=[]) is False
+        assert store_id_matches(context, store_ids="1051707") is False
+
+
 class TestHasOptionKeyword:
     """AC6: has_option_keyword - Option keyword detection"""
 
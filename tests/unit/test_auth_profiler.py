@@ -0,0 +1,59 @@
+"""
+Unit tests for AuthProfiler.
+"""
+
+from unittest.mock import Mock, patch
+
+from src.auth.auth_profiler import AuthProfiler
+
+
+def test_record_merges_handler_steps_and_browser_phases():
+    profiler = AuthProfiler(rss_probe=lambda driver: None)
+    profiler.timer.record("cookie_load", 12.0)
+    profiler.timer.record("login", 800.0)
+
+    record = profiler.as_record(
+        {
+            "auth_path": "cached_invalid",
+            "cookie_check": "http_probe",
+            "browser_started": True,
+            "browser_reused": False,
+            "chrome_launch_ms": 500.0,
+            "credential_login_ms": 250.0,
+        }
+    )
+
+    assert record["auth_path"] == "cached_invalid"
+    assert record["cookie_check"] == "http_probe"
+    assert record["auth_ms"] == 812.0
+    assert record["steps"] == {
+        "cookie_load_ms": 12.0,
+        "login_ms": 800.0,
+        "chrome_launch_ms": 500.0,
+        "credential_login_ms": 250.0,
+    }
+    assert record["reauthenticated"] is False
+
+
+def test_sample_browser_keeps_peak_rss():
+    samples = iter([180.0, 240.0, 200.0])
+    profiler = AuthProfiler(rss_probe=lambda driver: next(samples))
+    driver = Mock()
+
+    for _ in range(3):
+        profiler.sample_browser(driver)
+    profiler.sample_browser(None)
+
+    assert profiler.as_record()["browser_rss_mb"] == 240.0
+
+
+def test_emit_logs_a_single_record():
+    profiler = AuthProfiler(rss_probe=lambda driver: None)
+
+    with patch("src.auth.auth_profiler.logger") as mock_logger:
+        profiler.emit({"auth_path": "cached_valid"})
+        profiler.emit({"auth_path": "cached_valid"})
+
+    mock_logger.info.assert_called_once()
+    assert mock_logger.info.call_args.kwargs["operation"] == "auth_profile"
+    assert mock_logger.info.call_args.kwargs["context"]["auth_path"] == "cached_valid"
@@ -0,0 +1,85 @@
+"""
+Unit tests for BrowserKeeper and its NaverAuthenticator integration.
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.auth import browser_keeper
+from src.auth.browser_keeper import BrowserKeeper
+from src.auth.naver_login import NaverAuthenticator
+
+
+def _driver(alive=True):
+    driver = MagicMock()
+    if alive:
+        driver.execute_script.return_value = 1
+    else:
+        driver.execute_script.side_effect = Exception("disconnected: not connected to DevTools")
+    return driver
+
+
+class TestBrowserKeeper:
+    def test_release_then_acquire_reuses_driver(self):
+        keeper = BrowserKeeper(rss_probe=lambda d: 100.0)
+        driver = _driver()
+
+        assert keeper.release(driver) is True
+        assert keeper.acquire() is driver
+        driver.quit.assert_not_called()
+
+    def test_dead_driver_is_recycled_on_acquire(self):
+        keeper = BrowserKeeper(rss_probe=lambda d: 100.0)
+        keeper.adopt(_driver(alive=False))
+
+        assert keeper.acquire() is None
+        assert keeper.driver is None
+
+    def test_recycles_after_max_uses(self):
+        keeper = BrowserKeeper(max_uses=2, rss_probe=lambda d: 100.0)
+        driver = _driver()
+        keeper.release(driver)
+        keeper.acquire()
+
+        assert keeper.release(driver) is False
+        driver.quit.assert_called_once()
+
+    def test_recycles_on_memory_pressure(self):
+        keeper = BrowserKeeper(max_rss_mb=300, rss_probe=lambda d: 420.0)
+        driver = _driver()
+
+        assert keeper.release(driver) is False
+        driver.quit.assert_called_once()
+
+
+@pytest.fixture
+def keepalive(monkeypatch):
+    monkeypatch.setenv("NAVER_BROWSER_KEEPALIVE", "true")
+    monkeypatch.setattr(browser_keeper, "_KEEPER", None)
+    yield
+    if browser_keeper._KEEPER is not None:
+        browser_keeper._KEEPER.driver = None
+    monkeypatch.setattr(browser_keeper, "_KEEPER", None)
+
+
+@patch("src.auth.browser_keeper.browser_rss_mb", return_value=None)
+@patch("src.auth.naver_login.Service")
+@patch("src.auth.naver_login.webdriver.Chrome")
+def test_authenticator_reuses_parked_browser(mock_chrome, mock_service, _rss, keepalive):
+    driver = _driver()
+    mock_chrome.return_value = driver
+    mock_service.return_value = MagicMock()
+
+    first = NaverAuthenticator("testuser", "testpass", Mock())
+    first.setup_driver(skip_warmup=True)
+    first.cleanup()
+    driver.quit.assert_not_called()
+
+    second = NaverAuthenticator("testuser", "testpass", Mock())
+    second.setup_driver(skip_warmup=True)
+
+    assert second.driver is driver
+    assert mock_chrome.call_count == 1
+    driver.execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+    assert second.startup_summary()["browser_reused"] is True
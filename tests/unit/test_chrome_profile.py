@@ -0,0 +1,70 @@
+"""
+Unit tests for ChromeProfileSnapshot.
+"""
+
+import json
+
+import pytest
+
+from src.auth.chrome_profile import ChromeProfileSnapshot
+
+
+@pytest.fixture
+def profile_root(tmp_path):
+    root = tmp_path / "tmp"
+    (root / "user-data" / "Default").mkdir(parents=True)
+    (root / "data-path").mkdir()
+    (root / "user-data" / "Local State").write_text(json.dumps({"browser": {}}))
+    (root / "user-data" / "Default" / "Preferences").write_text("{}")
+    (root / "user-data" / "Default" / "Cookies").write_text("secret")
+    (root / "user-data" / "SingletonLock").write_text("")
+    return root
+
+
+def test_save_excludes_session_state_and_restores(tmp_path, profile_root):
+    snapshot = ChromeProfileSnapshot(tmp_path / "snap" / "profile.tar.gz", profile_root)
+    assert snapshot.save() is True
+    assert snapshot.checksum_path.is_file()
+
+    fresh_root = tmp_path / "fresh"
+    fresh_root.mkdir()
+    restored = ChromeProfileSnapshot(snapshot.snapshot_path, fresh_root)
+
+    assert restored.prepare() is True
+    assert (fresh_root / "user-data" / "Default" / "Preferences").is_file()
+    assert not (fresh_root / "user-data" / "Default" / "Cookies").exists()
+    assert not (fresh_root / "user-data" / "SingletonLock").exists()
+
+
+def test_warm_profile_is_kept_without_snapshot(tmp_path, profile_root):
+    snapshot = ChromeProfileSnapshot(tmp_path / "missing.tar.gz", profile_root)
+
+    assert snapshot.prepare() is True
+    # Previous session state and locks are dropped from the kept profile
+    assert not (profile_root / "user-data" / "Default" / "Cookies").exists()
+    assert not (profile_root / "user-data" / "SingletonLock").exists()
+    assert (profile_root / "user-data" / "Default" / "Preferences").is_file()
+
+
+def test_corrupted_snapshot_falls_back(tmp_path, profile_root):
+    snapshot = ChromeProfileSnapshot(tmp_path / "profile.tar.gz", profile_root)
+    snapshot.save()
+    with snapshot.snapshot_path.open("ab") as f:
+        f.write(b"garbage")
+
+    empty_root = tmp_path / "empty"
+    empty_root.mkdir()
+
+    assert ChromeProfileSnapshot(snapshot.snapshot_path, empty_root).prepare() is False
+
+
+def test_invalid_local_state_is_not_reused(tmp_path, profile_root):
+    (profile_root / "user-data" / "Local State").write_text("{not json")
+
+    assert ChromeProfileSnapshot(tmp_path / "missing.tar.gz", profile_root).prepare() is False
+
+
+def test_save_if_missing_keeps_existing_snapshot(tmp_path, profile_root):
+    snapshot = ChromeProfileSnapshot(tmp_path / "profile.tar.gz", profile_root)
+    assert snapshot.save_if_missing() is True
+    assert snapshot.save_if_missing() is False
@@ -0,0 +1,249 @@
+"""
+Unit tests for CookieStore and SessionManager delegation.
+
+Uses moto to mock DynamoDB for isolated testing without AWS credentials.
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.auth.cookie_store import (
+    CookieStore,
+    cookie_expiry,
+    in_offpeak_window,
+    reset_warm_cache,
+)
+from src.auth.session_manager import SessionManager
+
+
+COOKIES = [
+    {"name": "NID_AUT", "value": "aut", "domain": ".naver.com", "path": "/"},
+    {"name": "NID_SES", "value": "ses", "domain": ".naver.com", "path": "/"},
+]
+
+
+@pytest.fixture
+def dynamodb():
+    """Create a mocked session table and reset the warm cache."""
+    reset_warm_cache()
+    with mock_aws():
+        resource = boto3.resource("dynamodb", region_name="ap-northeast-2")
+        resource.create_table(
+            TableName="session",
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield resource
+    reset_warm_cache()
+
+
+class TestCookieStoreWarmCache:
+    """Warm invocations reuse decoded cookies without DynamoDB reads."""
+
+    def test_second_read_uses_memory(self, dynamodb):
+        dynamodb.Table("session").put_item(Item={"id": "1", "cookies": json.dumps(COOKIES)})
+        store = CookieStore(dynamodb)
+
+        assert store.get_cookies() == COOKIES
+
+        # A new store (next warm invocation) must not touch DynamoDB
+        next_store = CookieStore(dynamodb)
+        with patch.object(next_store.repository, "get_session") as mock_get:
+            assert next_store.get_cookies() == COOKIES
+        mock_get.assert_not_called()
+
+    def test_invalidate_forces_reread(self, dynamodb):
+        dynamodb.Table("session").put_item(Item={"id": "1", "cookies": json.dumps(COOKIES)})
+        store = CookieStore(dynamodb)
+        store.get_cookies()
+
+        store.invalidate()
+
+        with patch.object(
+            store.repository, "get_session", wraps=store.repository.get_session
+        ) as mock_get:
+            store.get_cookies()
+        mock_get.assert_called_once()
+
+    def test_expired_cache_entry_rereads(self, dynamodb):
+        store = CookieStore(dynamodb, max_age_seconds=0)
+        dynamodb.Table("session").put_item(Item={"id": "1", "cookies": json.dumps(COOKIES)})
+        store.get_cookies()
+
+        with patch.object(
+            store.repository, "get_session", wraps=store.repository.get_session
+        ) as mock_get:
+            store.get_cookies()
+        mock_get.assert_called_once()
+
+    def test_missing_session_returns_none(self, dynamodb):
+        assert CookieStore(dynamodb).get_cookies() is None
+
+
+class TestCookieStoreVersionedWrites:
+    """Conditional writes keep concurrent refreshes from clobbering each other."""
+
+    def test_save_increments_version(self, dynamodb):
+        store = CookieStore(dynamodb)
+
+        assert store.save_cookies(COOKIES) is True
+        assert store.save_cookies(COOKIES) is True
+
+        item = dynamodb.Table("session").get_item(Key={"id": "1"})["Item"]
+        assert item["version"] == 2
+        assert "expires_at" in item
+
+    def test_concurrent_refresh_loses_to_newer_version(self, dynamodb):
+        first = CookieStore(dynamodb)
+        first.save_cookies(COOKIES)
+
+        # Another container refreshes the cookies meanwhile
+        dynamodb.Table("session").put_item(
+            Item={"id": "1", "cookies": json.dumps([{"name": "NID_AUT", "value": "new"}]), "version": 5}
+        )
+
+        assert first.save_cookies(COOKIES) is False
+        item = dynamodb.Table("session").get_item(Key={"id": "1"})["Item"]
+        assert json.loads(item["cookies"])[0]["value"] == "new"
+
+        # Cache was dropped, so the next read returns the newer cookies
+        assert first.get_cookies()[0]["value"] == "new"
+
+    def test_clear_keeps_cookies_refreshed_by_another_run(self, dynamodb):
+        store = CookieStore(dynamodb)
+        store.save_cookies(COOKIES)
+        dynamodb.Table("session").update_item(
+            Key={"id": "1"},
+            UpdateExpression="SET version = :v",
+            ExpressionAttributeValues={":v": 9},
+        )
+
+        assert store.clear() is False
+        assert "Item" in dynamodb.Table("session").get_item(Key={"id": "1"})
+
+
+class TestCookieExpiry:
+    """cookie_expiry() picks the earliest auth cookie expiry."""
+
+    def test_uses_auth_cookie_expiry(self):
+        cookies = [
+            {"name": "NID_AUT", "expiry": 2000},
+            {"name": "NID_SES", "expiry": 1500},
+            {"name": "other", "expiry": 100},
+        ]
+        assert cookie_expiry(cookies, 60, now=0) == 1500
+
+    def test_falls_back_to_default_ttl(self):
+        assert cookie_expiry([{"name": "NID_AUT"}], 60, now=1000) == 1060
+
+
+class TestProactiveRefresh:
+    """Cookies are refreshed before their predicted expiry, not after a 401."""
+
+    def _store(self, dynamodb, **kwargs):
+        kwargs.setdefault("offpeak_hours", "")
+        return CookieStore(dynamodb, refresh_margin_seconds=600, **kwargs)
+
+    def test_fresh_cookies_need_no_refresh(self, dynamodb):
+        store = self._store(dynamodb)
+        store.save_cookies(COOKIES)
+
+        assert store.refresh_reason() is None
+
+    def test_refresh_due_near_cookie_expiry(self, dynamodb):
+        store = self._store(dynamodb)
+        cookies = [dict(cookie, expiry=int(time.time()) + 300) for cookie in COOKIES]
+        store.save_cookies(cookies)
+
+        assert store.refresh_reason() == "near_expiry"
+
+    def test_observed_lifetimes_shorten_predicted_expiry(self, dynamodb):
+        store = self._store(dynamodb)
+        store.save_cookies(COOKIES)
+        issued_at = dynamodb.Table("session").get_item(Key={"id": "1"})["Item"]["issued_at"]
+
+        # Previous cookie sets were rejected after ~1 hour
+        assert store.record_auth_failure(now=int(issued_at) + 3600) == 3600
+        assert store.refresh_reason(now=int(issued_at) + 3000) == "near_expiry"
+        assert store.refresh_reason(now=int(issued_at) + 1000) is None
+
+    def test_early_auth_failures_do_not_shorten_lifetime(self, dynamodb):
+        store = self._store(dynamodb)
+        store.save_cookies(COOKIES)
+        issued_at = int(dynamodb.Table("session").get_item(Key={"id": "1"})["Item"]["issued_at"])
+
+        # A 401 five minutes after login is not an expiry (floor: 2 x 600s margin)
+        assert store.record_auth_failure(now=issued_at + 300) is None
+        assert store.refresh_reason(now=issued_at + 300) is None
+
+        # Old short samples are clamped to the floor as well
+        store._observed_lifetimes = [60, 60, 60]
+        assert store.predicted_expiry() == issued_at + 1200
+
+    def test_lifetimes_survive_clear_and_fresh_login(self, dynamodb):
+        store = self._store(dynamodb)
+        store.save_cookies(COOKIES)
+        store.record_auth_failure(now=time.time() + 3600)
+        store.clear()
+
+        fresh = [dict(cookie, value="new") for cookie in COOKIES]
+        assert store.save_cookies(fresh) is True
+
+        item = dynamodb.Table("session").get_item(Key={"id": "1"})["Item"]
+        assert [int(v) for v in item["observed_lifetimes"]] == [3600]
+        assert int(item["issued_at"]) >= int(time.time()) - 5
+
+        # Next invocation (new store, cold cache) still sees the history
+        reset_warm_cache()
+        next_store = self._store(dynamodb)
+        next_store.get_cookies()
+        assert next_store.predicted_expiry() <= int(item["issued_at"]) + 3600
+
+    def test_resave_of_same_cookies_keeps_issue_time(self, dynamodb):
+        dynamodb.Table("session").put_item(
+            Item={"id": "1", "cookies": json.dumps(COOKIES), "version": 1, "issued_at": 1000}
+        )
+        store = self._store(dynamodb)
+        store.get_cookies()
+        store.save_cookies(COOKIES)
+
+        item = dynamodb.Table("session").get_item(Key={"id": "1"})["Item"]
+        assert int(item["issued_at"]) == 1000
+
+    def test_offpeak_window_refreshes_earlier(self, dynamodb):
+        store = self._store(dynamodb, offpeak_hours="0-24", offpeak_margin_seconds=7200)
+        cookies = [dict(cookie, expiry=int(time.time()) + 3600) for cookie in COOKIES]
+        store.save_cookies(cookies)
+
+        assert store.refresh_reason() == "off_peak"
+
+    def test_offpeak_window_uses_kst_and_wraps_midnight(self):
+        # 2024-01-01 18:30 UTC == 2024-01-02 03:30 KST
+        now = 1704133800
+        assert in_offpeak_window("3-5", now) is True
+        assert in_offpeak_window("23-4", now) is True
+        assert in_offpeak_window("5-7", now) is False
+        assert in_offpeak_window("", now) is False
+
+
+class TestSessionManagerDelegation:
+    """SessionManager keeps its public API on top of CookieStore."""
+
+    def test_put_item_and_get_cookies_round_trip(self, dynamodb):
+        manager = SessionManager(dynamodb)
+
+        assert manager.put_item(Item={"id": "1", "cookies": json.dumps(COOKIES)}) is True
+        assert manager.get_cookies() == COOKIES
+
+    def test_clear_cookies_removes_own_version(self, dynamodb):
+        manager = SessionManager(dynamodb)
+        manager.save_cookies(json.dumps(COOKIES))
+
+        assert manager.clear_cookies() is True
+        assert manager.get_cookies() is None
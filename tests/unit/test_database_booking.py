@@ -126,6 +126,17 @@ class TestBookingRepositoryGetBooking:
         # Assert
         assert result["custom_field"] == "future_value"
 
+    def test_worker_thread_copy_reads_same_table(self, repository):
+        """Should read the same table through a resource of its own."""
+        repository.table.put_item(Item={"booking_num": "1051707_1", "phone": "010-0000-0001"})
+
+        worker_repo = repository.for_worker_thread()
+
+        assert worker_repo.dynamodb is not repository.dynamodb
+        assert worker_repo.table_name == repository.table_name
+        assert worker_repo.max_retries == repository.max_retries
+        assert worker_repo.get_booking("1051707_1", "010-0000-0001") is not None
+
 
 class TestBookingRepositoryCreateBooking:
     """Tests for create_booking() method."""
@@ -198,6 +209,76 @@ class TestBookingRepositoryCreateBooking:
         assert stored["Item"]["visit_count"] == 5
 
 
+class TestBookingRepositoryCreateBookingIfAbsent:
+    """Tests for create_booking_if_absent() method."""
+
+    def test_create_if_absent_creates_new_record(self, repository):
+        """Should create the record with its final flags and report the win."""
+        booking_data = {
+            "booking_num": "1051707_55555",
+            "phone": "010-5555-5555",
+            "name": "Han Bo",
+            "booking_time": "2025-10-25 13:00:00",
+            "confirm_sms": True,
+            "remind_sms": False,
+            "option_sms": False,
+            "option_time": "",
+        }
+
+        result = repository.create_booking_if_absent(booking_data)
+
+        assert result is True
+        stored = repository.get_booking("1051707_55555", "010-5555-5555")
+        assert stored["confirm_sms"] is True
+        assert "option_time" not in stored
+
+    def test_create_if_absent_existing_record_returns_false(self, repository):
+        """Should leave an existing record untouched and report the loss."""
+        booking_data = {
+            "booking_num": "1051707_66666",
+            "phone": "010-6666-6666",
+            "name": "Yoon Ha",
+            "booking_time": "2025-10-26 10:00:00",
+            "confirm_sms": False,
+            "remind_sms": True,
+            "option_sms": False,
+        }
+        repository.create_booking(booking_data)
+
+        result = repository.create_booking_if_absent(
+            {**booking_data, "confirm_sms": True, "remind_sms": False}
+        )
+
+        assert result is False
+        stored = repository.get_booking("1051707_66666", "010-6666-6666")
+        assert stored["confirm_sms"] is False
+        assert stored["remind_sms"] is True
+
+    def test_create_if_absent_uses_single_conditional_put(self, repository):
+        """Should issue exactly one conditional put_item and no reads."""
+        booking_data = {
+            "booking_num": "1051707_77777",
+            "phone": "010-7777-7777",
+            "name": "Jang Mi",
+            "booking_time": "2025-10-27 11:00:00",
+        }
+
+        with patch.object(repository, "table") as mock_table:
+            assert repository.create_booking_if_absent(booking_data) is True
+
+        mock_table.put_item.assert_called_once()
+        kwargs = mock_table.put_item.call_args.kwargs
+        assert kwargs["ConditionExpression"] == "attribute_not_exists(booking_num)"
+        mock_table.get_item.assert_not_called()
+
+    def test_create_if_absent_missing_required_field(self, repository):
+        """Should validate required fields like create_booking."""
+        with pytest.raises(DynamoDBException):
+            repository.create_booking_if_absent(
+                {"booking_num": "1051707_88888", "phone": "010-8888-8888"}
+            )
+
+
 class TestBookingRepositoryUpdateFlag:
     """Tests for update_flag() method."""
 
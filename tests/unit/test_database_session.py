@@ -171,6 +171,35 @@ class TestSessionRepositorySaveSession:
         assert len(cookies_list) == 3
 
 
+class TestSessionRepositoryVersionedWrites:
+    """Tests for conditional, versioned save/delete."""
+
+    def test_first_versioned_save_creates_version_one(self, repository):
+        """expected_version=0 creates the item with version 1."""
+        assert repository.save_session("[]", expected_version=0, expires_at=2000) is True
+
+        session = repository.get_session()
+        assert session.version == 1
+        assert session.expires_at == 2000
+        assert session.updated_at is not None
+
+    def test_versioned_save_rejects_stale_version(self, repository):
+        """A write based on an old version returns False and keeps the newer item."""
+        repository.save_session('[{"name": "a"}]', expected_version=0)
+        repository.save_session('[{"name": "b"}]', expected_version=1)
+
+        assert repository.save_session('[{"name": "c"}]', expected_version=1) is False
+        assert json.loads(repository.get_session().cookies)[0]["name"] == "b"
+
+    def test_versioned_delete_rejects_stale_version(self, repository):
+        """delete_session(expected_version) only removes the expected version."""
+        repository.save_session("[]", expected_version=0)
+
+        assert repository.delete_session(expected_version=5) is False
+        assert repository.delete_session(expected_version=1) is True
+        assert repository.get_session() is None
+
+
 class TestSessionRepositoryDeleteSession:
     """Tests for delete_session() method."""
 
@@ -1,6 +1,7 @@
 import json
 from unittest.mock import Mock, MagicMock, call, patch, ANY
 
+import pytest
 from selenium.common.exceptions import InvalidCookieDomainException
 
 from src.auth.naver_login import NaverAuthenticator
@@ -10,6 +11,7 @@ def _build_driver_mock():
     driver = MagicMock()
     driver.find_element.return_value = MagicMock()
     driver.current_url = "https://new.smartplace.naver.com/profile"
+    driver.execute_script.return_value = "complete"
     return driver
 
 
@@ -126,6 +128,9 @@ def test_cookie_expiry_triggers_recursive_fresh_login(mock_chrome, mock_service)
 
     assert cookies == driver.get_cookies.return_value
     assert session_mgr.put_item.called
+    assert auth.auth_path == "cached_invalid"
+    assert auth.cookie_check == "browser"
+    assert "credential_login" in auth.startup_timer.phases
     # Check that execute_script was called with querySelector for id
     execute_script_calls = [call[0][0] for call in driver.execute_script.call_args_list]
     assert any(
@@ -182,3 +187,293 @@ def test_cookie_domain_mismatch_falls_back_to_cdp(mock_chrome, mock_service):
     driver.execute_cdp_cmd.assert_any_call("Network.setCookie", ANY)
     cookie_payload = driver.execute_cdp_cmd.call_args_list[-1][0][1]
     assert cookie_payload["domain"] == "partner.booking.naver.com"
+
+
+@patch("src.auth.naver_login.webdriver.Chrome")
+def test_http_probe_accepts_cached_cookies_without_chrome(mock_chrome):
+    cached_cookies = [
+        {"name": "NID_SES", "value": "cached", "domain": ".naver.com", "path": "/"}
+    ]
+    session_mgr = Mock()
+    auth = NaverAuthenticator("testuser", "testpass", session_mgr)
+
+    with patch(
+        "src.auth.naver_login.NaverBookingAPIClient.probe_session", return_value=True
+    ) as mock_probe:
+        result = auth.login(cached_cookies=cached_cookies, probe_store_id="1051707")
+
+    assert result == cached_cookies
+    mock_probe.assert_called_once_with("1051707")
+    mock_chrome.assert_not_called()
+    assert auth.driver is None
+    assert auth.get_session().cookies.get("NID_SES") == "cached"
+
+
+@patch("src.auth.naver_login.Service")
+@patch("src.auth.naver_login.webdriver.Chrome")
+def test_http_probe_rejection_starts_fresh_login(mock_chrome, mock_service):
+    driver = _build_driver_mock()
+    driver.get_cookies.return_value = [{"name": "NID_AUT", "value": "fresh"}]
+    mock_chrome.return_value = driver
+    mock_service.return_value = MagicMock()
+
+    session_mgr = Mock()
+    auth = NaverAuthenticator("testuser", "testpass", session_mgr)
+
+    with patch(
+        "src.auth.naver_login.NaverBookingAPIClient.probe_session", return_value=False
+    ), patch("src.auth.naver_login.time.sleep"):
+        cookies = auth.login(
+            cached_cookies=[{"name": "NID_AUT", "value": "expired"}], probe_store_id="1051707"
+        )
+
+    assert cookies == driver.get_cookies.return_value
+    assert session_mgr.put_item.called
+    # Fresh login skips replaying the rejected cookies into Chrome
+    driver.add_cookie.assert_not_called()
+
+
+@patch("src.auth.naver_login.Service")
+@patch("src.auth.naver_login.webdriver.Chrome")
+def test_inconclusive_http_probe_falls_back_to_browser_validation(mock_chrome, mock_service):
+    driver = _build_driver_mock()
+    mock_chrome.return_value = driver
+    mock_service.return_value = MagicMock()
+
+    cached_cookies = [{"name": "NID_SES", "value": "cached"}]
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+
+    with patch(
+        "src.auth.naver_login.NaverBookingAPIClient.probe_session", return_value=None
+    ), patch("src.auth.naver_login.time.sleep"):
+        result = auth.login(cached_cookies=cached_cookies, probe_store_id="1051707")
+
+    assert result == cached_cookies
+    mock_chrome.assert_called_once()
+    assert driver.add_cookie.call_count == len(cached_cookies)
+
+
+def test_module_import_does_not_load_selenium():
+    """Importing the handler path must not pay the selenium import cost."""
+    import subprocess
+    import sys
+
+    code = "import sys, src.main; print('selenium' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+@patch("src.auth.naver_login.Service")
+@patch("src.auth.naver_login.webdriver.Chrome")
+def test_startup_summary_reports_browser_phases(mock_chrome, mock_service):
+    mock_chrome.return_value = _build_driver_mock()
+    mock_service.return_value = MagicMock()
+
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+    auth.setup_driver(skip_warmup=True)
+
+    summary = auth.startup_summary()
+    assert summary["browser_started"] is True
+    assert "chrome_launch_ms" in summary
+
+
+def test_startup_summary_reports_avoided_browser_cost():
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+
+    with patch(
+        "src.auth.naver_login.NaverBookingAPIClient.probe_session", return_value=True
+    ), patch.dict("src.auth.naver_login._LAST_BROWSER_STARTUP_MS", {"chrome_launch": 1500.0}, clear=True):
+        auth.login(cached_cookies=[{"name": "NID_SES", "value": "x"}], probe_store_id="1")
+        summary = auth.startup_summary()
+
+    assert summary["browser_started"] is False
+    assert summary["avoided_ms"] == 1500.0
+    assert "cookie_probe_ms" in summary
+    assert summary["auth_path"] == "cached_valid"
+    assert summary["cookie_check"] == "http_probe"
+
+
+@patch("src.auth.naver_login.Service")
+@patch("src.auth.naver_login.webdriver.Chrome")
+def test_bulk_cookie_injection_uses_single_cdp_call(mock_chrome, mock_service, monkeypatch):
+    monkeypatch.setenv("NAVER_COOKIE_BULK_INJECT", "true")
+    driver = _build_driver_mock()
+    mock_chrome.return_value = driver
+    mock_service.return_value = MagicMock()
+
+    cached_cookies = [
+        {"name": "NID_AUT", "value": "a", "domain": ".naver.com", "path": "/"},
+        {"name": "NID_SES", "value": "b", "domain": "partner.booking.naver.com", "path": "/"},
+    ]
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+
+    with patch("src.auth.naver_login.time.sleep"):
+        result = auth.login(cached_cookies=cached_cookies)
+
+    assert result == cached_cookies
+    driver.add_cookie.assert_not_called()
+    set_cookies_calls = [
+        c for c in driver.execute_cdp_cmd.call_args_list if c[0][0] == "Network.setCookies"
+    ]
+    assert len(set_cookies_calls) == 1
+    assert [c["name"] for c in set_cookies_calls[0][0][1]["cookies"]] == ["NID_AUT", "NID_SES"]
+    # No warmup or per-domain page loads, only the validation page
+    driver.get.assert_called_once_with("https://nid.naver.com/user2/help/myInfoV2?lang=ko_KR")
+
+
+@patch("src.auth.naver_login.Service")
+@patch("src.auth.naver_login.webdriver.Chrome")
+def test_bulk_cookie_injection_falls_back_per_domain(mock_chrome, mock_service, monkeypatch):
+    from selenium.common.exceptions import WebDriverException
+
+    monkeypatch.setenv("NAVER_COOKIE_BULK_INJECT", "true")
+    driver = _build_driver_mock()
+
+    def _cdp(cmd, params):
+        if cmd == "Network.setCookies":
+            raise WebDriverException("unsupported")
+        return {}
+
+    driver.execute_cdp_cmd.side_effect = _cdp
+    mock_chrome.return_value = driver
+    mock_service.return_value = MagicMock()
+
+    cached_cookies = [{"name": "NID_SES", "value": "cached"}]
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+
+    with patch("src.auth.naver_login.time.sleep"):
+        auth.login(cached_cookies=cached_cookies)
+
+    assert driver.add_cookie.call_count == 1
+    driver.get.assert_any_call("https://naver.com/")
+
+
+def test_blocked_url_patterns_respects_allowlist(monkeypatch):
+    from src.auth.naver_login import DEFAULT_BLOCKED_URL_PATTERNS, blocked_url_patterns
+
+    monkeypatch.setenv("NAVER_BLOCK_ALLOWLIST", "*.svg, *wcs.naver.net*")
+
+    patterns = blocked_url_patterns()
+
+    assert "*.svg" not in patterns
+    assert "*wcs.naver.net*" not in patterns
+    assert len(patterns) == len(DEFAULT_BLOCKED_URL_PATTERNS) - 2
+
+
+@patch("src.auth.naver_login.Service")
+@patch("src.auth.naver_login.webdriver.Chrome")
+def test_resource_blocking_installed_before_first_navigation(mock_chrome, mock_service, monkeypatch):
+    monkeypatch.setenv("NAVER_BLOCK_RESOURCES", "true")
+    driver = _build_driver_mock()
+    events = []
+    driver.execute_cdp_cmd.side_effect = lambda cmd, params: events.append(cmd)
+    driver.get.side_effect = lambda url: events.append(url)
+    mock_chrome.return_value = driver
+    mock_service.return_value = MagicMock()
+
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+    auth.setup_driver()
+
+    assert events.index("Network.setBlockedURLs") < events.index(
+        "https://new.smartplace.naver.com/"
+    )
+
+
+def test_partner_cookie_wait_returns_when_cookie_appears():
+    driver = _build_driver_mock()
+    responses = iter(
+        [
+            {"cookies": []},
+            {"cookies": [{"name": "NID_AUT", "domain": ".naver.com"}]},
+            {"cookies": [{"name": "BUC", "domain": "partner.booking.naver.com"}]},
+        ]
+    )
+    driver.execute_cdp_cmd.side_effect = (
+        lambda cmd, params: next(responses) if cmd == "Network.getAllCookies" else {}
+    )
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+    auth.driver = driver
+
+    with patch("src.auth.naver_login.time.sleep") as mock_sleep:
+        assert auth._wait_for_partner_cookies() is True
+
+    assert mock_sleep.call_count == 2
+
+
+def test_partner_cookie_wait_requires_service_cookie(monkeypatch):
+    monkeypatch.setenv("NAVER_PARTNER_COOKIE_WAIT_SECONDS", "0")
+    driver = _build_driver_mock()
+    driver.execute_cdp_cmd.side_effect = lambda cmd, params: (
+        {"cookies": [{"name": "NNB", "domain": "partner.booking.naver.com"}]}
+        if cmd == "Network.getAllCookies"
+        else {}
+    )
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+    auth.driver = driver
+
+    assert auth._wait_for_partner_cookies() is False
+
+
+def test_cached_cookie_validation_waits_for_js_login_redirect():
+    """A completed document is not proof; the URL must stay off the login page."""
+    driver = _build_driver_mock()
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+    auth.driver = driver
+    auth._url_settle_seconds = 1.0
+    settled = auth._login_redirect_or_settled_url()
+
+    with patch("src.auth.naver_login.time.monotonic", side_effect=[0.0, 0.5, 1.5]):
+        driver.current_url = "https://partner.booking.naver.com/"
+        assert settled() is False
+        assert settled() is False
+        # The page stayed put past the settle window
+        assert settled() is True
+
+    settled = auth._login_redirect_or_settled_url()
+    with patch("src.auth.naver_login.time.monotonic", side_effect=[0.0]):
+        assert settled() is False
+        # Naver's JS redirect fires after readyState == "complete"
+        driver.current_url = "https://nid.naver.com/nidlogin.login"
+        assert settled() is True
+
+
+def test_partner_session_without_driver_seeds_validated_cookies():
+    """After an HTTP-probe login the new browser must carry the validated cookies."""
+    driver = _build_driver_mock()
+    events = []
+    driver.execute_cdp_cmd.side_effect = lambda cmd, params: events.append(cmd) or {}
+    driver.get.side_effect = lambda url: events.append(url)
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+    auth._validated_cookies = [{"name": "NID_AUT", "value": "auth", "domain": ".naver.com"}]
+    auth._partner_cookie_wait = 0
+
+    def setup_driver(skip_warmup=False):
+        auth.driver = driver
+
+    with patch.object(auth, "setup_driver", side_effect=setup_driver) as mock_setup:
+        auth.ensure_partner_session_for_store("1051707")
+
+    mock_setup.assert_called_once_with(skip_warmup=True)
+    partner_url = "https://partner.booking.naver.com/bizes/1051707/booking-list-view"
+    assert events.index("Network.setCookies") < events.index(partner_url)
+
+
+def test_partner_session_without_driver_or_cookies_fails():
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+
+    with patch.object(auth, "setup_driver") as mock_setup, pytest.raises(RuntimeError):
+        auth.ensure_partner_session_for_store("1051707")
+
+    mock_setup.assert_not_called()
+
+
+def test_typing_cadence_zero_disables_human_pauses(monkeypatch):
+    monkeypatch.setenv("NAVER_TYPING_CADENCE", "0")
+    auth = NaverAuthenticator("testuser", "testpass", Mock())
+
+    with patch("src.auth.naver_login.time.sleep") as mock_sleep:
+        auth._human_pause(0.3, 0.5)
+
+    mock_sleep.assert_not_called()
@@ -11,7 +11,8 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
-from src.api.naver_booking import NaverBookingAPIClient, NaverAuthenticationError
+from src.api.naver_booking import FetchCheckpoint, NaverBookingAPIClient, NaverAuthenticationError
+from src.database.run_lease import shard_store_ids
 
 
 def _mock_response(payload):
@@ -219,3 +220,134 @@ def test_completed_bookings_clamps_date_range_to_31_days():
     _, kwargs = mocked_get_bookings.call_args
     assert kwargs["start_date"] == "2024-01-01T00:00:00.000Z"
     assert kwargs["end_date"] == "2024-01-31T23:59:59.000Z"
+
+
+def _payload_with_ids(*booking_ids):
+    payload = _build_payload()[0]
+    return [dict(payload, bookingId=booking_id) for booking_id in booking_ids]
+
+
+def test_checkpoint_resumes_remaining_pages_after_reauth():
+    """After re-authentication only pages that did not succeed are fetched again."""
+    checkpoint = FetchCheckpoint()
+    first_session = Mock(spec=requests.Session)
+    first_session.get.side_effect = [
+        _mock_response({"count": 51}),
+        _mock_response(_payload_with_ids(1)),
+        _mock_http_error_response(401, "Unauthorized"),
+    ]
+    first = NaverBookingAPIClient(session=first_session, checkpoint=checkpoint)
+
+    with patch("src.api.naver_booking.time.sleep"), pytest.raises(NaverAuthenticationError):
+        first.get_bookings("1051707", status="RC03")
+    assert checkpoint.completed_units == 1
+
+    # New bookings shifted booking 1 onto page 1 meanwhile
+    retry_session = Mock(spec=requests.Session)
+    retry_session.get.side_effect = [_mock_response(_payload_with_ids(1, 2))]
+    retry = NaverBookingAPIClient(session=retry_session, checkpoint=checkpoint)
+
+    with patch("src.api.naver_booking.time.sleep"):
+        bookings = retry.get_bookings("1051707", status="RC03")
+
+    # Count and page 0 came from the checkpoint; only page 1 was requested
+    assert retry_session.get.call_count == 1
+    assert retry_session.get.call_args.kwargs["params"]["page"] == "1"
+    assert [b.booking_num for b in bookings] == ["1051707_1", "1051707_2"]
+    assert checkpoint.resumed_units == 1
+
+
+def test_checkpoint_reuses_unnotified_options_scan():
+    """The RC08 DynamoDB scan runs once per run, not again on retry."""
+    checkpoint = FetchCheckpoint()
+    booking_repo = Mock()
+    booking_repo.scan_unnotified_options.return_value = {}
+
+    for _ in range(2):
+        client = NaverBookingAPIClient(
+            session=Mock(spec=requests.Session), booking_repo=booking_repo, checkpoint=checkpoint
+        )
+        client.get_all_completed_bookings(["1051707"])
+
+    booking_repo.scan_unnotified_options.assert_called_once()
+
+
+def test_completed_bookings_only_fetch_the_shards_stores():
+    """Two run shards never fetch the same store's RC08 bookings."""
+    stores = ["1051707", "951291", "1120125"]
+    booking_repo = Mock()
+    booking_repo.scan_unnotified_options.return_value = {
+        store_id: {
+            "start_time": "2024-01-01T00:00:00.000Z",
+            "end_time": "2024-01-02T23:59:59.000Z",
+        }
+        for store_id in stores + ["999999"]
+    }
+
+    def get_bookings(store_id, **kwargs):
+        return [Mock(booking_num=f"{store_id}_1")]
+
+    fetched = []
+    for shard_index in range(2):
+        client = NaverBookingAPIClient(
+            session=Mock(spec=requests.Session), booking_repo=booking_repo
+        )
+        with patch.object(client, "get_bookings", side_effect=get_bookings):
+            bookings = client.get_all_completed_bookings(shard_store_ids(stores, shard_index, 2))
+        fetched.append({booking.booking_num for booking in bookings})
+
+    assert fetched[0].isdisjoint(fetched[1])
+    assert fetched[0] | fetched[1] == {f"{store_id}_1" for store_id in stores}
+
+
+def test_should_stop_ends_fetch_before_next_store():
+    """A lost run lease stops the fetch before the next store is requested."""
+    stop_after = iter([False, True])
+    client = NaverBookingAPIClient(
+        session=Mock(spec=requests.Session), should_stop=lambda: next(stop_after)
+    )
+
+    with patch.object(client, "get_bookings", return_value=[]) as mocked_get_bookings:
+        client.get_all_confirmed_bookings(["1051707", "951291", "1120125"])
+
+    assert [call.args[0] for call in mocked_get_bookings.call_args_list] == ["1051707"]
+
+
+def _probe_response(status_code: int, location: str = ""):
+    response = Mock()
+    response.status_code = status_code
+    response.is_redirect = bool(location)
+    response.headers = {"Location": location} if location else {}
+    return response
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        (_probe_response(200), True),
+        (_probe_response(401), False),
+        (_probe_response(403), False),
+        (_probe_response(302, "https://nid.naver.com/nidlogin.login"), False),
+        (_probe_response(500), None),
+    ],
+)
+def test_probe_session_classifies_status(response, expected):
+    """probe_session maps HTTP outcomes to accepted / rejected / inconclusive."""
+    session = Mock(spec=requests.Session)
+    session.get.return_value = response
+    client = NaverBookingAPIClient(session=session)
+
+    assert client.probe_session("1051707") is expected
+
+    _, kwargs = session.get.call_args
+    assert session.get.call_args[0][0].endswith("/v3.1/businesses/1051707/bookings/count")
+    assert kwargs["params"]["size"] == "1"
+    assert kwargs["allow_redirects"] is False
+
+
+def test_probe_session_network_error_is_inconclusive():
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = requests.ConnectionError("boom")
+    client = NaverBookingAPIClient(session=session)
+
+    assert client.probe_session("1051707") is None
@@ -0,0 +1,149 @@
+"""
+Unit tests for PartnerWarmupPlanner.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from src.auth.partner_warmup import PartnerWarmupPlanner, reset_warmup_cache
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    reset_warmup_cache()
+    yield
+    reset_warmup_cache()
+
+
+def _session():
+    session = requests.Session()
+    session.cookies.set("NID_AUT", "auth", domain=".naver.com", path="/")
+    session.get = Mock()
+    return session
+
+
+def _planner(probe_outcomes, authenticator=None):
+    """Planner whose API client answers probe_session from probe_outcomes[store_id]."""
+    calls = []
+
+    def factory(session):
+        client = Mock()
+
+        def probe(store_id):
+            calls.append(store_id)
+            outcome = probe_outcomes[store_id]
+            return outcome.pop(0) if isinstance(outcome, list) else outcome
+
+        client.probe_session.side_effect = probe
+        return client
+
+    authenticator = authenticator or Mock(probe_results={})
+    return PartnerWarmupPlanner(authenticator, factory), calls, authenticator
+
+
+def test_accepted_stores_need_no_warmup():
+    planner, calls, authenticator = _planner({"1": True, "2": True})
+
+    result = planner.ensure_ready(["1", "2"], _session())
+
+    assert result.ready == ["1", "2"]
+    assert result.failed == []
+    authenticator.ensure_partner_session_for_store.assert_not_called()
+
+
+def test_rejected_store_warmed_over_http_first():
+    planner, _, authenticator = _planner({"1": True, "2": [False, True]})
+    session = _session()
+
+    result = planner.ensure_ready(["1", "2"], session)
+
+    assert result.warmed_via == {"1": "probe", "2": "http"}
+    session.get.assert_called_once()
+    assert "/bizes/2/booking-list-view" in session.get.call_args[0][0]
+    authenticator.ensure_partner_session_for_store.assert_not_called()
+
+
+def test_browser_fallback_uses_single_navigation():
+    planner, _, authenticator = _planner(
+        {"1": [False, False, True], "2": [False, False, True]}
+    )
+    browser_session = _session()
+    authenticator.get_session.return_value = browser_session
+
+    result = planner.ensure_ready(["1", "2"], _session())
+
+    authenticator.ensure_partner_session_for_store.assert_called_once_with("1")
+    assert result.session is browser_session
+    assert result.failed == []
+
+
+def test_browser_fallback_navigates_each_store_still_rejected():
+    planner, _, authenticator = _planner(
+        {"1": [False, False, True], "2": [False, False, False, True]}
+    )
+    authenticator.get_session.return_value = _session()
+
+    result = planner.ensure_ready(["1", "2"], _session())
+
+    assert [c.args[0] for c in authenticator.ensure_partner_session_for_store.call_args_list] == [
+        "1",
+        "2",
+    ]
+    assert result.failed == []
+
+
+def test_browser_fallback_stops_when_navigation_does_not_help():
+    planner, _, authenticator = _planner({"1": False, "2": False})
+    authenticator.get_session.return_value = _session()
+
+    result = planner.ensure_ready(["1", "2"], _session())
+
+    authenticator.ensure_partner_session_for_store.assert_called_once_with("1")
+    assert result.failed == ["1", "2"]
+
+
+def test_cached_results_skip_probes_on_next_run():
+    planner, calls, _ = _planner({"1": True, "2": True})
+    session = _session()
+    planner.ensure_ready(["1", "2"], session)
+    calls.clear()
+
+    result = planner.ensure_ready(["1", "2"], session)
+
+    assert calls == []
+    assert result.warmed_via == {"1": "cache", "2": "cache"}
+
+
+def test_cached_result_needs_the_warmed_service_cookies():
+    planner, calls, _ = _planner({"1": True})
+    warmed = _session()
+    warmed.cookies.set("BUC", "service", domain="partner.booking.naver.com", path="/")
+    planner.ensure_ready(["1"], warmed)
+    calls.clear()
+
+    # Same auth cookies, but rebuilt from storage without the partner cookies
+    result = planner.ensure_ready(["1"], _session())
+
+    assert calls == ["1"]
+    assert result.warmed_via == {"1": "probe"}
+
+
+def test_force_ignores_cache_and_login_probe():
+    authenticator = Mock(probe_results={"1": True})
+    planner, calls, _ = _planner({"1": True}, authenticator)
+
+    assert planner.ensure_ready(["1"], _session()).warmed_via == {"1": "login_probe"}
+    planner.ensure_ready(["1"], _session(), force=True)
+
+    assert calls == ["1"]
+
+
+def test_inconclusive_probe_is_not_cached():
+    planner, calls, _ = _planner({"1": None})
+    session = _session()
+    planner.ensure_ready(["1"], session)
+    planner.ensure_ready(["1"], session)
+
+    assert calls == ["1", "1"]
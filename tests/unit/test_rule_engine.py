@@ -16,6 +16,7 @@ import pytest
 from unittest.mock import Mock
 
 from src.rules.engine import (
+    BatchMatchError,
     RuleEngine,
     ActionResult,
 )
@@ -657,6 +658,42 @@ rules:
         assert results[1].success is True
         assert context["executed"] is True
 
+    def test_execute_rule_halt_on_failure_skips_remaining_actions(self, tmp_path):
+        """A failing action with halt_on_failure stops the rule"""
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(
+            """
+rules:
+  - name: "Test Rule"
+    enabled: true
+    conditions: []
+    actions:
+      - type: "error_action"
+        halt_on_failure: true
+      - type: "next_action"
+"""
+        )
+
+        engine = RuleEngine(str(rules_file))
+        assert engine.rules[0].actions[0].halt_on_failure is True
+        assert engine.rules[0].actions[1].halt_on_failure is False
+
+        def error_action(ctx, **p):
+            raise RuntimeError("Already claimed")
+
+        def next_action(ctx, **p):
+            ctx["executed"] = True
+
+        engine.register_action("error_action", error_action)
+        engine.register_action("next_action", next_action)
+
+        context = {}
+        results = engine.execute_rule(engine.rules[0], context)
+
+        assert len(results) == 1
+        assert results[0].success is False
+        assert "executed" not in context
+
 
 class TestResultTracking:
     """AC8: Structured result tracking"""
@@ -862,3 +899,877 @@ rules:
         # Rule 2 should still execute
         assert len(results) == 1
         assert results[0].rule_name == "Rule 2"
+
+
+class TestCompiledPlans:
+    """compile() binds evaluators/executors once for process_booking"""
+
+    RULES = """
+rules:
+  - name: "Evening"
+    enabled: true
+    conditions:
+      - type: "hour_is"
+        params:
+          hour: 20
+    actions:
+      - type: "notify"
+        params:
+          channel: "sms"
+  - name: "Disabled"
+    enabled: false
+    conditions:
+      - type: "not_registered"
+    actions:
+      - type: "notify"
+"""
+
+    def _engine(self, tmp_path, rules=RULES):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(rules)
+        engine = RuleEngine(str(rules_file))
+        engine.register_condition("hour_is", lambda ctx, hour: ctx["hour"] == hour)
+        return engine
+
+    def test_compile_binds_params_and_skips_disabled_rules(self, tmp_path):
+        engine = self._engine(tmp_path)
+        executor = Mock()
+        engine.register_action("notify", executor)
+
+        plans = engine.compile()
+
+        assert [plan.rule.name for plan in plans] == ["Evening"]
+        assert plans[0].conditions[0].check({"hour": 20}) is True
+
+        results = engine.process_booking({"hour": 20})
+        assert [r.success for r in results] == [True]
+        assert results[0].params == {"channel": "sms"}
+        executor.assert_called_once_with({"hour": 20}, channel="sms")
+        assert engine.process_booking({"hour": 9}) == []
+
+    def test_compile_rejects_unknown_types(self, tmp_path):
+        engine = self._engine(
+            tmp_path,
+            """
+rules:
+  - name: "Broken"
+    enabled: true
+    conditions:
+      - type: "hour_is"
+        params:
+          hour: 20
+      - type: "missing_condition"
+    actions:
+      - type: "missing_action"
+""",
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            engine.compile()
+
+        message = str(exc_info.value)
+        assert "missing_condition" in message
+        assert "missing_action" in message
+        assert engine.plans is None
+
+    def test_registering_after_compile_discards_plans(self, tmp_path):
+        engine = self._engine(tmp_path)
+        engine.register_action("notify", lambda ctx, **p: None)
+        engine.compile()
+
+        replacement = Mock()
+        engine.register_action("notify", replacement)
+
+        assert engine.plans is None
+        engine.process_booking({"hour": 20})
+        replacement.assert_called_once_with({"hour": 20}, channel="sms")
+
+    def test_compiled_plan_matches_uncompiled_results(self, tmp_path):
+        engine = self._engine(tmp_path)
+        engine.register_action("notify", lambda ctx, **p: None)
+        contexts = [{"hour": hour} for hour in range(24)]
+
+        uncompiled = [engine.process_booking(ctx) for ctx in contexts]
+        engine.compile()
+        compiled = [engine.process_booking(ctx) for ctx in contexts]
+
+        assert compiled == uncompiled
+
+
+class TestConditionOrdering:
+    """Compiled AND-chains run cheap, selective conditions first"""
+
+    RULES = """
+rules:
+  - name: "Reminder"
+    enabled: true
+    conditions:
+      - type: "slow_scan"
+      - type: "is_new"
+    actions:
+      - type: "notify"
+"""
+
+    def _engine(self, tmp_path, condition_order="cost"):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(self.RULES)
+        engine = RuleEngine(str(rules_file), condition_order=condition_order)
+        self.calls = []
+
+        def slow_scan(ctx):
+            self.calls.append("slow_scan")
+            return True
+
+        def is_new(ctx):
+            self.calls.append("is_new")
+            return ctx["new"]
+
+        engine.register_condition("slow_scan", slow_scan, cost="expensive")
+        engine.register_condition("is_new", is_new, cost="cheap")
+        engine.register_action("notify", lambda ctx: None)
+        return engine
+
+    def test_cheap_condition_runs_first(self, tmp_path):
+        engine = self._engine(tmp_path)
+        plans = engine.compile()
+
+        assert [c.type for c in plans[0].conditions] == ["is_new", "slow_scan"]
+        assert engine.process_booking({"new": False}) == []
+        assert self.calls == ["is_new"]
+
+    def test_declared_order_is_kept_for_debugging(self, tmp_path):
+        engine = self._engine(tmp_path, condition_order="declared")
+        plans = engine.compile()
+
+        assert [c.type for c in plans[0].conditions] == ["slow_scan", "is_new"]
+        engine.process_booking({"new": False})
+        assert self.calls == ["slow_scan", "is_new"]
+
+    def test_observed_selectivity_reorders_equal_cost(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(
+            """
+rules:
+  - name: "Rule"
+    enabled: true
+    conditions:
+      - type: "usually_true"
+      - type: "rarely_true"
+    actions:
+      - type: "notify"
+"""
+        )
+        engine = RuleEngine(str(rules_file))
+        engine.register_condition("usually_true", lambda ctx: ctx["i"] % 10 != 0)
+        engine.register_condition("rarely_true", lambda ctx: ctx["i"] % 10 == 0)
+        engine.register_action("notify", lambda ctx: None)
+        engine.compile()
+
+        # Declared order until enough samples exist, then the selective one leads
+        for i in range(50):
+            engine.process_booking({"i": i})
+        # usually_true saw every booking; rarely_true only the 90% that passed
+        engine.reorder_plans()
+
+        assert [c.type for c in engine.plans[0].conditions] == ["rarely_true", "usually_true"]
+
+    def test_reordering_does_not_change_matches(self, tmp_path):
+        contexts = [{"new": i % 3 == 0} for i in range(30)]
+        declared = self._engine(tmp_path, condition_order="declared")
+        declared.compile()
+        expected = [declared.process_booking(ctx) for ctx in contexts]
+
+        engine = self._engine(tmp_path)
+        engine.compile()
+        assert [engine.process_booking(ctx) for ctx in contexts] == expected
+
+    def test_invalid_cost_and_order_rejected(self, tmp_path):
+        engine = self._engine(tmp_path)
+        with pytest.raises(ValueError):
+            engine.register_condition("x", lambda ctx: True, cost="free")
+        with pytest.raises(ValueError):
+            self._engine(tmp_path, condition_order="random")
+
+
+class TestConditionMemoization:
+    """Shared conditions are evaluated once per booking across compiled rules"""
+
+    RULES = """
+rules:
+  - name: "First"
+    enabled: true
+    conditions:
+      - type: "within_hours"
+        params:
+          hours: 2
+      - type: "volatile"
+    actions:
+      - type: "notify"
+  - name: "Second"
+    enabled: true
+    conditions:
+      - type: "within_hours"
+        params:
+          hours: 2
+      - type: "volatile"
+    actions:
+      - type: "notify"
+  - name: "Third"
+    enabled: true
+    conditions:
+      - type: "within_hours"
+        params:
+          hours: 3
+    actions:
+      - type: "notify"
+"""
+
+    def _engine(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(self.RULES)
+        engine = RuleEngine(str(rules_file), condition_order="declared")
+        self.within_hours = Mock(side_effect=lambda ctx, hours: True)
+        self.volatile = Mock(side_effect=lambda ctx: True)
+        engine.register_condition("within_hours", self.within_hours)
+        engine.register_condition("volatile", self.volatile, memoize=False)
+        engine.register_action("notify", lambda ctx: None)
+        return engine
+
+    def test_same_condition_and_params_evaluated_once_per_booking(self, tmp_path):
+        engine = self._engine(tmp_path)
+        engine.compile()
+
+        results = engine.process_booking({"booking": None})
+
+        assert len(results) == 3
+        assert [c.kwargs for c in self.within_hours.call_args_list] == [
+            {"hours": 2},
+            {"hours": 3},
+        ]
+
+    def test_memo_does_not_outlive_the_booking(self, tmp_path):
+        engine = self._engine(tmp_path)
+        engine.compile()
+
+        engine.process_booking({"booking": None})
+        engine.process_booking({"booking": None})
+
+        assert self.within_hours.call_count == 4
+
+    def test_opted_out_condition_is_always_evaluated(self, tmp_path):
+        engine = self._engine(tmp_path)
+        engine.compile()
+
+        engine.process_booking({"booking": None})
+
+        assert self.volatile.call_count == 2
+
+
+class TestIndexedMatcher:
+    """Indexed matching returns exactly what the linear matcher returns"""
+
+    @staticmethod
+    def _rules_yaml(seed=7, count=60):
+        import random
+
+        rng = random.Random(seed)
+        lines = ["rules:"]
+        for index in range(count):
+            conditions = []
+            if rng.random() < 0.5:
+                conditions.append(
+                    f'      - type: "booking_status"\n        params:\n'
+                    f'          status: "{rng.choice(["RC03", "RC08"])}"'
+                )
+            if rng.random() < 0.4:
+                conditions.append(
+                    '      - type: "booking_status_any"\n        params:\n'
+                    '          statuses: ["RC03", "RC08"]'
+                )
+            if rng.random() < 0.5:
+                stores = rng.sample([1051707, 951291, 1120125], rng.randint(1, 2))
+                conditions.append(
+                    f'      - type: "store_id_matches"\n        params:\n'
+                    f"          store_ids: {stores}"
+                )
+            if rng.random() < 0.3:
+                conditions.append(
+                    f'      - type: "current_hour"\n        params:\n'
+                    f"          hour: {rng.choice([9, 20])}"
+                )
+            if rng.random() < 0.5:
+                day = rng.randint(1, 28)
+                conditions.append(
+                    f'      - type: "date_range"\n        params:\n'
+                    f'          start_date: "2025-11-{day:02d}"\n'
+                    f'          end_date: "2025-11-{min(day + rng.randint(0, 5), 30):02d}"'
+                )
+            conditions.append('      - type: "booking_not_in_db"')
+            lines.append(
+                f'  - name: "Rule {index}"\n    enabled: true\n    conditions:\n'
+                + "\n".join(conditions)
+                + '\n    actions:\n      - type: "notify"'
+            )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _contexts(count=300, seed=11):
+        import random
+        from datetime import datetime
+
+        rng = random.Random(seed)
+        contexts = []
+        for index in range(count):
+            booking = Mock(
+                booking_num=str(index),
+                phone_masked="010-****-0000",
+                status=rng.choice(["RC03", "RC08", "RC04", None]),
+                biz_id=rng.choice(["1051707", "951291", "1120125", None]),
+                reserve_at=rng.choice(
+                    [datetime(2025, 11, rng.randint(1, 30), 14, 0), None, "not-a-datetime"]
+                ),
+            )
+            contexts.append(
+                {
+                    "booking": booking if rng.random() < 0.95 else None,
+                    "db_record": None if rng.random() < 0.7 else {"confirm_sms": True},
+                    "current_time": datetime(2025, 11, 15, rng.choice([9, 20, 21]), 0),
+                }
+            )
+        return contexts
+
+    def _engine(self, tmp_path, matcher):
+        from src.rules.conditions import register_conditions
+
+        rules_file = tmp_path / f"rules_{matcher}.yaml"
+        rules_file.write_text(self._rules_yaml())
+        engine = RuleEngine(str(rules_file), matcher=matcher)
+        register_conditions(engine)
+        engine.register_action("notify", lambda ctx: None)
+        engine.compile()
+        return engine
+
+    def test_indexed_results_match_linear(self, tmp_path):
+        linear = self._engine(tmp_path, "linear")
+        indexed = self._engine(tmp_path, "indexed")
+
+        assert indexed.index is not None and indexed.index.indexed_plans > 0
+        for context in self._contexts():
+            expected = [r.rule_name for r in linear.process_booking(context)]
+            assert [r.rule_name for r in indexed.process_booking(context)] == expected
+
+    def test_non_matching_rules_are_not_evaluated(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(
+            """
+rules:
+  - name: "Store A"
+    enabled: true
+    conditions:
+      - type: "store"
+        params:
+          store_ids: ["A"]
+      - type: "probe"
+    actions:
+      - type: "notify"
+  - name: "Store B"
+    enabled: true
+    conditions:
+      - type: "store"
+        params:
+          store_ids: ["B"]
+      - type: "probe"
+    actions:
+      - type: "notify"
+"""
+        )
+        from src.rules.index import EqualityIndex
+
+        engine = RuleEngine(str(rules_file), condition_order="declared")
+        engine.register_condition(
+            "store",
+            lambda ctx, store_ids: ctx["store"] in store_ids,
+            index=EqualityIndex("store", lambda ctx: ctx["store"], lambda p: p["store_ids"]),
+        )
+        probe = Mock(return_value=True)
+        engine.register_condition("probe", probe)
+        engine.register_action("notify", lambda ctx: None)
+        engine.compile()
+
+        assert engine.index.candidates({"store": "B"}) == [1]
+        results = engine.process_booking({"store": "B"})
+
+        assert [r.rule_name for r in results] == ["Store B"]
+        assert probe.call_count == 1
+
+    def test_unreadable_attribute_prunes_nothing(self, tmp_path):
+        from dataclasses import replace as replace_spec
+        from src.rules.index import RuleIndex
+
+        engine = self._engine(tmp_path, "indexed")
+        broken = {
+            name: replace_spec(spec, extract=Mock(side_effect=RuntimeError("boom")))
+            for name, spec in engine.condition_indexes.items()
+        }
+        index = RuleIndex(engine.plans, broken)
+
+        assert index.indexed_plans > 0
+        assert index.candidates({"booking": None}) == list(range(len(engine.plans)))
+
+    def test_invalid_matcher_rejected(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text("rules: []\n")
+        with pytest.raises(ValueError):
+            RuleEngine(str(rules_file), matcher="rete")
+
+
+class TestBatchEvaluation:
+    """process_batch() dispatches exactly what process_booking() does"""
+
+    ACTION_TYPES = (
+        "send_sms",
+        "create_db_record",
+        "update_flag",
+        "send_telegram",
+        "send_slack",
+        "log_event",
+        "notify",
+    )
+
+    def _engine(self, rules_path):
+        from src.rules.conditions import register_conditions
+
+        engine = RuleEngine(str(rules_path))
+        register_conditions(engine)
+        self.dispatched = []
+        for action_type in self.ACTION_TYPES:
+            engine.register_action(
+                action_type,
+                lambda ctx, _type=action_type, **params: self.dispatched.append(
+                    (ctx["booking"] and ctx["booking"].booking_num, _type)
+                ),
+            )
+        engine.compile()
+        return engine
+
+    @staticmethod
+    def _contexts():
+        from datetime import timedelta
+
+        contexts = TestIndexedMatcher._contexts(count=300)
+        for index, context in enumerate(contexts):
+            booking = context["booking"]
+            if booking is not None and index % 3 == 0 and booking.reserve_at is not None:
+                booking.reserve_at = context["current_time"] + timedelta(minutes=30 + index % 90)
+            if context["db_record"] is not None:
+                context["db_record"] = {"confirm_sms": index % 2 == 0, "remind_sms": index % 5 == 0}
+        return contexts
+
+    def test_batch_matches_per_booking_on_production_rules(self):
+        from pathlib import Path
+
+        rules_path = Path(__file__).resolve().parents[2] / "config" / "rules.yaml"
+        contexts = self._contexts()
+
+        engine = self._engine(rules_path)
+        expected = [
+            [(r.rule_name, r.action_type) for r in engine.process_booking(ctx)] for ctx in contexts
+        ]
+        expected_dispatch = self.dispatched
+
+        engine = self._engine(rules_path)
+        actual = [
+            [(r.rule_name, r.action_type) for r in results]
+            for results in engine.process_batch(contexts)
+        ]
+
+        assert actual == expected
+        assert self.dispatched == expected_dispatch
+        assert any(actual)
+
+    def test_batch_matches_per_booking_on_indexed_rules(self, tmp_path):
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text(TestIndexedMatcher._rules_yaml(seed=3))
+        contexts = self._contexts()
+
+        engine = self._engine(rules_path)
+        expected = [[r.rule_name for r in engine.process_booking(ctx)] for ctx in contexts]
+        actual = [
+            [r.rule_name for r in results]
+            for results in self._engine(rules_path).process_batch(contexts)
+        ]
+
+        assert actual == expected
+
+    def test_failing_batch_evaluator_falls_back_per_booking(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(
+            """
+rules:
+  - name: "Even"
+    enabled: true
+    conditions:
+      - type: "even"
+    actions:
+      - type: "notify"
+"""
+        )
+        engine = RuleEngine(str(rules_file))
+        engine.register_condition(
+            "even",
+            lambda ctx: ctx["n"] % 2 == 0,
+            batch=Mock(side_effect=TypeError("incomparable")),
+        )
+        engine.register_action("notify", lambda ctx: None)
+        engine.compile()
+
+        results = engine.process_batch([{"n": n} for n in range(4)])
+
+        assert [len(r) for r in results] == [1, 0, 1, 0]
+
+    def test_volatile_conditions_checked_at_dispatch(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(
+            """
+rules:
+  - name: "First"
+    enabled: true
+    conditions:
+      - type: "always"
+    actions:
+      - type: "fail_sms"
+  - name: "Alert"
+    enabled: true
+    conditions:
+      - type: "sms_failed"
+    actions:
+      - type: "notify"
+"""
+        )
+        engine = RuleEngine(str(rules_file))
+        engine.register_condition(
+            "always", lambda ctx: True, batch=lambda columns: [True] * columns.size
+        )
+        engine.register_condition("sms_failed", lambda ctx: "sms_failure" in ctx, memoize=False)
+        engine.register_action("fail_sms", lambda ctx: ctx.update(sms_failure={"error": "x"}))
+        engine.register_action("notify", lambda ctx: None)
+        engine.compile()
+
+        results = engine.process_batch([{}, {}])
+
+        assert [[r.rule_name for r in booking] for booking in results] == [
+            ["First", "Alert"],
+            ["First", "Alert"],
+        ]
+
+    def test_batch_counts_conditions_not_met(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(
+            """
+rules:
+  - name: "Small even"
+    enabled: true
+    conditions:
+      - type: "even"
+      - type: "small"
+    actions:
+      - type: "notify"
+"""
+        )
+        engine = RuleEngine(str(rules_file), condition_order="declared")
+        engine.register_condition(
+            "even",
+            lambda ctx: ctx["n"] % 2 == 0,
+            batch=lambda columns: [ctx["n"] % 2 == 0 for ctx in columns.contexts],
+        )
+        engine.register_condition("small", lambda ctx: ctx["n"] < 3)
+        engine.register_action("notify", lambda ctx: None)
+        engine.compile()
+
+        engine.process_batch([{"n": n} for n in range(6)])
+
+        assert engine.flush_log_summary()["conditions_not_met"] == {
+            "Small even": {"even": 3, "small": 1}
+        }
+
+    def test_mask_failure_raises_before_any_action(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(TestIndexedMatcher._rules_yaml(count=5))
+        engine = self._engine(rules_file)
+        engine.match_matrix = Mock(side_effect=KeyError("column"))
+
+        with pytest.raises(BatchMatchError):
+            engine.process_batch(self._contexts())
+
+        assert self.dispatched == []
+        assert engine.run_summary.bookings == 0
+
+    def test_uncompiled_engine_processes_per_booking(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(TestIndexedMatcher._rules_yaml(count=5))
+        engine = RuleEngine(str(rules_file))
+        engine.process_booking = Mock(return_value=[])
+
+        assert engine.process_batch([{}, {}]) == [[], []]
+        assert engine.process_booking.call_count == 2
+
+
+class TestLogMode:
+    """log_mode="summary" replaces per-booking INFO lines with one run summary"""
+
+    RULES = """
+rules:
+  - name: "Even"
+    enabled: true
+    conditions:
+      - type: "even"
+      - type: "small"
+    actions:
+      - type: "notify"
+  - name: "Odd"
+    enabled: true
+    conditions:
+      - type: "odd"
+    actions:
+      - type: "notify"
+"""
+
+    def _engine(self, tmp_path, log_mode):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(self.RULES)
+        engine = RuleEngine(str(rules_file), log_mode=log_mode)
+        engine.register_condition("even", lambda ctx: ctx["n"] % 2 == 0)
+        engine.register_condition("small", lambda ctx: ctx["n"] < 4)
+        engine.register_condition("odd", lambda ctx: ctx["n"] % 2 == 1)
+        engine.register_action("notify", lambda ctx: None)
+        engine.compile()
+        return engine
+
+    @staticmethod
+    def _operations(mock_logger):
+        return [c.kwargs.get("operation") for c in mock_logger.info.call_args_list]
+
+    def test_invalid_log_mode_rejected(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(self.RULES)
+
+        with pytest.raises(ValueError, match="log_mode"):
+            RuleEngine(str(rules_file), log_mode="quiet")
+
+    def test_summary_mode_counts_instead_of_logging(self, tmp_path, monkeypatch):
+        from src.rules import engine as engine_module
+
+        engine = self._engine(tmp_path, "summary")
+        mock_logger = Mock()
+        monkeypatch.setattr(engine_module, "logger", mock_logger)
+
+        for n in range(6):
+            engine.process_booking({"n": n})
+
+        # Only per-action outcomes are logged per booking
+        assert set(self._operations(mock_logger)) == {"execute_action"}
+        mock_logger.debug.assert_not_called()
+
+        summary = engine.flush_log_summary()
+
+        assert summary == {
+            "bookings": 6,
+            "rules_matched": {"Even": 2, "Odd": 3},
+            "conditions_not_met": {"Even": {"even": 3, "small": 1}, "Odd": {"odd": 3}},
+            "actions_succeeded": 5,
+            "actions_failed": 0,
+        }
+        assert self._operations(mock_logger).count("rule_engine_summary") == 1
+        assert engine.flush_log_summary()["bookings"] == 0
+        assert self._operations(mock_logger).count("rule_engine_summary") == 1
+
+    def test_verbose_mode_logs_each_event_and_counts(self, tmp_path, monkeypatch):
+        from src.rules import engine as engine_module
+
+        engine = self._engine(tmp_path, "verbose")
+        mock_logger = Mock()
+        monkeypatch.setattr(engine_module, "logger", mock_logger)
+
+        engine.process_booking({"n": 5})
+
+        operations = self._operations(mock_logger)
+        assert operations.count("evaluate_rule") == 2  # "Even" not met, "Odd" matched
+        assert "process_booking_start" in operations
+        assert "process_booking_complete" in operations
+        assert engine.flush_log_summary()["rules_matched"] == {"Odd": 1}
+
+
+class TestActionDependencies:
+    """depends_on / implicit dependencies and action_scheduling="dag" """
+
+    REMINDER = """
+rules:
+  - name: "Two-Hour Reminder"
+    enabled: true
+    conditions:
+      - type: "always"
+    actions:
+      - type: "send_sms"
+      - type: "update_flag"
+      - type: "send_telegram"
+"""
+
+    def _engine(self, tmp_path, rules_yaml, scheduling="dag", executors=None):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(rules_yaml)
+        engine = RuleEngine(str(rules_file), action_scheduling=scheduling)
+        engine.register_condition("always", lambda ctx: True)
+        executors = executors or {}
+        for action_type in ("create_db_record", "send_sms", "update_flag", "send_telegram"):
+            engine.register_action(action_type, executors.get(action_type, lambda ctx: None))
+        engine.compile()
+        return engine
+
+    def test_implicit_dependencies(self, tmp_path):
+        from src.rules.engine import action_dependencies
+
+        engine = self._engine(
+            tmp_path,
+            """
+rules:
+  - name: "New Booking"
+    enabled: true
+    conditions:
+      - type: "always"
+    actions:
+      - type: "create_db_record"
+        halt_on_failure: true
+      - type: "send_sms"
+      - type: "update_flag"
+      - type: "send_telegram"
+""",
+        )
+
+        # Every action waits for the halting create; the flag write also waits for the SMS
+        assert action_dependencies(engine.rules[0].actions) == [(), (0,), (0, 1), (0,)]
+        assert [a.depends_on for a in engine.plans[0].actions] == [(), (0,), (0, 1), (0,)]
+
+    def test_explicit_depends_on_by_id_and_type(self, tmp_path):
+        engine = self._engine(
+            tmp_path,
+            """
+rules:
+  - name: "Explicit"
+    enabled: true
+    conditions:
+      - type: "always"
+    actions:
+      - type: "send_sms"
+        id: "guide_sms"
+      - type: "update_flag"
+        depends_on: []
+      - type: "send_telegram"
+        depends_on: ["guide_sms", "update_flag"]
+""",
+        )
+
+        assert [a.depends_on for a in engine.plans[0].actions] == [(), (), (0, 1)]
+
+    @pytest.mark.parametrize(
+        "action_yaml, message",
+        [
+            ('      - type: "send_sms"\n        depends_on: ["update_flag"]\n', "earlier action"),
+            ('      - type: "send_sms"\n        depends_on: "send_sms"\n', "list of strings"),
+            (
+                '      - type: "send_sms"\n        id: "x"\n'
+                '      - type: "log_event"\n        id: "x"\n',
+                "unique",
+            ),
+        ],
+    )
+    def test_invalid_dependencies_rejected(self, tmp_path, action_yaml, message):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(
+            'rules:\n  - name: "Bad"\n    conditions:\n      - type: "always"\n'
+            "    actions:\n" + action_yaml
+        )
+
+        with pytest.raises(ValueError, match=message):
+            RuleEngine(str(rules_file))
+
+    def test_invalid_action_scheduling_rejected(self, tmp_path):
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(self.REMINDER)
+
+        with pytest.raises(ValueError, match="action_scheduling"):
+            RuleEngine(str(rules_file), action_scheduling="parallel")
+
+    def test_independent_actions_run_concurrently(self, tmp_path):
+        import threading
+
+        telegram_started = threading.Event()
+        order = []
+
+        def send_sms(ctx):
+            # Telegram does not depend on the SMS, so it starts while the SMS is in flight
+            assert telegram_started.wait(timeout=5)
+            order.append("send_sms")
+
+        def send_telegram(ctx):
+            telegram_started.set()
+            order.append("send_telegram")
+
+        engine = self._engine(
+            tmp_path,
+            self.REMINDER,
+            executors={
+                "send_sms": send_sms,
+                "update_flag": lambda ctx: order.append("update_flag"),
+                "send_telegram": send_telegram,
+            },
+        )
+
+        results = engine.process_booking({})
+
+        assert order == ["send_telegram", "send_sms", "update_flag"]
+        # Results keep declared order
+        assert [(r.action_type, r.success) for r in results] == [
+            ("send_sms", True),
+            ("update_flag", True),
+            ("send_telegram", True),
+        ]
+
+    def test_failed_dependency_skips_dependents(self, tmp_path):
+        update_flag = Mock()
+        send_telegram = Mock()
+        engine = self._engine(
+            tmp_path,
+            self.REMINDER,
+            executors={
+                "send_sms": Mock(side_effect=RuntimeError("SENS down")),
+                "update_flag": update_flag,
+                "send_telegram": send_telegram,
+            },
+        )
+
+        results = engine.process_booking({})
+
+        update_flag.assert_not_called()
+        send_telegram.assert_called_once()
+        assert [(r.action_type, r.success) for r in results] == [
+            ("send_sms", False),
+            ("send_telegram", True),
+        ]
+
+    def test_sequential_scheduling_keeps_legacy_semantics(self, tmp_path):
+        update_flag = Mock()
+        engine = self._engine(
+            tmp_path,
+            self.REMINDER,
+            scheduling="sequential",
+            executors={
+                "send_sms": Mock(side_effect=RuntimeError("SENS down")),
+                "update_flag": update_flag,
+                "send_telegram": Mock(),
+            },
+        )
+
+        results = engine.process_booking({})
+
+        update_flag.assert_called_once()
+        assert [r.success for r in results] == [False, True, True]
@@ -0,0 +1,139 @@
+"""
+Unit tests for RunLeaseRepository and shard assignment.
+
+Uses moto to mock DynamoDB for isolated testing without AWS credentials.
+"""
+
+from unittest.mock import Mock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.database.run_lease import (
+    LeaseHeartbeat,
+    RunLeaseRepository,
+    shard_lease_id,
+    shard_store_ids,
+)
+
+
+@pytest.fixture
+def lease_repo():
+    """Create RunLeaseRepository with a mocked run_lease table."""
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="ap-northeast-2")
+        dynamodb.create_table(
+            TableName="run_lease",
+            KeySchema=[{"AttributeName": "lease_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "lease_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield RunLeaseRepository(dynamodb_resource=dynamodb, lease_seconds=60)
+
+
+class TestShardStoreIds:
+    """Tests for shard_store_ids()."""
+
+    def test_shards_partition_all_stores(self):
+        """Every store belongs to exactly one shard."""
+        stores = ["1051707", "951291", "1120125", "1285716", "1462519"]
+
+        shards = [shard_store_ids(stores, index, 2) for index in range(2)]
+
+        assert sorted(shards[0] + shards[1]) == sorted(stores)
+        assert not set(shards[0]) & set(shards[1])
+
+    def test_assignment_ignores_input_order(self):
+        """Assignment is stable regardless of stores.yaml ordering."""
+        stores = ["3", "1", "2"]
+
+        assert shard_store_ids(stores, 0, 2) == shard_store_ids(list(reversed(stores)), 0, 2)
+
+    def test_invalid_shard_index(self):
+        """Out-of-range shard index is rejected."""
+        with pytest.raises(ValueError):
+            shard_store_ids(["1"], 2, 2)
+
+
+class TestRunLeaseRepository:
+    """Tests for lease acquire/renew/release."""
+
+    def test_acquire_free_lease(self, lease_repo):
+        """A free lease can be acquired once."""
+        assert lease_repo.acquire("shard-0-of-1", "run-a") is True
+        assert lease_repo.acquire("shard-0-of-1", "run-b") is False
+
+    def test_acquire_expired_lease(self, lease_repo):
+        """An expired lease can be taken over by another run."""
+        lease_repo.table.put_item(
+            Item={"lease_id": "shard-0-of-1", "owner": "run-a", "expires_at": 1}
+        )
+
+        assert lease_repo.acquire("shard-0-of-1", "run-b") is True
+        item = lease_repo.table.get_item(Key={"lease_id": "shard-0-of-1"})["Item"]
+        assert item["owner"] == "run-b"
+
+    def test_renew_and_release_require_owner(self, lease_repo):
+        """Only the owner may renew or release its lease."""
+        lease_repo.acquire("shard-0-of-1", "run-a")
+
+        assert lease_repo.renew("shard-0-of-1", "run-b") is False
+        assert lease_repo.release("shard-0-of-1", "run-b") is False
+        assert lease_repo.renew("shard-0-of-1", "run-a") is True
+        assert lease_repo.release("shard-0-of-1", "run-a") is True
+        assert lease_repo.acquire("shard-0-of-1", "run-b") is True
+
+    def test_claim_shard_skips_held_shards(self, lease_repo):
+        """claim_shard returns a free shard, or None when all are held."""
+        first = lease_repo.claim_shard(2, "run-a")
+        second = lease_repo.claim_shard(2, "run-b")
+
+        assert {first, second} == {0, 1}
+        assert lease_repo.claim_shard(2, "run-c") is None
+
+    def test_heartbeat_stop_releases_lease(self, lease_repo):
+        """Stopping the heartbeat releases the lease for the next run."""
+        lease_id = shard_lease_id(0, 1)
+        lease_repo.acquire(lease_id, "run-a")
+
+        heartbeat = LeaseHeartbeat(lease_repo, lease_id, "run-a", interval_seconds=0.01)
+        heartbeat.start()
+        heartbeat.stop(release=True)
+
+        assert lease_repo.acquire(lease_id, "run-b") is True
+
+
+class TestClaimRunShard:
+    """Tests for lambda_handler shard resolution."""
+
+    def test_lock_disabled_processes_all_stores(self):
+        """Without the lock every store is processed."""
+        from src.main import _claim_run_shard
+
+        with patch("src.main.RUN_LOCK_ENABLED", False):
+            stores, heartbeat = _claim_run_shard({}, None, ["2", "1"])
+
+        assert stores == ["2", "1"]
+        assert heartbeat is None
+
+    def test_lock_disabled_pinned_shard(self):
+        """The event can pin a shard without the lease table."""
+        from src.main import _claim_run_shard
+
+        with patch("src.main.RUN_LOCK_ENABLED", False):
+            stores, _ = _claim_run_shard({"shard_index": 1, "shard_count": 2}, None, ["1", "2"])
+
+        assert stores == ["2"]
+
+    def test_lock_enabled_skips_when_no_shard_free(self):
+        """Returns None so the handler can skip the run."""
+        from src.main import _claim_run_shard
+
+        mock_repo = Mock()
+        mock_repo.claim_shard.return_value = None
+
+        with patch("src.main.RUN_LOCK_ENABLED", True), patch(
+            "src.main.RunLeaseRepository", return_value=mock_repo
+        ):
+            assert _claim_run_shard({}, None, ["1"]) is None